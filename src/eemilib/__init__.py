@@ -2,18 +2,35 @@
 EEmiLib (Electron EMIssion Library) holds several electron emission models and
 offers a simple way to fit the on electron emission data.
 
+Sub-packages and example data paths are resolved on first access, and logging
+is not configured on import: call :func:`.log_manager.set_up_logging` to get
+console and file logs.
+
 """
 
 import importlib.metadata
 from importlib import resources
-
-from eemilib.util.log_manager import set_up_logging
+from typing import Any
 
 DOC_URL = "https://eemilib.readthedocs.io/en/latest"
-__version__ = importlib.metadata.version("eemilib")
 
-teey_cu = resources.files("eemilib.data.cu.emission_yield")
-emission_energy_ag = resources.files("eemilib.data.ag.emission_energy")
-teey_reference_ag = resources.files("eemilib.data.reference_ag.emission_yield")
+#: Paths to example data, resolved on first access.
+_DATA = {
+    "teey_cu": "eemilib.data.cu.emission_yield",
+    "emission_energy_ag": "eemilib.data.ag.emission_energy",
+    "teey_reference_ag": "eemilib.data.reference_ag.emission_yield",
+}
+
 
-set_up_logging("EEmiLib")
+def __getattr__(name: str) -> Any:
+    """Compute the version, example data paths, or get logging setup."""
+    if name == "__version__":
+        value = importlib.metadata.version("eemilib")
+    elif name in _DATA:
+        value = resources.files(_DATA[name])
+    elif name == "set_up_logging":
+        from eemilib.util.log_manager import set_up_logging as value
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
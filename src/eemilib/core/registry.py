@@ -0,0 +1,145 @@
+"""Define a registry of the available :class:`.Loader`, :class:`.Model` and
+:class:`.Plotter`.
+
+Plugins are listed by name and import target, under the form
+``"module.path:ClassName"``, without being imported. A class is imported only
+when :func:`load_plugin` is called, eg when it is selected in the GUI.
+
+Three sources are merged, later ones overriding earlier ones:
+
+1. The built-in :data:`BUILTIN_PLUGINS` manifest.
+2. The entry points of installed distributions. A third-party package can
+   declare, in its :file:`pyproject.toml`:
+
+   .. code-block:: toml
+
+       [project.entry-points."eemilib.models"]
+       MyModel = "my_package.my_module:MyModel"
+
+3. The plugins registered at runtime with :func:`register_plugin`.
+
+"""
+
+import importlib
+import logging
+from importlib.metadata import entry_points
+from typing import Literal
+
+PluginKind = Literal["Loader", "Model", "Plotter"]
+PLUGIN_KINDS = ("Loader", "Model", "Plotter")
+
+#: Entry point group for every kind of plugin.
+ENTRY_POINT_GROUPS: dict[PluginKind, str] = {
+    "Loader": "eemilib.loaders",
+    "Model": "eemilib.models",
+    "Plotter": "eemilib.plotters",
+}
+
+#: Base class that plugins must inherit from.
+BASE_CLASSES: dict[PluginKind, str] = {
+    "Loader": "eemilib.loader.loader:Loader",
+    "Model": "eemilib.model.model:Model",
+    "Plotter": "eemilib.plotter.plotter:Plotter",
+}
+
+#: Plugins shipped with EEmiLib.
+BUILTIN_PLUGINS: dict[PluginKind, dict[str, str]] = {
+    "Loader": {
+        "DeesseLoader": "eemilib.loader.deesse_loader:DeesseLoader",
+        "PandasLoader": "eemilib.loader.pandas_loader:PandasLoader",
+    },
+    "Model": {
+        "ChungEverhart": "eemilib.model.chung_and_everhart:ChungEverhart",
+        "Dionne": "eemilib.model.dionne:Dionne",
+        "Maxwellian": "eemilib.model.maxwellian:Maxwellian",
+        "Sombrin": "eemilib.model.sombrin:Sombrin",
+        "Vaughan": "eemilib.model.vaughan:Vaughan",
+    },
+    "Plotter": {"PandasPlotter": "eemilib.plotter.pandas:PandasPlotter"},
+}
+
+_registered: dict[PluginKind, dict[str, str]] = {
+    kind: {} for kind in PLUGIN_KINDS
+}
+
+
+def register_plugin(kind: PluginKind, name: str, target: str) -> None:
+    """Register a plugin at runtime.
+
+    Parameters
+    ----------
+    kind :
+        Kind of plugin.
+    name :
+        Name of the plugin, as displayed in the GUI.
+    target :
+        Import target, under the form ``"module.path:ClassName"``.
+
+    """
+    _check_kind(kind)
+    if ":" not in target:
+        raise ValueError(f"{target = } should be 'module.path:ClassName'.")
+    _registered[kind][name] = target
+
+
+def unregister_plugin(kind: PluginKind, name: str) -> None:
+    """Remove a plugin registered with :func:`register_plugin`."""
+    _check_kind(kind)
+    _registered[kind].pop(name, None)
+
+
+def available_plugins(kind: PluginKind) -> dict[str, str]:
+    """List the plugins of a given kind, without importing them.
+
+    Returns
+    -------
+    dict[str, str]
+        Keys are the plugin names, values their import target.
+
+    """
+    _check_kind(kind)
+    plugins = dict(BUILTIN_PLUGINS[kind])
+    for entry_point in entry_points(group=ENTRY_POINT_GROUPS[kind]):
+        plugins[entry_point.name] = entry_point.value
+    plugins.update(_registered[kind])
+    return plugins
+
+
+def load_plugin(kind: PluginKind, name: str) -> type:
+    """Import the plugin named ``name``.
+
+    Raises
+    ------
+    KeyError
+        If no plugin named ``name`` is available.
+    TypeError
+        If the imported object does not inherit from the base class of
+        ``kind``.
+
+    """
+    plugins = available_plugins(kind)
+    if name not in plugins:
+        raise KeyError(
+            f"No {kind} named {name}. Available: {list(plugins.keys())}"
+        )
+    cls = _import_target(plugins[name])
+    base_class = _import_target(BASE_CLASSES[kind])
+    if not (isinstance(cls, type) and issubclass(cls, base_class)):
+        raise TypeError(
+            f"{plugins[name]} does not define a subclass of {base_class}."
+        )
+    logging.debug(f"Loaded {kind} {name} from {plugins[name]}")
+    return cls
+
+
+def _import_target(target: str) -> object:
+    """Import the object designated by ``"module.path:Name"``."""
+    module_path, _, attribute = target.partition(":")
+    module = importlib.import_module(module_path)
+    return getattr(module, attribute)
+
+
+def _check_kind(kind: str) -> None:
+    """Raise an error if ``kind`` is not a valid kind of plugin."""
+    if kind not in PLUGIN_KINDS:
+        raise ValueError(f"{kind = } should be in {PLUGIN_KINDS = }")
@@ -1,5 +1,12 @@
 """Define objects to store electron emission data."""
 
-from .data_matrix import DataMatrix
+from typing import TYPE_CHECKING
 
-__all__ = ["DataMatrix"]
+from eemilib.util.lazy import attach
+
+if TYPE_CHECKING:
+    from .data_matrix import DataMatrix
+
+__getattr__, __dir__, __all__ = attach(
+    __name__, {"DataMatrix": ".data_matrix"}
+)
@@ -6,7 +6,7 @@
 """
 
 import logging
-from collections.abc import Collection
+from collections.abc import Callable, Collection, Iterator, Sequence
 from pathlib import Path
 from typing import Literal, overload
 
@@ -27,7 +27,6 @@ from eemilib.util.constants import (
     ImplementedEmissionData,
     ImplementedPop,
 )
-from eemilib.util.helper import flatten
 
 pop_to_row = {pop: i for i, pop in enumerate(IMPLEMENTED_POP)}
 row_to_pop = {val: key for key, val in pop_to_row.items()}
@@ -42,29 +41,109 @@ col_to_emission_data_type = {
 n_rows = len(IMPLEMENTED_POP)
 n_cols = len(IMPLEMENTED_EMISSION_DATA)
 
+#: Key of the files and data stored in :class:`DataMatrix`.
+DataKey = tuple[ImplementedPop, ImplementedEmissionData]
+#: All the keys, in the order in which data is iterated over.
+DATA_KEYS: tuple[DataKey, ...] = tuple(
+    (pop, data_type)
+    for data_type in IMPLEMENTED_EMISSION_DATA
+    for pop in IMPLEMENTED_POP
+)
+
+Files = str | Path | Collection[str] | Collection[Path]
+
 
 class MissingDataError(ValueError):
     """Error raised when data is missing from :class:`.DataMatrix`."""
 
 
 class DataMatrix:
-    """Store all the input files and corresp data in a single object."""
+    """Store all the input files and corresp data in a single object.
+
+    Files and data are stored in dictionaries keyed by population and
+    emission data type; only the defined entries are stored.
+
+    """
 
     def __init__(self) -> None:
         """Instantiate the object."""
-        self.files_matrix: list[
-            list[None | str | Collection[str] | Path | Collection[Path]]
-        ]
-        self.files_matrix = [
-            [None for _ in range(n_cols)] for _ in range(n_rows)
-        ]
-
-        self.data_matrix: list[
-            list[None | EmissionData | Collection[EmissionData]]
-        ]
-        self.data_matrix = [
-            [None for _ in range(n_cols)] for _ in range(n_rows)
-        ]
+        self._files: dict[DataKey, Files] = {}
+        self._data: dict[DataKey, EmissionData | Collection[EmissionData]]
+        self._data = {}
+
+    @property
+    def files_matrix(self) -> tuple[tuple[Files | None, ...], ...]:
+        """Give the files as ``(n_rows, n_cols)`` nested tuples.
+
+        They are read-only; use :meth:`set_files` to modify the files.
+
+        """
+        return tuple(
+            tuple(
+                self._files.get(self._indexes_to_natures(row, col))
+                for col in range(n_cols)
+            )
+            for row in range(n_rows)
+        )
+
+    @files_matrix.setter
+    def files_matrix(
+        self, files_matrix: Sequence[Sequence[Files | None]]
+    ) -> None:
+        """Set all the files from a ``(n_rows, n_cols)`` nested sequence."""
+        self._files = _from_nested(files_matrix)
+
+    @property
+    def data_matrix(
+        self,
+    ) -> tuple[
+        tuple[EmissionData | Collection[EmissionData] | None, ...], ...
+    ]:
+        """Give the data as ``(n_rows, n_cols)`` nested tuples.
+
+        They are read-only; use :meth:`set_data` to modify the data.
+
+        """
+        return tuple(
+            tuple(
+                self._data.get(self._indexes_to_natures(row, col))
+                for col in range(n_cols)
+            )
+            for row in range(n_rows)
+        )
+
+    @data_matrix.setter
+    def data_matrix(
+        self,
+        data_matrix: Sequence[
+            Sequence[EmissionData | Collection[EmissionData] | None]
+        ],
+    ) -> None:
+        """Set all the data from a ``(n_rows, n_cols)`` nested sequence."""
+        self._data = _from_nested(data_matrix)
+
+    def items(self) -> Iterator[tuple[DataKey, EmissionData]]:
+        """Iterate over all the loaded data.
+
+        Data is given by emission data type, then by population. When
+        several :class:`.EmissionData` are stored under the same key, they
+        are given one after the other.
+
+        .. code-block:: python
+
+            for (population, emission_data_type), data in data_matrix.items():
+                ...
+
+        """
+        for key in DATA_KEYS:
+            data = self._data.get(key)
+            if data is None:
+                continue
+            if isinstance(data, EmissionData):
+                yield key, data
+                continue
+            for single_data in data:
+                yield key, single_data
 
     def _natures_to_indexes(
         self,
@@ -87,6 +166,25 @@ class DataMatrix:
         assert emission_data_type in IMPLEMENTED_EMISSION_DATA
         return population_type, emission_data_type
 
+    def _key(
+        self,
+        row: int | None,
+        col: int | None,
+        population: ImplementedPop | None,
+        emission_data_type: ImplementedEmissionData | None,
+    ) -> DataKey:
+        """Give the key of the data, from its indexes or natures."""
+        if population and emission_data_type:
+            return population, emission_data_type
+
+        if row is None or col is None:
+            raise ValueError(
+                "You need to provide row and col, or population and "
+                f"emission_data_type.\n{row = }, {col = }, {population = },"
+                f"{emission_data_type = }"
+            )
+        return self._indexes_to_natures(row, col)
+
     @overload
     def set_files(
         self,
@@ -116,20 +214,8 @@ class DataMatrix:
         emission_data_type: ImplementedEmissionData | None = None,
     ) -> None:
         """Set the file(s) by index or name."""
-        if population and emission_data_type:
-            row, col = self._natures_to_indexes(
-                population_type=population,
-                emission_data_type=emission_data_type,
-            )
-
-        if row is None or col is None:
-            raise ValueError(
-                "You need to provide row and col, or population and "
-                f"emission_data_type.\n{row = }, {col = }, {population = },"
-                f"{emission_data_type = }"
-            )
-
-        self.files_matrix[row][col] = files
+        key = self._key(row, col, population, emission_data_type)
+        _set(self._files, key, files)
 
     @overload
     def set_data(
@@ -184,20 +270,8 @@ class DataMatrix:
         emission_data_type: ImplementedEmissionData | None = None,
     ) -> None:
         """Set the data by index or name."""
-        if population and emission_data_type:
-            row, col = self._natures_to_indexes(
-                population_type=population,
-                emission_data_type=emission_data_type,
-            )
-
-        if row is None or col is None:
-            raise ValueError(
-                "You need to provide row and col, or population and "
-                f"emission_data_type.\n{row = }, {col = }, {population = },"
-                f"{emission_data_type = }"
-            )
-
-        self.data_matrix[row][col] = emission_data
+        key = self._key(row, col, population, emission_data_type)
+        _set(self._data, key, emission_data)
 
     @overload
     def get_files(
@@ -225,20 +299,8 @@ class DataMatrix:
         emission_data_type: ImplementedEmissionData | None = None,
     ) -> None | str | Path | Collection[str] | Collection[Path]:
         """Get the file(s) by index or name."""
-        if population and emission_data_type:
-            row, col = self._natures_to_indexes(
-                population_type=population,
-                emission_data_type=emission_data_type,
-            )
-
-        if row is None or col is None:
-            raise ValueError(
-                "You need to provide row and col, or population and "
-                f"emission_data_type.\n{row = }, {col = }, {population = },"
-                f"{emission_data_type = }"
-            )
-
-        return self.files_matrix[row][col]
+        key = self._key(row, col, population, emission_data_type)
+        return self._files.get(key)
 
     @overload
     def get_data(
@@ -344,87 +406,67 @@ class DataMatrix:
             returned without any error message.
 
         """
-        if population and emission_data_type:
-            row, col = self._natures_to_indexes(
-                population_type=population,
-                emission_data_type=emission_data_type,
-            )
-
         if population and emission_data_type is None:
-            single_pop_data = [
-                self.get_data(
-                    population=population, emission_data_type=data_type
-                )
-                for data_type in IMPLEMENTED_EMISSION_DATA
+            return [
+                data for (pop, _), data in self.items() if pop == population
             ]
-            return [d for d in flatten(single_pop_data) if d is not None]
-
         if emission_data_type and population is None:
-            emission_data = [
-                self.get_data(
-                    population=pop, emission_data_type=emission_data_type
-                )
-                for pop in IMPLEMENTED_POP
+            return [
+                data
+                for (_, data_type), data in self.items()
+                if data_type == emission_data_type
             ]
-            return [d for d in flatten(emission_data) if d is not None]
-
-        if row is None and col is None:
-            all_data = [
-                [
-                    self.get_data(population=pop, emission_data_type=data_type)
-                    for pop in IMPLEMENTED_POP
-                ]
-                for data_type in IMPLEMENTED_EMISSION_DATA
-            ]
-            return [d for d in flatten(all_data) if d is not None]
+        if row is None and col is None and not population:
+            return [data for _, data in self.items()]
 
-        if row is None or col is None:
-            raise ValueError(
-                "You need to provide row and col, or population and "
-                f"emission_data_type.\n{row = }, {col = }, {population = },"
-                f"{emission_data_type = }"
-            )
+        key = self._key(row, col, population, emission_data_type)
+        return self._data.get(key)
 
-        return self.data_matrix[row][col]
-
-    def load_data(self, loader: Loader) -> None:
+    def load_data(
+        self,
+        loader: Loader,
+        progress: Callable[[int, int], object] | None = None,
+    ) -> None:
         """Load all filepaths in ``files_matrix``.
 
-        .. todo::
-            Could be more concise.
+        Parameters
+        ----------
+        loader :
+            Object reading the files.
+        progress :
+            Called after every loaded data with the number of data loaded so
+            far, and the total number of data to load. It can raise to abort
+            the loading.
 
         """
-        for pop in IMPLEMENTED_POP:
-            for data_type in IMPLEMENTED_EMISSION_DATA:
-                filepath = self.get_files(
-                    population=pop, emission_data_type=data_type
-                )  # type: ignore
-
-                if not filepath:
-                    continue
-
-                emission_data = None
-                if data_type == "Emission Yield":
-                    emission_data = EmissionYield.from_filepath(
-                        pop, loader, *filepath
-                    )
+        to_load = [key for key in DATA_KEYS if self._files.get(key)]
+        for i, (pop, data_type) in enumerate(to_load):
+            filepath = self._files[pop, data_type]
+
+            emission_data = None
+            if data_type == "Emission Yield":
+                emission_data = EmissionYield.from_filepath(
+                    pop, loader, *filepath
+                )
 
-                elif data_type == "Emission Energy":
-                    emission_data = EmissionEnergyDistribution.from_filepath(
-                        pop, loader, *filepath
-                    )
+            elif data_type == "Emission Energy":
+                emission_data = EmissionEnergyDistribution.from_filepath(
+                    pop, loader, *filepath
+                )
 
-                elif data_type == "Emission Angle":
-                    emission_data = EmissionAngleDistribution.from_filepath(
-                        pop, loader, *filepath
-                    )
+            elif data_type == "Emission Angle":
+                emission_data = EmissionAngleDistribution.from_filepath(
+                    pop, loader, *filepath
+                )
 
-                if emission_data:
-                    self.set_data(
-                        emission_data,
-                        population=pop,
-                        emission_data_type=data_type,
-                    )  # type: ignore
+            if emission_data:
+                self.set_data(
+                    emission_data,
+                    population=pop,
+                    emission_data_type=data_type,
+                )  # type: ignore
+            if progress is not None:
+                progress(i + 1, len(to_load))
 
     def has_all_mandatory_files(self, model_config: ModelConfig) -> bool:
         """Tell if files defined by :attr:`.Model.model_config` are set."""
@@ -542,7 +584,7 @@ class DataMatrix:
     @property
     def teey(self) -> EmissionYield:
         """Return the |TEEY| directly."""
-        emission_yield = self.data_matrix[3][0]
+        emission_yield = self._data.get(("all", "Emission Yield"))
         if emission_yield is None:
             raise MissingDataError
         assert isinstance(
@@ -554,7 +596,7 @@ class DataMatrix:
     @property
     def seey(self) -> EmissionYield:
         """Return the |SEEY| directly."""
-        emission_yield = self.data_matrix[0][0]
+        emission_yield = self._data.get(("SE", "Emission Yield"))
         if emission_yield is None:
             raise MissingDataError
         assert isinstance(
@@ -566,7 +608,7 @@ class DataMatrix:
     @property
     def se_energy_distribution(self) -> EmissionEnergyDistribution:
         """Return the energy distribution of |SEs|."""
-        distrib = self.data_matrix[0][1]
+        distrib = self._data.get(("SE", "Emission Energy"))
         if distrib is None:
             raise MissingDataError
         assert isinstance(
@@ -578,7 +620,7 @@ class DataMatrix:
     @property
     def all_energy_distribution(self) -> EmissionEnergyDistribution:
         """Return the energy distribution of all emitted electrons."""
-        distrib = self.data_matrix[3][1]
+        distrib = self._data.get(("all", "Emission Energy"))
         if distrib is None:
             raise MissingDataError
         assert isinstance(
@@ -586,3 +628,23 @@ class DataMatrix:
         ), f"Incorrect type for energy distribution: {type(distrib)}"
         assert distrib.population == "all"
         return distrib
+
+
+def _set[T](store: dict[DataKey, T], key: DataKey, value: T | None) -> None:
+    """Store ``value`` under ``key``, or remove the entry if it is None."""
+    if value is None:
+        store.pop(key, None)
+        return
+    store[key] = value
+
+
+def _from_nested[T](
+    nested: Sequence[Sequence[T | None]],
+) -> dict[DataKey, T]:
+    """Convert a ``(n_rows, n_cols)`` nested sequence to a dictionary."""
+    return {
+        (row_to_pop[row], col_to_emission_data_type[col]): value
+        for row, line in enumerate(nested)
+        for col, value in enumerate(line)
+        if value is not None
+    }
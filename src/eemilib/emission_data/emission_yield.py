@@ -4,12 +4,12 @@ import logging
 from pathlib import Path
 from typing import Self
 
+import numpy as np
 import pandas as pd
 from eemilib.emission_data.emission_data import EmissionData
 from eemilib.emission_data.helper import (
-    get_crossover_energies,
-    get_emax_eymax,
-    resample,
+    crossover_energies,
+    parabolic_maximum,
 )
 from eemilib.loader.loader import Loader
 from eemilib.plotter.plotter import Plotter
@@ -19,6 +19,7 @@ from eemilib.util.constants import (
     col_normal,
     md_ey,
 )
+from numpy.typing import NDArray
 
 
 class EmissionYield(EmissionData):
@@ -53,9 +54,7 @@ class EmissionYield(EmissionData):
         #: Second cross-over enrergy in :unit:`eV`. Not defined for BEs.
         self.e_c2: float | None
         if self.population in ("SE", "all"):
-            self.e_max, self.ey_max, self.e_c1, self.e_c2 = self._parameters(
-                n_resample=1000
-            )
+            self.e_max, self.ey_max, self.e_c1, self.e_c2 = self._parameters()
 
     @classmethod
     def from_filepath(
@@ -84,30 +83,39 @@ class EmissionYield(EmissionData):
         """Print nature of data (markdown)."""
         return md_ey[self.population]
 
-    def _parameters(
-        self,
-        n_resample: int = -1,
-    ) -> tuple[float, float, float, float | None]:
-        """Compute the characteristics of the emission yield."""
+    def _parameters(self) -> tuple[float, float, float, float | None]:
+        """Compute the characteristics of the emission yield.
+
+        Characteristics are interpolated between distinct energies: when an
+        energy appears several times (eg in a bootstrap resample), only its
+        first point is used.
+
+        """
         assert 0.0 in self.angles, "Need the normal incidence measurements."
 
-        normal_ey = self.data[[col_energy, col_normal]]
-        assert isinstance(normal_ey, pd.DataFrame)
-        normal_ey = resample(normal_ey, n_resample)
+        energies, first = np.unique(
+            self.energies.astype(np.float64, copy=False), return_index=True
+        )
+        normal_ey = self.data[col_normal].to_numpy(dtype=np.float64)[first]
 
-        e_max, sigma_max = self._get_maximum_ey(normal_ey)
-        e_c1, e_c2 = self._get_crossovers(normal_ey, e_max)
+        e_max, sigma_max = self._get_maximum_ey(energies, normal_ey)
+        e_c1, e_c2 = self._get_crossovers(energies, normal_ey, e_max)
         return e_max, sigma_max, e_c1, e_c2
 
     def _get_maximum_ey(
-        self, normal_ey: pd.DataFrame, tol_energy: float = 10.0
+        self,
+        energies: NDArray[np.float64],
+        normal_ey: NDArray[np.float64],
+        tol_energy: float = 10.0,
     ) -> tuple[float, float]:
         r"""Get the position and value of max emission yield.
 
         Parameters
         ----------
+        energies :
+            Energy of |PEs| in :unit:`eV`.
         normal_ey :
-            Holds energy of |PEs| as well as emission yield at nominal incidence.
+            Emission yield at nominal incidence.
         tol_energy :
             If the :math:`E_{max}` is too close to the maximum |PE| energy, an
             warning is raised; tolerance is ``tol_energy``.
@@ -116,7 +124,7 @@ class EmissionYield(EmissionData):
         -------
             :math:`E_{max}` and :math:`\sigma_{max}`.
         """
-        e_max, sigma_max = get_emax_eymax(normal_ey)
+        e_max, sigma_max = parabolic_maximum(energies, normal_ey)
         if abs(e_max - self.energies[-1]) < tol_energy:
             logging.warning(
                 "E_max is very close to the last measured energy. Maybe "
@@ -126,17 +134,19 @@ class EmissionYield(EmissionData):
 
     def _get_crossovers(
         self,
-        normal_ey: pd.DataFrame,
+        energies: NDArray[np.float64],
+        normal_ey: NDArray[np.float64],
         e_max: float,
         min_e: float = 10.0,
-        tol_ey: float = 0.01,
     ) -> tuple[float, float | None]:
         """Compute first and second crossover energies.
 
         Parameters
         ----------
+        energies :
+            Energy of |PEs| in :unit:`eV`.
         normal_ey :
-            Holds energy of |PEs| as well as emission yield at nominal incidence.
+            Emission yield at nominal incidence.
         e_max :
             Energy of maximum emission yield. Used to discriminate
             :math:`E_{c1}` from :math:`E_{c2}`.
@@ -145,9 +155,6 @@ class EmissionYield(EmissionData):
             emission yield data comes from a model which sets the emission
             yield to unity at very low energies (eg some implementations of
             Vaughan).
-        tol_ey :
-            It the emission yield is too far from unity at crossover energy, a
-            warning is raised. Tolerance is ``tol_ey``.
 
         Returns
         -------
@@ -155,22 +162,27 @@ class EmissionYield(EmissionData):
             First and second crossover energies.
 
         """
-        (ec1, ey_ec1), (ec2, ey_ec2) = get_crossover_energies(
-            normal_ey, e_max, min_e
-        )
-        if abs(ey_ec1 - 1.0) > tol_ey:
+        ec1, ec2 = crossover_energies(energies, normal_ey, e_max, min_e)
+        if ec1 is None:
+            first_half = (energies >= min_e) & (energies <= e_max)
+            if not first_half.any():
+                first_half = energies <= e_max
+            idx = np.flatnonzero(first_half)[
+                np.argmin(np.abs(normal_ey[first_half] - 1.0))
+            ]
+            ec1 = float(energies[idx])
             logging.warning(
-                f"The emission yield at first crossover energy is {ey_ec1}, "
-                "which is far from unity. Keeping it anyway."
+                "The emission yield does not cross unity below E_max. The "
+                f"closest emission yield is {normal_ey[idx]}, at {ec1} eV. "
+                "Keeping it anyway as first crossover energy."
             )
 
-        if abs(ey_ec2 - 1.0) > tol_ey:
+        if ec2 is None:
             logging.info(
-                f"The emission yield at second crossover energy is {ey_ec2}, "
-                "which is far from unity. Maybe its energy lies outside of the"
-                " measurement range. Setting E_c2 = None."
+                "The emission yield does not cross unity above E_max. Maybe "
+                "its energy lies outside of the measurement range. Setting "
+                "E_c2 = None."
             )
-            ec2 = None
 
         return ec1, ec2
 
@@ -1,8 +1,15 @@
-"""Define functions to extract some characteristics from emission data."""
+"""Define functions to extract some characteristics from emission data.
+
+The functions working on plain arrays (:func:`find_crossings`,
+:func:`parabolic_maximum`, :func:`crossover_energies`) do not need any
+resampling: characteristics are interpolated between the measured points.
+
+"""
 
 import numpy as np
 import pandas as pd
-from eemilib.util.constants import col_energy, col_normal
+from eemilib.util.constants import col_energy
+from numpy.typing import NDArray
 
 
 def trim(
@@ -44,47 +51,100 @@ def trim(
     return normal_ey.reset_index(drop=True)
 
 
-def resample(ey: pd.DataFrame, n_interp: int = -1) -> pd.DataFrame:
-    """Return the emission yield with more points and/or updated limits."""
-    if n_interp < 0:
-        return ey
-    new_ey = {
-        col_energy: np.linspace(
-            ey[col_energy].min(), ey[col_energy].max(), n_interp
-        )
-    }
-    for col_name in ey.columns:
-        if col_name == col_energy:
-            continue
-        new_ey[col_name] = np.interp(
-            x=new_ey[col_energy],
-            xp=ey[col_energy],
-            fp=ey[col_name],
-        )
-
-    return pd.DataFrame(new_ey)
-
-
-def get_emax_eymax(normal_ey: pd.DataFrame) -> tuple[float, float]:
-    """Get energy and max emission yields."""
-    ser_max = normal_ey.loc[normal_ey[col_normal].idxmax()]
-    e_max = ser_max[col_energy]
-    ey_max = ser_max[col_normal]
-    return e_max, ey_max
-
-
-def get_crossover_energies(
-    normal_ey: pd.DataFrame, e_max: float, min_e: float = 10.0
-) -> tuple[tuple[float, float], tuple[float, float]]:
-    """Compute first and second crossover energies.
+def find_crossings(
+    energy: NDArray[np.float64],
+    ey: NDArray[np.float64],
+    target: float = 1.0,
+) -> NDArray[np.float64]:
+    """Find the energies at which ``ey`` crosses ``target``.
+
+    Crossings are linearly interpolated between the two samples surrounding
+    each sign change of ``ey - target``.
 
     Parameters
     ----------
-    normal_ey :
-        Holds energy of |PEs| as well as emission yield at nominal incidence.
+    energy :
+        Energy of |PEs| in :unit:`eV`, sorted by increasing values.
+    ey :
+        Corresponding emission yield.
+    target :
+        Value that should be crossed.
+
+    Returns
+    -------
+    NDArray[np.float64]
+        All crossing energies in :unit:`eV`, sorted by increasing values.
+
+    """
+    diff = ey - target
+    exact = energy[diff == 0.0]
+
+    i = np.flatnonzero(diff[:-1] * diff[1:] < 0.0)
+    interpolated = energy[i] - diff[i] * (energy[i + 1] - energy[i]) / (
+        diff[i + 1] - diff[i]
+    )
+    return np.sort(np.concatenate((exact, interpolated)))
+
+
+def parabolic_maximum(
+    energy: NDArray[np.float64], ey: NDArray[np.float64]
+) -> tuple[float, float]:
+    """Get energy and max emission yield from the parabolic vertex.
+
+    A parabola is passed through the highest sample and its two neighbors;
+    its vertex gives the maximum. When the highest sample is at the edge of
+    the array, or when the three points are not concave, the highest sample
+    is returned as is.
+
+    Parameters
+    ----------
+    energy :
+        Energy of |PEs| in :unit:`eV`, sorted by increasing values.
+    ey :
+        Corresponding emission yield.
+
+    Returns
+    -------
+    tuple[float, float]
+        Energy at maximum in :unit:`eV`, maximum emission yield.
+
+    """
+    idx = int(np.nanargmax(ey))
+    if idx == 0 or idx == len(ey) - 1:
+        return float(energy[idx]), float(ey[idx])
+
+    (x_0, x_1, x_2), (y_0, y_1, y_2) = (
+        energy[idx - 1 : idx + 2],
+        ey[idx - 1 : idx + 2],
+    )
+    slope_left = (y_1 - y_0) / (x_1 - x_0)
+    slope_right = (y_2 - y_1) / (x_2 - x_1)
+    curvature = (slope_right - slope_left) / (x_2 - x_0)
+    if curvature >= 0.0:
+        return float(energy[idx]), float(ey[idx])
+
+    e_max = 0.5 * (x_0 + x_1) - slope_left / (2.0 * curvature)
+    ey_max = y_1 + (e_max - x_1) * (slope_left + curvature * (e_max - x_0))
+    return float(e_max), float(ey_max)
+
+
+def crossover_energies(
+    energy: NDArray[np.float64],
+    ey: NDArray[np.float64],
+    e_max: float,
+    min_e: float = 10.0,
+) -> tuple[float | None, float | None]:
+    """Compute first and second crossover energies by interpolation.
+
+    Parameters
+    ----------
+    energy :
+        Energy of |PEs| in :unit:`eV`, sorted by increasing values.
+    ey :
+        Corresponding emission yield.
     e_max :
-        Energy of maximum emission yield. Used to discriminate
-        :math:`E_{c1}` from :math:`E_{c2}`.
+        Energy of maximum emission yield. :math:`E_{c1}` is the last crossing
+        below this energy, :math:`E_{c2}` the first crossing above.
     min_e :
         Energy under which :math:`E_{c1}` is not searched. It is useful if
         emission yield data comes from a model which sets the emission
@@ -93,37 +153,14 @@ def get_crossover_energies(
 
     Returns
     -------
-    tuple[float, float]
-        First crossover energy, corresponding emission yield.
-    tuple[float, float]
-        Second crossover energy, corresponding emission yield.
+    tuple[float | None, float | None]
+        First and second crossover energies in :unit:`eV`. They are None if
+        emission yield does not cross unity in the corresponding range.
 
     """
-    first_half = trim(normal_ey, min_e=min_e, max_e=e_max)
-    ser_ec1 = first_half.loc[(first_half[col_normal] - 1.0).abs().idxmin()]
-    ec1 = ser_ec1[col_energy]
-    ey_ec1 = ser_ec1[col_normal]
-
-    second_half = trim(normal_ey, min_e=e_max)
-    ser_ec2 = second_half.loc[(second_half[col_normal] - 1.0).abs().idxmin()]
-    ec2 = ser_ec2[col_energy]
-    ey_ec2 = ser_ec2[col_normal]
-
-    return (ec1, ey_ec1), (ec2, ey_ec2)
-
-
-def get_ec1(normal_ey: pd.DataFrame, **kwargs) -> float:
-    """Interpolate the energy vs teey array and give the E_c1."""
-    energy = normal_ey[col_energy].to_numpy()
-    teey = normal_ey[col_normal].to_numpy()
-    idx = np.argmin(np.abs(teey - 1.0))
-    ec1 = energy[idx]
-    return ec1
-
-
-def get_max(normal_ey: pd.DataFrame, **kwargs) -> tuple[float, float]:
-    """Interpolate the energy vs teey array and give the E and sigma max."""
-    energy = normal_ey[col_energy].to_numpy()
-    teey = normal_ey[col_normal].to_numpy()
-    idx = np.argmax(teey)
-    return energy[idx], teey[idx]
+    crossings = find_crossings(energy, ey)
+    below = crossings[(crossings >= min_e) & (crossings <= e_max)]
+    above = crossings[crossings > e_max]
+    ec1 = float(below[-1]) if below.size else None
+    ec2 = float(above[0]) if above.size else None
+    return ec1, ec2
@@ -10,15 +10,16 @@
 
 """
 
-import importlib
+import copy
 import logging
 import sys
+import time
 from abc import ABCMeta
-from types import ModuleType
-from typing import Callable, Literal
+from typing import Any, Callable, Literal
 
 import numpy as np
 from eemilib.core.model_config import ModelConfig
+from eemilib.core.registry import load_plugin
 from eemilib.emission_data.data_matrix import DataMatrix
 from eemilib.gui.file_selection import file_selection_matrix
 from eemilib.gui.helper import (
@@ -26,9 +27,12 @@ from eemilib.gui.helper import (
     PARAMETER_POS_TO_ATTR,
     set_dropdown_value,
     set_help_button_action,
+    set_slider_value,
     setup_dropdown,
     setup_linspace_entries,
     setup_lock_checkbox,
+    setup_parameter_slider,
+    slider_to_value,
     to_plot_checkboxes,
 )
 from eemilib.gui.loader_selection import LoaderSettingsDialog
@@ -41,6 +45,13 @@ from eemilib.gui.styles import (
     format_number,
     math_text_label_from_key,
 )
+from eemilib.gui.workers import (
+    Worker,
+    compute_model_data,
+    evaluate_model,
+    fit_model,
+    load_data,
+)
 from eemilib.loader.loader import Loader
 from eemilib.model.model import Model
 from eemilib.plotter.plotter import Plotter
@@ -50,6 +61,8 @@ from eemilib.util.constants import (
     ImplementedEmissionData,
     ImplementedPop,
 )
+from eemilib.util.log_manager import set_up_logging
+from PyQt5.QtCore import QThreadPool, QTimer
 from PyQt5.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -59,8 +72,10 @@ from PyQt5.QtWidgets import (
     QLineEdit,
     QListWidget,
     QMainWindow,
+    QProgressBar,
     QPushButton,
     QRadioButton,
+    QSlider,
     QTableWidget,
     QTableWidgetItem,
     QTabWidget,
@@ -84,6 +99,9 @@ class MainWindow(QMainWindow):
     #: If loading data should automatically fill the energy/angle ranges with
     #: their maximum values
     autofill_plotting_ranges = True
+    #: Delay in :unit:`ms` without parameter change before the live preview
+    #: is updated. Changes within this delay are coalesced in a single update
+    live_preview_delay = 15
 
     def __init__(
         self,
@@ -102,10 +120,20 @@ class MainWindow(QMainWindow):
         self.loader: Loader
         self.model: Model
         self.axes = None
+        #: Plotter of the modelled data, kept to update its lines on the next
+        #: plots instead of creating new ones.
+        self.model_plotter: Plotter | None = None
 
         super().__init__()
         self.setWindowTitle("EEmiLib")
 
+        # Background jobs
+        self.thread_pool = QThreadPool.globalInstance()
+        self.worker: Worker | None = None
+        self.progress_bar: QProgressBar
+        self.cancel_button: QPushButton
+        self._setup_status_bar()
+
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
 
@@ -129,12 +157,15 @@ class MainWindow(QMainWindow):
 
         self.loader_classes: dict[str, str]
         self.loader_help_button: QPushButton
+        self.load_button: QPushButton
         self._setup_loader_dropdown()
 
         self.model_table = self._setup_model_configuration()
+        self.parameter_sliders: dict[str, QSlider] = {}
         self.model_classes: dict[str, str]
         self.model_class: ABCMeta
         self.model_help_button: QPushButton
+        self.fit_button: QPushButton
         self._setup_model_dropdown()
 
         self.evaluations: dict[str, float]
@@ -158,6 +189,10 @@ class MainWindow(QMainWindow):
         self.population_checkboxes: list[QCheckBox]
         self._setup_plotter_dropdowns()
 
+        self.live_preview_checkbox: QCheckBox
+        self.live_preview_timer: QTimer
+        self._setup_live_preview()
+
         # Call the methods called by the model_dropdown index change
         self._set_default_dropdown()
 
@@ -196,8 +231,7 @@ class MainWindow(QMainWindow):
         """Set the :class:`.Loader` related interface."""
         settings_label, settings_action = self._setup_loader_settings_dialog()
         classes, layout, dropdown, buttons = setup_dropdown(
-            module_name="eemilib.loader",
-            base_class=Loader,
+            kind="Loader",
             buttons_args={
                 "Help": lambda _: logging.info("Help not set."),
                 "Load data": self.load_data,
@@ -209,6 +243,7 @@ class MainWindow(QMainWindow):
         dropdown.setCurrentText
         self.dropdowns["Loader"] = dropdown
         self.loader_help_button = buttons[0]
+        self.load_button = buttons[1]
         self._data_model_layout.addLayout(layout)
 
     def _setup_loader(self) -> None:
@@ -227,7 +262,7 @@ class MainWindow(QMainWindow):
         return settings_label, settings_action
 
     def load_data(self) -> None:
-        """Load all the files set in GUI."""
+        """Load all the files set in GUI, in a background thread."""
         for i in range(len(IMPLEMENTED_POP)):
             for j in range(len(IMPLEMENTED_EMISSION_DATA)):
                 file_list_widget = self.file_lists[i][j]
@@ -238,18 +273,26 @@ class MainWindow(QMainWindow):
                     ]
                     self.data_matrix.set_files(file_names, row=i, col=j)
 
-        try:
-            self.data_matrix.load_data(self.loader)
-        except Exception as e:
-            logging.error(
-                "An error was raised during the loading of the data file. "
-                "Check that the format of the files is consistent with what "
-                f"is expected by the data loader. Error message:\n{e}"
-            )
+        self._start_worker(
+            Worker(load_data, copy.deepcopy(self.data_matrix), self.loader),
+            on_result=self._set_loaded_data,
+            on_error=self._log_loading_error,
+        )
 
+    def _set_loaded_data(self, data_matrix: DataMatrix) -> None:
+        """Store the data loaded by the background thread."""
+        self.data_matrix = data_matrix
         if self.autofill_plotting_ranges:
             self._fill_plotting_ranges()
 
+    def _log_loading_error(self, e: Exception) -> None:
+        """Explain why the loading failed."""
+        logging.error(
+            "An error was raised during the loading of the data file. "
+            "Check that the format of the files is consistent with what "
+            f"is expected by the data loader. Error message:\n{e}"
+        )
+
     # =========================================================================
     # Tab 1 - Model
     # =========================================================================
@@ -261,11 +304,10 @@ class MainWindow(QMainWindow):
         """
         settings_label, settings_action = self._setup_model_settings_dialog()
         classes, layout, dropdown, buttons = setup_dropdown(
-            module_name="eemilib.model",
-            base_class=Model,
+            kind="Model",
             buttons_args={
                 "Help": lambda _: logging.info("Help not set"),
-                "Fit!": (self.fit_model, self._fill_evaluations_display),
+                "Fit!": self.fit_model,
                 settings_label: settings_action,
             },
         )
@@ -280,6 +322,7 @@ class MainWindow(QMainWindow):
         )
 
         self.model_help_button = buttons[0]
+        self.fit_button = buttons[1]
         self._data_model_layout.addLayout(layout)
 
     def _setup_model_settings_dialog(self) -> tuple[str, Callable]:
@@ -308,6 +351,7 @@ class MainWindow(QMainWindow):
         set_help_button_action(self.model_help_button, self.model)
 
         self._populate_parameters_table_constants()
+        self._populate_parameters_table_values()
         self.model_table.itemChanged.connect(
             self._update_parameter_value_from_table
         )
@@ -315,11 +359,12 @@ class MainWindow(QMainWindow):
     def _populate_parameters_table_constants(self) -> None:
         """Print out the model parameters in dedicated table."""
         self.model_table.setRowCount(0)
-        for row, param in enumerate(self.model.parameters.values()):
+        self.parameter_sliders = {}
+        for row, (name, param) in enumerate(self.model.parameters.items()):
             self.model_table.insertRow(row)
 
             label, unit = math_text_label_from_key(param.name)
-            label.setObjectName(param.name)  # anchors the name to the widget
+            label.setObjectName(name)  # anchors the name to the widget
             self.model_table.setCellWidget(row, 0, label)
             self.model_table.setCellWidget(row, 1, unit)
             description, _ = math_text_label_from_key(param.description)
@@ -337,6 +382,20 @@ class MainWindow(QMainWindow):
             checkbox_widget = setup_lock_checkbox(param)
             self.model_table.setCellWidget(row, col_lock, checkbox_widget)
 
+            slider = setup_parameter_slider(param)
+            if slider is not None:
+                slider.valueChanged.connect(
+                    lambda position, name=name: (
+                        self._update_parameter_value_from_slider(
+                            name, position
+                        )
+                    )
+                )
+                self.model_table.setCellWidget(
+                    row, PARAMETER_ATTR_TO_POS["slider"], slider
+                )
+                self.parameter_sliders[name] = slider
+
     def _update_parameter_value_from_table(
         self, item: QTableWidgetItem
     ) -> None:
@@ -353,22 +412,87 @@ class MainWindow(QMainWindow):
         if parameter:
             try:
                 new_value = float(item.text())
-                setattr(parameter, attr, new_value)
+                if attr == "value":
+                    # Models may cache quantities derived from the values
+                    self.model.set_parameter_value(name, new_value)
+                else:
+                    setattr(parameter, attr, new_value)
 
             except ValueError:
                 logging.warning(f"Invalid value entered for {name}")
                 item.setText(str(parameter.value))
+                return
+
+            if name in self.parameter_sliders:
+                set_slider_value(self.parameter_sliders[name], parameter)
+            if attr == "value":
+                self.schedule_live_preview()
+
+    def _update_parameter_value_from_slider(
+        self, name: str, position: int
+    ) -> None:
+        """Update :class:`.Parameter` value when its slider is moved."""
+        parameter = self.model.parameters[name]
+        self.model.set_parameter_value(
+            name, slider_to_value(position, parameter)
+        )
+
+        row = list(self.model.parameters).index(name)
+        self.model_table.blockSignals(True)
+        self.model_table.setItem(
+            row,
+            PARAMETER_ATTR_TO_POS["value"],
+            QTableWidgetItem(format_number(parameter.value)),
+        )
+        self.model_table.blockSignals(False)
+        self.schedule_live_preview()
 
     def fit_model(self) -> None:
-        """Perform the fit on the loaded data."""
+        """Perform the fit on the loaded data, in a background thread.
+
+        The fitted model is also evaluated.
+
+        """
         if not hasattr(self, "model") or not self.model:
             logging.info("Please select a model before fitting.")
             return
-        self.model.find_optimal_parameters(self.data_matrix)
+        self._start_worker(
+            Worker(
+                fit_model,
+                copy.deepcopy(self.model),
+                copy.deepcopy(self.data_matrix),
+            ),
+            on_result=self._set_fitted_model,
+        )
+
+    def _set_fitted_model(
+        self, result: tuple[Model, dict[str, float]]
+    ) -> None:
+        """Copy the fitted values to the model, update tables."""
+        fitted, evaluations = result
+        if type(fitted) is not type(self.model):
+            logging.warning(
+                f"Model changed during the fit of {fitted}. Discarding the "
+                "fitted values."
+            )
+            return
+        self.model.set_parameters_values(
+            {name: param.value for name, param in fitted.parameters.items()}
+        )
+        self.model.covariance = fitted.covariance
         self._populate_parameters_table_values()
 
+        self.evaluations = evaluations
+        self._populate_evaluators_table()
+
     def _populate_parameters_table_values(self) -> None:
-        """Print out the values of the model parameters in dedicated table."""
+        """Print out the values of the model parameters in dedicated table.
+
+        Signals of the table are blocked, so that the rounded values that are
+        displayed are not written back to the parameters.
+
+        """
+        self.model_table.blockSignals(True)
         for row, param in enumerate(self.model.parameters.values()):
             for attr in ("value",):
                 col = PARAMETER_ATTR_TO_POS[attr]
@@ -381,6 +505,11 @@ class MainWindow(QMainWindow):
             self.model_table.setItem(
                 i, 2, QTableWidgetItem(format_number(param.value))
             )
+        self.model_table.blockSignals(False)
+
+        for name, slider in self.parameter_sliders.items():
+            set_slider_value(slider, self.model.parameters[name])
+        self.schedule_live_preview()
 
     # =========================================================================
     # Tab 1 - Model evaluation
@@ -420,19 +549,30 @@ class MainWindow(QMainWindow):
         return button
 
     def _fill_evaluations_display(self) -> None:
-        """Fill the evaluations display with the last model."""
+        """Fill the evaluations display with the last model.
+
+        The evaluation is performed in a background thread.
+
+        """
         if not hasattr(self, "model") or not self.model:
             logging.info("Please select a model before evaluating.")
             return
         if not hasattr(self, "data_matrix") or not self.data_matrix:
             logging.info("Please load data before evaluating.")
             return
-        self._evaluate_model()
-        self._populate_evaluators_table()
+        self._start_worker(
+            Worker(
+                evaluate_model,
+                copy.deepcopy(self.model),
+                copy.deepcopy(self.data_matrix),
+            ),
+            on_result=self._set_evaluations,
+        )
 
-    def _evaluate_model(self) -> None:
-        """Evaluate model and save resulting dict in ``self.evaluations``."""
-        self.evaluations = self.model.evaluate(self.data_matrix)
+    def _set_evaluations(self, evaluations: dict[str, float]) -> None:
+        """Save ``evaluations`` in ``self.evaluations``, update table."""
+        self.evaluations = evaluations
+        self._populate_evaluators_table()
 
     def _populate_evaluators_table(self) -> None:
         """Write the contents of ``self.evaluations`` into the table."""
@@ -527,8 +667,7 @@ class MainWindow(QMainWindow):
         self._set_up_population_to_plot_checkboxes()
 
         classes, layout, dropdown, buttons = setup_dropdown(
-            module_name="eemilib.plotter",
-            base_class=Plotter,
+            kind="Plotter",
             buttons_args={
                 "Plot file": self.plot_measured,
                 "Plot modelled data": self.plot_model,
@@ -563,7 +702,7 @@ class MainWindow(QMainWindow):
 
     def plot_measured(self) -> None:
         """Plot the desired data, as imported."""
-        plotter = self._dropdown_to_class("Plotter")(gui=True)
+        plotter = self._dropdown_to_class("Plotter")(gui=True, downsample=True)
 
         success_pop, populations = self._get_populations_to_plot()
         if not success_pop:
@@ -582,32 +721,83 @@ class MainWindow(QMainWindow):
         )
 
     def plot_model(self) -> None:
-        """Plot the desired data, as modelled."""
-        plotter = self._dropdown_to_class("Plotter")(gui=True)
+        """Plot the desired data, as modelled.
 
+        The modelled data is computed in a background thread, and plotted
+        when it is ready.
+
+        """
+        inputs = self._get_model_plot_inputs()
+        if inputs is None:
+            return
+        populations, emission_data_type, energies, angles = inputs
+        self._start_worker(
+            Worker(
+                compute_model_data,
+                copy.deepcopy(self.model),
+                populations,
+                emission_data_type,
+                energies,
+                angles,
+            ),
+            on_result=lambda to_plot: self._plot_model_data(
+                to_plot, emission_data_type
+            ),
+        )
+
+    def _get_model_plot_inputs(
+        self,
+    ) -> (
+        tuple[
+            list[ImplementedPop],
+            ImplementedEmissionData,
+            np.ndarray,
+            np.ndarray,
+        ]
+        | None
+    ):
+        """Read populations, data type, energies and angles to plot."""
         success_pop, populations = self._get_populations_to_plot()
         if not success_pop:
-            return
+            return None
         success_data, emission_data_type = (
             self._get_emission_data_type_to_plot()
         )
         if not success_data:
-            return
+            return None
         success_ene, energies = self._gen_linspace("energy")
         if not success_ene:
-            return
+            return None
         success_angle, angles = self._gen_linspace("angle")
         if not success_angle:
-            return
+            return None
 
-        self.axes = self.model.plot(
-            plotter,
-            population=populations,
-            emission_data_type=emission_data_type,
-            energies=energies,
-            angles=angles,
-            axes=self.axes,
-        )
+        assert emission_data_type is not None
+        return populations, emission_data_type, energies, angles
+
+    def _plot_model_data(
+        self,
+        to_plot: dict[ImplementedPop, Any],
+        emission_data_type: ImplementedEmissionData,
+    ) -> None:
+        """Plot the modelled data computed by the background thread.
+
+        Lines of the previous plot in the same axes are updated.
+
+        """
+        plotter_class = self._dropdown_to_class("Plotter")
+        if not isinstance(self.model_plotter, plotter_class):
+            self.model_plotter = plotter_class(
+                gui=True, incremental=True, downsample=True
+            )
+        for population, data in to_plot.items():
+            self.axes = self.model.plot_data(
+                self.model_plotter,
+                data,
+                population,
+                emission_data_type,
+                axes=self.axes,
+            )
 
     def _get_emission_data_type_to_plot(
         self,
@@ -715,6 +905,168 @@ class MainWindow(QMainWindow):
             logging.debug(f"Setting {n_theta = }")
             self.n_theta_widget.setText(str(n_theta))
 
+    # =========================================================================
+    # Tab 2 - Live preview
+    # =========================================================================
+    def _setup_live_preview(self) -> None:
+        """Add the checkbox activating the live preview of the model.
+
+        When it is checked, every change of a parameter value replots the
+        model. Changes are debounced by a single-shot timer: the plot is
+        updated once no parameter changed for :attr:`live_preview_delay`.
+
+        """
+        self.live_preview_checkbox = QCheckBox(
+            "Live preview: replot model when a parameter changes"
+        )
+        self.live_preview_checkbox.toggled.connect(self.schedule_live_preview)
+        self._plot_layout.addWidget(self.live_preview_checkbox)
+
+        self.live_preview_timer = QTimer(self)
+        self.live_preview_timer.setSingleShot(True)
+        self.live_preview_timer.setInterval(self.live_preview_delay)
+        self.live_preview_timer.timeout.connect(self.live_preview)
+
+    def schedule_live_preview(self) -> None:
+        """Replot the model after the debouncing delay.
+
+        Calling this method again before the end of the delay restarts it,
+        so that a burst of changes leads to a single replot.
+
+        """
+        if not hasattr(self, "live_preview_checkbox"):
+            return
+        if not self.live_preview_checkbox.isChecked():
+            return
+        self.live_preview_timer.start()
+
+    def live_preview(self) -> None:
+        """Replot the model with its current parameters values.
+
+        The modelled data is computed in the GUI thread, with the vectorized
+        :meth:`.Model.get_data`, and the lines of the previous plot are
+        updated rather than recreated.
+
+        """
+        if not hasattr(self, "model") or not self.model:
+            return
+        inputs = self._get_model_plot_inputs()
+        if inputs is None:
+            return
+        populations, emission_data_type, energies, angles = inputs
+
+        start = time.perf_counter()
+        to_plot = {}
+        try:
+            for population in populations:
+                data = self.model.get_data(
+                    population=population,
+                    emission_data_type=emission_data_type,
+                    energy=energies,
+                    theta=angles,
+                )
+                if data is not None:
+                    to_plot[population] = data
+        except Exception as e:
+            logging.warning(f"Live preview failed:\n{e!r}")
+            return
+        self._plot_model_data(to_plot, emission_data_type)
+        logging.debug(
+            f"Live preview took {1e3 * (time.perf_counter() - start):.1f} ms."
+        )
+
+    # =========================================================================
+    # Background jobs
+    # =========================================================================
+    def _setup_status_bar(self) -> None:
+        """Add progress bar and cancel button of background jobs."""
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setMaximumWidth(200)
+        self.progress_bar.setVisible(False)
+        self.statusBar().addPermanentWidget(self.progress_bar)
+
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.setVisible(False)
+        self.cancel_button.clicked.connect(self.cancel_worker)
+        self.statusBar().addPermanentWidget(self.cancel_button)
+
+    def _start_worker(
+        self,
+        worker: Worker,
+        on_result: Callable[[Any], None],
+        on_error: Callable[[Exception], None] | None = None,
+    ) -> None:
+        """Run ``worker`` in the thread pool.
+
+        Only one job runs at a time; the buttons starting a job are disabled
+        until it is over.
+
+        Parameters
+        ----------
+        worker :
+            The job to run.
+        on_result :
+            Called in the GUI thread with the output of the job.
+        on_error :
+            Called in the GUI thread with the exception raised by the job.
+            The default logs it.
+
+        """
+        if self.worker is not None:
+            logging.warning(
+                "Another task is running. Wait for it to finish, or cancel "
+                "it."
+            )
+            return
+        if on_error is None:
+            on_error = self._log_worker_error
+        worker.signals.result.connect(on_result)
+        worker.signals.error.connect(on_error)
+        worker.signals.progress.connect(self._show_progress)
+        worker.signals.finished.connect(self._worker_finished)
+
+        self.worker = worker
+        self._set_busy(True)
+        self.thread_pool.start(worker)
+
+    def cancel_worker(self) -> None:
+        """Cancel the running job; its result will be discarded."""
+        if self.worker is None:
+            return
+        self.worker.cancel()
+        self.cancel_button.setEnabled(False)
+        self.statusBar().showMessage("Cancelling...")
+
+    def _show_progress(self, done: int, total: int) -> None:
+        """Update the progress bar. A ``total`` of 0 means busy."""
+        self.progress_bar.setRange(0, total)
+        self.progress_bar.setValue(done)
+
+    def _worker_finished(self) -> None:
+        """Make the GUI available for a new job."""
+        self.worker = None
+        self._set_busy(False)
+
+    def _set_busy(self, busy: bool) -> None:
+        """Show progress bar, disable the buttons starting a job."""
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setVisible(busy)
+        self.cancel_button.setVisible(busy)
+        self.cancel_button.setEnabled(busy)
+        if not busy:
+            self.statusBar().clearMessage()
+        for button in (
+            self.load_button,
+            self.fit_button,
+            self.force_reevaluation_button,
+            self.plot_model_button,
+        ):
+            button.setEnabled(not busy)
+
+    def _log_worker_error(self, e: Exception) -> None:
+        """Log an error raised in a background job."""
+        logging.error(f"An error was raised by the background task:\n{e!r}")
+
     # =========================================================================
     # Helper
     # =========================================================================
@@ -723,18 +1075,8 @@ class MainWindow(QMainWindow):
         dropdown = self.dropdowns.get(name, None)
         assert dropdown is not None, f" The dropdown {name} is not defined."
 
-        module_names_to_paths = "_".join((name.lower(), "classes"))
-        module_name_to_path = getattr(self, module_names_to_paths, None)
-        assert module_name_to_path is not None, (
-            f"The dictionary {module_names_to_paths}, linking every module"
-            " name to its path, is not defined."
-        )
-
         selected: str = dropdown.currentText()
-        module_path: str = module_name_to_path[selected]
-        module: ModuleType = importlib.import_module(module_path)
-        my_class = getattr(module, selected)
-        return my_class
+        return load_plugin(name, selected)
 
     def _set_list_widget_state(
         self, widget: QListWidget, enabled: bool
@@ -763,6 +1105,7 @@ class MainWindow(QMainWindow):
 
 
 def main():
+    set_up_logging("EEmiLib")
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
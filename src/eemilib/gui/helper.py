@@ -6,8 +6,9 @@ from collections.abc import Collection
 from functools import partial
 from typing import Any, Literal, overload
 
+import numpy as np
+from eemilib.core.registry import PluginKind, available_plugins
 from eemilib.model.parameter import Parameter
-from eemilib.util.helper import get_classes
 from PyQt5.QtCore import Qt, QUrl
 from PyQt5.QtGui import QDesktopServices, QDoubleValidator, QIntValidator
 from PyQt5.QtWidgets import (
@@ -18,23 +19,22 @@ from PyQt5.QtWidgets import (
     QLineEdit,
     QPushButton,
     QRadioButton,
+    QSlider,
     QWidget,
 )
 
 
 def setup_dropdown(
-    module_name: str,
-    base_class: ABCMeta,
+    kind: PluginKind,
     buttons_args: dict[str, Any],
 ) -> tuple[dict[str, str], QHBoxLayout, QComboBox, list[QPushButton]]:
     """Set up interface with a dropdown menu and a button next to it.
 
     Parameters
     ----------
-    module_name :
-        Where the entries of the dropdown will be searched.
-    base_class :
-        The base class from which dropdown entries should inherit.
+    kind :
+        Kind of plugins listed in the dropdown, see
+        :func:`.available_plugins`. They are not imported.
     buttons_args :
         Dictionary where the keys are the name of the buttons to add next to
         the dropdown menu, and values the callable that will be called when
@@ -44,8 +44,8 @@ def setup_dropdown(
     Returns
     -------
     dict[str, str]
-        Keys are the name of the objects inheriting from ``base_class`` found
-        in ``module_name``. Values are the path leading to them.
+        Keys are the name of the available plugins of ``kind``. Values are
+        their import target, under the form ``"module.path:ClassName"``.
     QHBoxLayout
         Layout holding together ``dropdown`` and ``button``.
     QComboBox
@@ -54,13 +54,13 @@ def setup_dropdown(
         The buttons next to the dropdown menu.
 
     """
-    classes = get_classes(module_name, base_class)
+    classes = available_plugins(kind)
 
     layout = QHBoxLayout()
 
     dropdown = QComboBox()
     dropdown.addItems(classes.keys())
-    layout.addWidget(QLabel(f"Select {base_class.__name__}:"))
+    layout.addWidget(QLabel(f"Select {kind}:"))
     layout.addWidget(dropdown)
 
     buttons = []
@@ -163,6 +163,42 @@ def setup_lock_checkbox(
     return checkbox_widget
 
 
+#: Number of steps of the parameter sliders.
+SLIDER_STEPS = 1000
+
+
+def setup_parameter_slider(parameter: Parameter) -> QSlider | None:
+    """Create a slider spanning the bounds of ``parameter``.
+
+    Returns ``None`` if one of the bounds is not finite.
+
+    """
+    if not np.all(np.isfinite((parameter.lower_bound, parameter.upper_bound))):
+        return None
+    slider = QSlider(Qt.Horizontal)
+    slider.setRange(0, SLIDER_STEPS)
+    slider.setMinimumWidth(100)
+    set_slider_value(slider, parameter)
+    return slider
+
+
+def set_slider_value(slider: QSlider, parameter: Parameter) -> None:
+    """Move ``slider`` to the value of ``parameter``, without signal."""
+    low, high = parameter.lower_bound, parameter.upper_bound
+    position = 0
+    if high > low:
+        position = round((parameter.value - low) / (high - low) * SLIDER_STEPS)
+    slider.blockSignals(True)
+    slider.setValue(min(max(position, 0), SLIDER_STEPS))
+    slider.blockSignals(False)
+
+
+def slider_to_value(position: int, parameter: Parameter) -> float:
+    """Convert the ``position`` of a slider to a value of ``parameter``."""
+    low, high = parameter.lower_bound, parameter.upper_bound
+    return low + (high - low) * position / SLIDER_STEPS
+
+
 def _toggle_lock(state: Any, parameter: Parameter) -> None:
     """Activate/deactivate lock."""
     if state == Qt.Checked:
@@ -234,7 +270,8 @@ PARAMETER_ATTR_TO_POS = {
     "lower_bound": 3,
     "upper_bound": 4,
     "lock": 5,
-    "description": 6,
+    "slider": 6,
+    "description": 7,
 }
 
 #: Maps column position in list of parameters to the corresponding Parameter
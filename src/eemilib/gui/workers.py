@@ -0,0 +1,183 @@
+"""Run the long GUI jobs in background threads.
+
+Loading, fitting and evaluating the model can take several seconds; they are
+executed by a :class:`Worker` in the global :class:`QThreadPool` so that the
+window stays responsive. The worker communicates with the GUI thread through
+the Qt signals of :class:`WorkerSignals` only: widgets and axes are never
+touched from the background thread.
+
+Jobs work on copies of the :class:`.Model` and of the :class:`.DataMatrix`,
+made in the GUI thread before the job is started; jobs modify the objects
+they receive. The GUI replaces its own objects, or copies the fitted values,
+once the job is over. Cancellation is cooperative: the job is aborted at its next progress
+report, and the result of a cancelled job is never emitted. The fit itself
+reports no progress and cannot be interrupted; a fit cancelled by the user
+runs until it converges, and its result is discarded.
+
+"""
+
+import logging
+import threading
+from collections.abc import Callable, Collection
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from eemilib.emission_data.data_matrix import DataMatrix
+from eemilib.loader.loader import Loader
+from eemilib.model.model import Model
+from eemilib.util.constants import ImplementedEmissionData, ImplementedPop
+from numpy.typing import NDArray
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal, pyqtSlot
+
+#: Signature of the progress callback given to the jobs. Arguments are the
+#: number of done steps and the total number of steps; a total of 0 means
+#: that the progress is unknown.
+Progress = Callable[[int, int], None]
+
+
+class Cancelled(Exception):
+    """Raised in a job when it was cancelled by the user."""
+
+
+class WorkerSignals(QObject):
+    """Define the signals emitted by a :class:`Worker`.
+
+    Slots connected to these signals are executed in the GUI thread.
+
+    """
+
+    #: Number of done steps, total number of steps.
+    progress = pyqtSignal(int, int)
+    #: Object returned by the job.
+    result = pyqtSignal(object)
+    #: Exception raised by the job.
+    error = pyqtSignal(object)
+    #: Emitted at the end of the job, whatever its outcome.
+    finished = pyqtSignal()
+
+
+class Worker(QRunnable):
+    """Execute a function in a thread of a :class:`QThreadPool`."""
+
+    def __init__(
+        self, function: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> None:
+        """Set the job.
+
+        Parameters
+        ----------
+        function :
+            The job. It must accept a ``progress`` keyword argument, a
+            :data:`Progress` callable to call regularly.
+        args :
+            Positional arguments passed to ``function``.
+        kwargs :
+            Keyword arguments passed to ``function``.
+
+        """
+        super().__init__()
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+        self._cancelled = threading.Event()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Tell if :meth:`cancel` was called."""
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """Ask the job to stop, and discard its result."""
+        self._cancelled.set()
+
+    def progress(self, done: int, total: int) -> None:
+        """Report progress, or abort the job if it was cancelled."""
+        if self.is_cancelled:
+            raise Cancelled
+        self.signals.progress.emit(done, total)
+
+    @pyqtSlot()
+    def run(self) -> None:
+        """Execute the job and emit its outcome."""
+        try:
+            result = self.function(
+                *self.args, progress=self.progress, **self.kwargs
+            )
+        except Cancelled:
+            logging.info(f"{self.function.__name__} was cancelled.")
+        except Exception as e:
+            self.signals.error.emit(e)
+        else:
+            if not self.is_cancelled:
+                self.signals.result.emit(result)
+        finally:
+            self.signals.finished.emit()
+
+
+def load_data(
+    data_matrix: DataMatrix, loader: Loader, progress: Progress
+) -> DataMatrix:
+    """Load the files of ``data_matrix``."""
+    data_matrix.load_data(loader, progress=progress)
+    return data_matrix
+
+
+def fit_model(
+    model: Model, data_matrix: DataMatrix, progress: Progress
+) -> tuple[Model, dict[str, float]]:
+    """Fit and evaluate ``model``.
+
+    :meth:`.Model.find_optimal_parameters` is not interrupted by a
+    cancellation, which is honored once the fit is over.
+
+    """
+    progress(0, 0)
+    model.find_optimal_parameters(data_matrix)
+    progress(1, 2)
+    evaluations = model.evaluate(data_matrix)
+    progress(2, 2)
+    return model, evaluations
+
+
+def evaluate_model(
+    model: Model, data_matrix: DataMatrix, progress: Progress
+) -> dict[str, float]:
+    """Evaluate ``model``."""
+    progress(0, 0)
+    return model.evaluate(data_matrix)
+
+
+def compute_model_data(
+    model: Model,
+    populations: Collection[ImplementedPop],
+    emission_data_type: ImplementedEmissionData,
+    energies: NDArray[np.float64],
+    angles: NDArray[np.float64],
+    progress: Progress,
+) -> dict[ImplementedPop, pd.DataFrame]:
+    """Compute the modelled data to plot, for every population.
+
+    Populations without modelled data are skipped. The result is drawn with
+    :meth:`.Model.plot_data`.
+
+    """
+    to_plot = {}
+    for i, population in enumerate(populations):
+        progress(i, len(populations))
+        data = model.get_data(
+            population=population,
+            emission_data_type=emission_data_type,
+            energy=energies,
+            theta=angles,
+        )
+        if data is None:
+            logging.info(
+                f"No modelled data found for {population = } and "
+                f"{emission_data_type = }. Skipping this plot."
+            )
+            continue
+        to_plot[population] = data
+    progress(len(populations), len(populations))
+    return to_plot
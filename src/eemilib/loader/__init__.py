@@ -1,6 +1,14 @@
 """Define objects to load the different formats of electron emission files."""
 
-from .deesse_loader import DeesseLoader
-from .pandas_loader import PandasLoader
+from typing import TYPE_CHECKING
 
-__all__ = ["DeesseLoader", "PandasLoader"]
+from eemilib.util.lazy import attach
+
+if TYPE_CHECKING:
+    from .deesse_loader import DeesseLoader
+    from .pandas_loader import PandasLoader
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {"DeesseLoader": ".deesse_loader", "PandasLoader": ".pandas_loader"},
+)
@@ -0,0 +1,203 @@
+"""Define an on-disk cache for the data parsed by :class:`.Loader`.
+
+Parsed data is pickled in a cache directory. Entries are keyed on the loader
+class, the loading method, the loader settings (eg ``sep``, ``comment``), the
+method arguments, and the path, modification time and size of every loaded
+file. Hence, an entry is never reused after its file was modified.
+
+When the total size of the cache exceeds a cap, least recently used entries
+are removed.
+
+"""
+
+import functools
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from collections.abc import Callable, Collection
+from pathlib import Path
+from typing import Any
+
+#: Increment this when the format of cached objects changes.
+CACHE_VERSION = 1
+
+
+def default_cache_directory() -> Path:
+    """Give the directory where the loaded files are cached.
+
+    It is ``$EEMILIB_CACHE_DIR`` if this environment variable is set, or
+    ``$XDG_CACHE_HOME/eemilib/loader``, where ``$XDG_CACHE_HOME`` defaults to
+    :file:`~/.cache`.
+
+    """
+    if directory := os.environ.get("EEMILIB_CACHE_DIR"):
+        return Path(directory)
+    xdg_cache = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(xdg_cache) / "eemilib" / "loader"
+
+
+class LoaderCache:
+    """Store parsed files on disk, with LRU eviction and a size cap."""
+
+    suffix = ".pkl"
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        max_size: int = 256 * 1024**2,
+    ) -> None:
+        """Set the cache directory and its maximum size.
+
+        Parameters
+        ----------
+        directory :
+            Where cached objects are stored. The default is given by
+            :func:`default_cache_directory`.
+        max_size :
+            Maximum total size of the cached objects in bytes.
+
+        """
+        self.directory = (
+            Path(directory)
+            if directory is not None
+            else default_cache_directory()
+        )
+        self.max_size = max_size
+
+    def key(
+        self,
+        loader: Any,
+        method_name: str,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> str:
+        """Compute the cache key of a loading call.
+
+        Raises
+        ------
+        OSError
+            If one of the files to load does not exist.
+
+        """
+        signature = (
+            CACHE_VERSION,
+            type(loader).__module__,
+            type(loader).__qualname__,
+            method_name,
+            _settings(loader),
+            tuple(_file_signature(arg) for arg in args),
+            tuple(
+                (name, _file_signature(value))
+                for name, value in sorted(kwargs.items())
+            ),
+        )
+        return hashlib.sha1(repr(signature).encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        """Give path of the file corresponding to ``key``."""
+        return self.directory / f"{key}{self.suffix}"
+
+    def get(self, key: str) -> Any | None:
+        """Load the object stored under ``key``, if any."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                obj = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError) as error:
+            logging.warning(f"Removing corrupted cache file {path}: {error}")
+            path.unlink(missing_ok=True)
+            return None
+        os.utime(path)
+        return obj
+
+    def set(self, key: str, obj: Any) -> None:
+        """Store ``obj`` under ``key``, then evict old entries if needed."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=self.directory, suffix=".tmp", delete=False
+        ) as file:
+            pickle.dump(obj, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(file.name, self._path(key))
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove least recently used entries until size is under the cap."""
+        entries = []
+        for path in self.directory.glob(f"*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        for path in self.directory.glob(f"*{self.suffix}"):
+            path.unlink(missing_ok=True)
+
+
+def cached[T](method: Callable[..., T]) -> Callable[..., T]:
+    """Cache the output of a :class:`.Loader` method.
+
+    Nothing is cached if the ``cache`` attribute of the loader is ``None``.
+
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs) -> T:
+        cache: LoaderCache | None = getattr(self, "cache", None)
+        if cache is None:
+            return method(self, *args, **kwargs)
+
+        try:
+            key = cache.key(self, method.__name__, args, kwargs)
+        except OSError:
+            # Let the loader raise a meaningful error
+            return method(self, *args, **kwargs)
+
+        obj = cache.get(key)
+        if obj is not None:
+            logging.debug(f"Loaded {args} from cache.")
+            return obj
+
+        obj = method(self, *args, **kwargs)
+        try:
+            cache.set(key, obj)
+        except (OSError, pickle.PicklingError) as error:
+            logging.warning(f"Could not cache {args}: {error}")
+        return obj
+
+    return wrapper
+
+
+def _settings(loader: Any) -> tuple[tuple[str, Any], ...]:
+    """Give the loader attributes that may change how files are parsed."""
+    return tuple(
+        (name, value)
+        for name, value in sorted(vars(loader).items())
+        if name not in ("cache", "doc_url")
+        and isinstance(value, str | int | float | bool | None)
+    )
+
+
+def _file_signature(arg: Any) -> Any:
+    """Give path, mtime and size for paths, ``arg`` otherwise."""
+    if isinstance(arg, str | Path) and os.path.isfile(arg):
+        stat = os.stat(arg)
+        return (str(Path(arg).resolve()), stat.st_mtime_ns, stat.st_size)
+    if isinstance(arg, Path):
+        raise FileNotFoundError(arg)
+    if isinstance(arg, Collection) and not isinstance(arg, str):
+        return tuple(_file_signature(element) for element in arg)
+    return arg
@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Any
 
 import pandas as pd
+from eemilib.loader.cache import LoaderCache, cached
 from eemilib.loader.loader import Loader
 from eemilib.util.constants import col_energy, col_normal
 
@@ -12,15 +13,16 @@ from eemilib.util.constants import col_energy, col_normal
 class DeesseLoader(Loader):
     """Define the loader."""
 
-    def __init__(self) -> None:
+    def __init__(self, cache: LoaderCache | None = None) -> None:
         """Raise an error for now.
 
         Ideally, this loader should detect correct input and columns. But it is
         not for now.
 
         """
-        super().__init__()
+        super().__init__(cache=cache)
 
+    @cached
     def load_emission_yield(self, *filepath: str | Path) -> pd.DataFrame:
         """Load and format the given emission yield files.
 
@@ -73,6 +75,7 @@ class DeesseLoader(Loader):
     def load_emission_angle_distribution(self, *args) -> Any:
         raise NotImplementedError
 
+    @cached
     def load_emission_energy_distribution(
         self,
         filepath: str | Path,
@@ -5,6 +5,7 @@ from collections.abc import Collection
 from pathlib import Path
 
 import pandas as pd
+from eemilib.loader.cache import LoaderCache
 from eemilib.util.helper import documentation_url
 
 paths = Path | str
@@ -13,9 +14,20 @@ paths = Path | str
 class Loader(ABC):
     """Define the base class for loading various electron emission files."""
 
-    def __init__(self) -> None:
-        """Instantiate the object."""
+    def __init__(self, cache: LoaderCache | None = None) -> None:
+        """Instantiate the object.
+
+        Parameters
+        ----------
+        cache :
+            If provided, parsed files are stored in this on-disk cache and
+            reused as long as the files are not modified.
+
+        """
         self.doc_url = documentation_url(self)
+        #: On-disk cache for parsed files. Used by the methods decorated with
+        #: :func:`.cache.cached`.
+        self.cache = cache
         #: Column separator. Not mandatory, but must be called ``sep`` in order
         #: to be recognized by the Parameters in the GUI.
         self.sep: str
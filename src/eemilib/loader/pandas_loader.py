@@ -11,19 +11,26 @@ from pathlib import Path
 from typing import Any
 
 import pandas as pd
-from eemilib.loader.helper import read_comments, read_header
+from eemilib.loader.cache import LoaderCache, cached
+from eemilib.loader.helper import read_commented_csv
 from eemilib.loader.loader import Loader
 
 
 class PandasLoader(Loader):
     """Define the pandas loader."""
 
-    def __init__(self, sep: str = ",", comment: str = "#") -> None:
+    def __init__(
+        self,
+        sep: str = ",",
+        comment: str = "#",
+        cache: LoaderCache | None = None,
+    ) -> None:
         """Init object."""
-        super().__init__()
+        super().__init__(cache=cache)
         self.sep = sep
         self.comment = comment
 
+    @cached
     def load_emission_yield(
         self,
         filepath: str | Path,
@@ -73,20 +80,14 @@ class PandasLoader(Loader):
             sep = self.sep
         if comment is None:
             comment = self.comment
-        header, n_comments = read_header(filepath, sep, comment)
-        df = pd.read_csv(
-            filepath,
-            comment=comment,
-            sep=sep,
-            names=header,
-            skiprows=n_comments + 1,
-        )
+        df, _ = read_commented_csv(filepath, sep, comment)
         logging.info(f"Successfully loaded emission yield file(s) {filepath}")
         return df
 
     def load_emission_angle_distribution(self, *args) -> Any:
         raise NotImplementedError
 
+    @cached
     def load_emission_energy_distribution(
         self,
         filepath: str | Path,
@@ -144,14 +145,7 @@ class PandasLoader(Loader):
             sep = self.sep
         if comment is None:
             comment = self.comment
-        header, n_comments = read_header(filepath, sep, comment)
-        df = pd.read_csv(
-            filepath,
-            comment=comment,
-            sep=sep,
-            names=header,
-            skiprows=n_comments + 1,
-        )
+        df, comments = read_commented_csv(filepath, sep, comment)
         if len(df.columns) != 2:
             raise RuntimeError(
                 f"Error loading {filepath}. "
@@ -159,8 +153,6 @@ class PandasLoader(Loader):
                 f"character. File was read as:\n{df}"
             )
 
-        comments = read_comments(filepath, comment=comment)
-
         if len(comments) < 2:
             logging.error(
                 f"Error loading {filepath}. "
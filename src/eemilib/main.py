@@ -7,10 +7,12 @@ from eemilib.emission_data.data_matrix import DataMatrix
 from eemilib.loader.pandas_loader import PandasLoader
 from eemilib.model.vaughan import Vaughan
 from eemilib.plotter.pandas import PandasPlotter
+from eemilib.util.log_manager import set_up_logging
 
 
 def main() -> None:
     """Define the simple basic workflow to adapt as GUI."""
+    set_up_logging("EEmiLib")
     filepath = Path("../../data/example_copper/measured_TEEY_Cu_1_eroded.txt")
     filepaths = (filepath,)
 
@@ -1,9 +1,30 @@
-"""Define the electron emission models."""
+"""Define the electron emission models.
 
-from .chung_and_everhart import ChungEverhart
-from .dionne import Dionne
-from .maxwellian import Maxwellian
-from .sombrin import Sombrin
-from .vaughan import Vaughan
+Models are imported on first access, so that importing a single model does
+not import the others.
 
-__all__ = ["ChungEverhart", "Dionne", "Maxwellian", "Sombrin", "Vaughan"]
+"""
+
+from typing import TYPE_CHECKING
+
+from eemilib.util.lazy import attach
+
+if TYPE_CHECKING:
+    from .chung_and_everhart import ChungEverhart
+    from .dionne import Dionne
+    from .lookup_table import LookupTable
+    from .maxwellian import Maxwellian
+    from .sombrin import Sombrin
+    from .vaughan import Vaughan
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "ChungEverhart": ".chung_and_everhart",
+        "Dionne": ".dionne",
+        "LookupTable": ".lookup_table",
+        "Maxwellian": ".maxwellian",
+        "Sombrin": ".sombrin",
+        "Vaughan": ".vaughan",
+    },
+)
@@ -7,11 +7,16 @@ You will need to provide emission energy distribution measurements.
 from typing import Any, TypedDict
 
 import numpy as np
-import pandas as pd
 from eemilib.core.model_config import ModelConfig
 from eemilib.emission_data.data_matrix import DataMatrix
+from eemilib.model.fitting import (
+    cached_fit,
+    multi_start_least_squares,
+    warm_start,
+)
 from eemilib.model.model import Model
 from eemilib.model.parameter import Parameter
+from eemilib.model.uncertainty import covariance_from_least_squares
 from eemilib.util.constants import (
     ImplementedEmissionData,
     ImplementedPop,
@@ -20,7 +25,7 @@ from eemilib.util.constants import (
 )
 from eemilib.util.markdown import NORM, W_F
 from numpy.typing import NDArray
-from scipy.optimize import Bounds, least_squares
+from scipy.optimize import Bounds
 
 
 class ChungEverhartParameters(TypedDict):
@@ -57,6 +62,7 @@ class ChungEverhart(Model):
             "description": "Distribution re-normalization constant.",
         },
     }
+    kernel_parameters = ("W_f", "norm")
 
     def __init__(
         self, parameters_values: dict[str, Any] | None = None
@@ -80,8 +86,10 @@ class ChungEverhart(Model):
             self.set_parameters_values(parameters_values)
 
         self._func = chung_everhart_func
+        self._kernel = chung_everhart_kernel
+        self._scalar_kernel = chung_everhart_scalar_kernel
 
-    def get_data(
+    def get_array(
         self,
         population: ImplementedPop,
         emission_data_type: ImplementedEmissionData,
@@ -89,14 +97,17 @@ class ChungEverhart(Model):
         theta: NDArray[np.float64],
         *args,
         **kwargs,
-    ) -> pd.DataFrame | None:
+    ) -> (
+        tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]
+        | None
+    ):
         """Return desired data according to current model.
 
-        Will return a dataframe only if the |SEs| energy distribution is asked.
+        Will return arrays only if the |SEs| energy distribution is asked.
 
         """
         if population != "SE" or emission_data_type != "Emission Energy":
-            return super().get_data(
+            return super().get_array(
                 population=population,
                 emission_data_type=emission_data_type,
                 energy=energy,
@@ -104,19 +115,35 @@ class ChungEverhart(Model):
                 *args,
                 **kwargs,
             )
-        out = np.zeros(len(energy))
-        for i, ene in enumerate(energy):
-            out[i] = self._func(
-                ene, W_f=self.parameters["W_f"], norm=self.parameters["norm"]
-            )
-
-        out_dict = {col_normal: out, col_energy: energy}
-        return pd.DataFrame(out_dict)
+        energy = np.asarray(energy, dtype=np.float64)
+        out = self._func(
+            energy,
+            W_f=self.parameters["W_f"],
+            norm=self.parameters["norm"],
+        )
+        return energy, np.zeros(1), out[:, np.newaxis]
 
+    @cached_fit
     def find_optimal_parameters(
-        self, data_matrix: DataMatrix, **kwargs
+        self,
+        data_matrix: DataMatrix,
+        n_starts: int = 0,
+        max_workers: int | None = 1,
+        **kwargs,
     ) -> None:
-        """Fit model parameters on measurements."""
+        """Fit model parameters on measurements.
+
+        Parameters
+        ----------
+        data_matrix :
+            Holds the measured data.
+        n_starts :
+            Number of additional starting points for a multi-start fit. By
+            default, a single fit starts from the current parameter value.
+        max_workers :
+            Number of processes running the multi-start fits.
+
+        """
         if not data_matrix.has_all_mandatory_files(self.model_config):
             raise ValueError("Files are not all provided.")
 
@@ -125,19 +152,31 @@ class ChungEverhart(Model):
 
         param = self.parameters["W_f"]
 
-        lsq = least_squares(
+        lsq = multi_start_least_squares(
             fun=_residue,
-            x0=param.value,
+            x0=warm_start([param]),
+            jac=_jacobian,
             bounds=Bounds(param.lower_bound, param.upper_bound),
+            n_starts=n_starts,
+            max_workers=max_workers,
             args=(
                 distribution.data[col_energy].to_numpy(),
                 distribution.data[col_normal].to_numpy(),
             ),
         )
-        w_f = lsq.x[0]
+        values = {"W_f": float(lsq.x[0])}
         self.set_parameters_values(
-            {"W_f": w_f, "norm": _chung_everhart_norm(w_f)}
+            values | self._derived_parameters_values(values)
         )
+        self.covariance = covariance_from_least_squares(lsq, {"W_f": param})
+
+    def _derived_parameters_values(
+        self, values: dict[str, float]
+    ) -> dict[str, float]:
+        """Give the norm matching the ``W_f`` in ``values``."""
+        if "W_f" not in values or "norm" in values:
+            return {}
+        return {"norm": _chung_everhart_norm(values["W_f"])}
 
 
 def _chung_everhart_norm(w_f: float) -> float:
@@ -159,6 +198,35 @@ def chung_everhart_func(
     return norm_value * ene / (ene + w_f_value) ** 4
 
 
+def chung_everhart_kernel(
+    ene: NDArray[np.float64],
+    the: NDArray[np.float64],
+    parameters: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """Compute the energy distribution with parameters as a flat vector.
+
+    Parameters
+    ----------
+    ene :
+        |SEs| energies in :unit:`eV`.
+    the :
+        |PEs| incidence angles in :unit:`deg`. Not used.
+    parameters :
+        Work function in :unit:`eV` and norm.
+
+    """
+    w_f = parameters[0]
+    norm = parameters[1]
+    return norm * ene / (ene + w_f) ** 4
+
+
+def chung_everhart_scalar_kernel(
+    ene: float, the: float, parameters: NDArray[np.float64]
+) -> float:
+    """Evaluate :func:`chung_everhart_kernel` at a single energy."""
+    return parameters[1] * ene / (ene + parameters[0]) ** 4
+
+
 def _residue(
     w_f: float, ene: NDArray[np.float64], measured: NDArray[np.float64]
 ) -> NDArray[np.float64]:
@@ -166,6 +234,28 @@ def _residue(
     return chung_everhart_func(ene, w_f) - measured
 
 
+def _jacobian(
+    w_f: float, ene: NDArray[np.float64], measured: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    r"""Compute the Jacobian of :func:`_residue` w.r.t. work function.
+
+    As the norm is set by :func:`_chung_everhart_norm`, the distribution is
+    proportional to :math:`W_f^3 / (E + W_f)^4`, hence:
+
+    .. math::
+       \frac{\partial f}{\partial W_f} = f \left(\frac{3}{W_f}
+       - \frac{4}{E + W_f}\right)
+
+    Returns
+    -------
+        Array of shape ``(n_energy, 1)``.
+
+    """
+    w_f = float(np.squeeze(w_f))
+    modelled = chung_everhart_func(ene, w_f)
+    return (modelled * (3.0 / w_f - 4.0 / (ene + w_f)))[:, np.newaxis]
+
+
 # Append dynamically generated docs to the module docstring
 if __doc__ is None:
     __doc__ = ""
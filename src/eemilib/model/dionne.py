@@ -16,15 +16,21 @@ Dionne1975`.
 #         "before proceeding to the fit."
 #     )
 
+import math
 from functools import partial
 from typing import Any, Literal, TypedDict
 
 import numpy as np
-import pandas as pd
 from eemilib.core.model_config import ModelConfig
 from eemilib.emission_data.data_matrix import DataMatrix
+from eemilib.model.fitting import (
+    cached_fit,
+    multi_start_least_squares,
+    warm_start,
+)
 from eemilib.model.model import Model
 from eemilib.model.parameter import Parameter
+from eemilib.model.uncertainty import covariance_from_least_squares
 from eemilib.util.constants import (
     ImplementedEmissionData,
     ImplementedPop,
@@ -39,7 +45,7 @@ from eemilib.util.markdown import (
     POWER_LAW_SCALE,
 )
 from numpy.typing import NDArray
-from scipy.optimize import Bounds, least_squares
+from scipy.optimize import Bounds
 
 #: Models for the energy loss of |PEs| in the material. See
 #: :func:`.dionne.range_func` for more information.
@@ -113,6 +119,13 @@ class Dionne(Model):
             "description": "Exponent in the power law energy loss model.",
         },
     }
+    kernel_parameters = (
+        "excitation_energy",
+        "diffusion_length",
+        "escape_probability",
+        "power_law_scale",
+        "power_law_exponent",
+    )
 
     def __init__(
         self,
@@ -143,8 +156,10 @@ class Dionne(Model):
             self.set_parameters_values(parameters_values)
 
         self._func = dionne_func
+        self._kernel = dionne_kernel
+        self._scalar_kernel = dionne_scalar_kernel
 
-    def get_data(
+    def get_array(
         self,
         population: ImplementedPop,
         emission_data_type: ImplementedEmissionData,
@@ -152,14 +167,17 @@ class Dionne(Model):
         theta: NDArray[np.float64],
         *args,
         **kwargs,
-    ) -> pd.DataFrame | None:
+    ) -> (
+        tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]
+        | None
+    ):
         """Return desired data according to current model.
 
-        Will return a dataframe only if the |TEEY| is asked.
+        Will return arrays only if the |TEEY| is asked.
 
         """
         if population != "SE" or emission_data_type != "Emission Yield":
-            return super().get_data(
+            return super().get_array(
                 population=population,
                 emission_data_type=emission_data_type,
                 energy=energy,
@@ -167,18 +185,31 @@ class Dionne(Model):
                 *args,
                 **kwargs,
             )
-        out = np.zeros(len(energy))
-
-        for i, ene in enumerate(energy):
-            out[i] = self._func(ene, **self.parameters)
-
-        out_dict = {col_normal: out, col_energy: energy}
-        return pd.DataFrame(out_dict)
+        energy = np.asarray(energy, dtype=np.float64)
+        out = self._func(energy, **self.parameters)
+        return energy, np.zeros(1), out[:, np.newaxis]
 
+    @cached_fit
     def find_optimal_parameters(
-        self, data_matrix: DataMatrix, **kwargs
+        self,
+        data_matrix: DataMatrix,
+        n_starts: int = 0,
+        max_workers: int | None = 1,
+        **kwargs,
     ) -> None:
-        """Extract main |SEEY| curve parameters from measure."""
+        """Extract main |SEEY| curve parameters from measure.
+
+        Parameters
+        ----------
+        data_matrix :
+            Holds the measured data.
+        n_starts :
+            Number of additional starting points for a multi-start fit. By
+            default, a single fit starts from the current parameter values.
+        max_workers :
+            Number of processes running the multi-start fits.
+
+        """
         if not data_matrix.has_all_mandatory_files(self.model_config):
             raise ValueError("Files are not all provided.")
 
@@ -194,17 +225,20 @@ class Dionne(Model):
             "power_law_exponent",
         )
         params = [self.parameters[k] for k in keys]
-        x0 = [param.value for param in params]
+        x0 = warm_start(params)
         bounds = Bounds(
             np.array([param.lower_bound for param in params]),
             np.array([param.upper_bound for param in params]),
         )
         fun = partial(_residue, energy_loss_model=self._energy_loss_model)
 
-        lsq = least_squares(
+        lsq = multi_start_least_squares(
             fun=_residue,
             x0=x0,
+            jac=_jacobian,
             bounds=bounds,
+            n_starts=n_starts,
+            max_workers=max_workers,
             args=(
                 emission_yield.data[col_energy].to_numpy(),
                 emission_yield.data[col_normal].to_numpy(),
@@ -213,6 +247,9 @@ class Dionne(Model):
 
         optimized_values = {k: v for k, v in zip(keys, lsq.x, strict=True)}
         self.set_parameters_values(optimized_values)
+        self.covariance = covariance_from_least_squares(
+            lsq, dict(zip(keys, params))
+        )
 
     def evaluate(self, data_matrix: DataMatrix) -> dict[str, float]:
         """Evaluate the quality of the model using Fil criterions.
@@ -262,6 +299,53 @@ def dionne_func(
     return G * T * S
 
 
+def dionne_kernel(
+    ene: NDArray[np.float64],
+    the: NDArray[np.float64],
+    parameters: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    r"""Compute the |SEEY| with parameters given as a flat vector.
+
+    This is :func:`dionne_func` with the power law energy loss model.
+
+    Parameters
+    ----------
+    ene :
+        |PEs| energies in :unit:`eV`.
+    the :
+        |PEs| incidence angles in :unit:`deg`. Not used.
+    parameters :
+        :math:`\xi`, :math:`d`, :math:`S`, :math:`A` and :math:`n`, in the
+        order of :attr:`.Dionne.kernel_parameters`.
+
+    """
+    excitation_energy = parameters[0]
+    diffusion_length = parameters[1]
+    escape_probability = parameters[2]
+    power_law_scale = parameters[3]
+    power_law_exponent = parameters[4]
+
+    R = ene**power_law_exponent / (power_law_scale * power_law_exponent)
+    valid = np.abs(R) > 1e-12
+    G = np.where(
+        valid, ene / (np.where(valid, R, 1.0) * excitation_energy), 0.0
+    )
+    T = diffusion_length * (1.0 - np.exp(-R / diffusion_length))
+    return G * T * escape_probability
+
+
+def dionne_scalar_kernel(
+    ene: float, the: float, parameters: NDArray[np.float64]
+) -> float:
+    """Compute the |SEEY| of a single |PE|, see :func:`dionne_kernel`."""
+    R = ene ** parameters[4] / (parameters[3] * parameters[4])
+    if abs(R) <= 1e-12:
+        return 0.0
+    G = ene / (R * parameters[0])
+    T = parameters[1] * (1.0 - math.exp(-R / parameters[1]))
+    return G * T * parameters[2]
+
+
 def range_func(
     ene: float | NDArray[np.float64],
     energy_loss_model: EnergyLossModel = "Power law",
@@ -427,6 +511,62 @@ def _residue(
     return modelled - measured
 
 
+def _jacobian(
+    x: tuple[float, float, float, float, float],
+    ene: NDArray[np.float64],
+    measured: NDArray[np.float64],
+    atol: float = 1e-12,
+) -> NDArray[np.float64]:
+    r"""Compute the Jacobian of :func:`_residue`, power law energy loss.
+
+    With :math:`\delta = G \cdot T \cdot S`, :math:`G = E / (\xi R)`,
+    :math:`T = d(1 - \mathrm{e}^{-R/d})` and :math:`R = E^n / (A n)`:
+
+    .. math::
+       \frac{\partial \delta}{\partial \xi} = -\frac{\delta}{\xi}
+       \qquad
+       \frac{\partial \delta}{\partial d} = G S \left(
+       1 - \mathrm{e}^{-R/d} - \frac{R}{d}\mathrm{e}^{-R/d}\right)
+       \qquad
+       \frac{\partial \delta}{\partial S} = G T
+
+    .. math::
+       \frac{\partial \delta}{\partial R} = G S \left(
+       \mathrm{e}^{-R/d} - \frac{T}{R} \right)
+       \qquad
+       \frac{\partial R}{\partial A} = -\frac{R}{A}
+       \qquad
+       \frac{\partial R}{\partial n} = R \left(\ln E - \frac{1}{n}\right)
+
+    Where the range is null, the |SEEY| is null and so are its derivatives.
+
+    Returns
+    -------
+        Array of shape ``(n_energy, 5)``; columns are in the same order as
+        ``x``.
+
+    """
+    xi, d, s, a, n = x
+    ene = np.asarray(ene, dtype=np.float64)
+    jac = np.zeros((ene.size, 5), dtype=np.float64)
+
+    R = range_func(ene, power_law_scale=a, power_law_exponent=n)
+    valid = ~np.isclose(R, 0, atol=atol)
+    ene, R = ene[valid], R[valid]
+
+    exp = np.exp(-R / d)
+    G = ene / (R * xi)
+    T = d * (1.0 - exp)
+    d_delta_d_R = G * s * (exp - T / R)
+
+    jac[valid, 0] = -G * T * s / xi
+    jac[valid, 1] = G * s * (1.0 - exp - R / d * exp)
+    jac[valid, 2] = G * T
+    jac[valid, 3] = -d_delta_d_R * R / a
+    jac[valid, 4] = d_delta_d_R * R * (np.log(ene) - 1.0 / n)
+    return jac
+
+
 # Append dynamically generated docs to the module docstring
 if __doc__ is None:
     __doc__ = ""
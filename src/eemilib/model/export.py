@@ -0,0 +1,345 @@
+"""Export tabulated models to a binary file, read them without copy.
+
+Simulation codes (SPARK3D, CST, Particle-In-Cell codes) need the modelled
+|TEEY| or energy distributions as tables. :func:`export_model` writes all the
+data a model can compute in a single uncompressed ``.npz`` file:
+
+- For every modelled (population, emission data type): the energies, the
+  angles and the ``(n_energy, n_theta)`` values.
+- A JSON metadata entry holding the model name, its implementation (eg
+  ``"SPARK3D"`` for :class:`.Vaughan`), its parameters and provenance
+  information.
+
+Any code can read this file with :func:`numpy.load`. In addition,
+:func:`load_exported_model` maps the arrays in memory directly from the file,
+without parsing nor copying them.
+
+Tables too large to be held in memory can be written chunk by chunk to a
+``.npy`` file with :func:`write_chunks_to_npy`.
+
+"""
+
+import datetime
+import importlib.metadata
+import json
+import math
+import zipfile
+from collections.abc import Iterable
+from itertools import product
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from eemilib.model.lookup_table import LookupTable
+from numpy.typing import DTypeLike, NDArray
+
+#: Increment this when the layout of exported files changes.
+FORMAT_VERSION = 1
+#: Name of the member holding the JSON metadata.
+METADATA_KEY = "metadata"
+
+#: Key of an exported table: population, emission data type.
+TableKey = tuple[str, str]
+#: Energies in :unit:`eV`, angles in :unit:`deg`, values.
+Table = tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.floating]]
+
+
+def export_model(
+    model: Any,
+    filepath: str | Path,
+    energy_grid: NDArray[np.float64],
+    angle_grid: NDArray[np.float64],
+    dtype: DTypeLike = np.float64,
+    provenance: dict[str, Any] | None = None,
+) -> Path:
+    """Tabulate all the data computed by ``model``, save it to ``filepath``.
+
+    Parameters
+    ----------
+    model :
+        Fitted :class:`.Model`.
+    filepath :
+        Where the tables are saved. The ``.npz`` suffix is added if missing.
+    energy_grid :
+        |PEs| energies in :unit:`eV`.
+    angle_grid :
+        Incidence angles in :unit:`deg`. Ignored by models that do not
+        depend on the incidence angle.
+    dtype :
+        Type of the saved values.
+    provenance :
+        Additional information saved in the metadata, eg the measurement
+        files or the sample name. Must be JSON-serializable.
+
+    Returns
+    -------
+    Path
+        Path to the created file.
+
+    """
+    filepath = Path(filepath).with_suffix(".npz")
+    arrays: dict[str, NDArray] = {}
+    tables: list[dict[str, str]] = []
+    for population, emission_data_type in product(
+        model.populations, model.emission_data_types
+    ):
+        out = model.get_array(
+            population, emission_data_type, energy_grid, angle_grid
+        )
+        if out is None:
+            continue
+        prefix = _member_prefix(population, emission_data_type)
+        energy, theta, values = out
+        arrays[f"{prefix}energy"] = energy
+        arrays[f"{prefix}theta"] = theta
+        arrays[f"{prefix}values"] = np.ascontiguousarray(values, dtype=dtype)
+        tables.append(
+            {
+                "population": population,
+                "emission_data_type": emission_data_type,
+                "prefix": prefix,
+            }
+        )
+    if not tables:
+        raise ValueError(f"{model} did not compute any data.")
+
+    metadata = {
+        "format_version": FORMAT_VERSION,
+        "model": model.__class__.__name__,
+        "implementation": getattr(model, "current_implementation", None),
+        "parameters": {
+            name: {
+                "value": float(param.value),
+                "unit": param.unit,
+                "is_locked": param.is_locked,
+            }
+            for name, param in model.parameters.items()
+        },
+        "tables": tables,
+        "provenance": _provenance() | (provenance or {}),
+    }
+    arrays[METADATA_KEY] = np.array(json.dumps(metadata))
+
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    np.savez(filepath, **arrays)
+    return filepath
+
+
+class ExportedModel:
+    """Hold the tables and metadata read from an exported file."""
+
+    def __init__(
+        self, metadata: dict[str, Any], tables: dict[TableKey, Table]
+    ) -> None:
+        """Store the metadata and the tables."""
+        self.metadata = metadata
+        self.tables = tables
+
+    def __repr__(self) -> str:
+        """Give model name, implementation and available tables."""
+        return (
+            f"{self.__class__.__name__}({self.model}, implementation="
+            f"{self.implementation}, tables={list(self.tables)})"
+        )
+
+    def __getitem__(self, key: TableKey) -> Table:
+        """Give energies, angles and values of the table ``key``."""
+        return self.tables[key]
+
+    @property
+    def model(self) -> str:
+        """Give the name of the exported model."""
+        return self.metadata["model"]
+
+    @property
+    def implementation(self) -> str | None:
+        """Give the implementation of the exported model, if relevant."""
+        return self.metadata["implementation"]
+
+    @property
+    def parameters(self) -> dict[str, float]:
+        """Give the values of the model parameters."""
+        return {
+            name: param["value"]
+            for name, param in self.metadata["parameters"].items()
+        }
+
+    def lookup_table(self, key: TableKey) -> LookupTable:
+        """Create a :class:`.LookupTable` from table ``key``.
+
+        The values are not copied. The table must be evenly spaced, see
+        :class:`.LookupTable`.
+
+        """
+        energy, theta, values = self.tables[key]
+        return LookupTable(
+            energy,
+            theta,
+            values,
+            dtype=values.dtype,
+            metadata=dict(self.metadata),
+        )
+
+
+def load_exported_model(
+    filepath: str | Path, mmap: bool = True
+) -> ExportedModel:
+    """Read a file created by :func:`export_model`.
+
+    Parameters
+    ----------
+    filepath :
+        Path to the ``.npz`` file.
+    mmap :
+        If True, arrays are read-only views on the file, mapped in memory.
+        Otherwise, they are loaded in memory with :func:`numpy.load`.
+
+    """
+    filepath = Path(filepath)
+    arrays = _memmap_npz(filepath) if mmap else _load_npz(filepath)
+    metadata = json.loads(str(arrays.pop(METADATA_KEY)))
+    if metadata["format_version"] > FORMAT_VERSION:
+        raise ValueError(
+            f"{filepath} was created with a more recent version of EEmiLib."
+        )
+
+    tables = {}
+    for table in metadata["tables"]:
+        prefix = table["prefix"]
+        tables[(table["population"], table["emission_data_type"])] = (
+            arrays[f"{prefix}energy"],
+            arrays[f"{prefix}theta"],
+            arrays[f"{prefix}values"],
+        )
+    return ExportedModel(metadata, tables)
+
+
+def write_chunks_to_npy(
+    chunks: Iterable[Table],
+    filepath: str | Path,
+    n_energy: int,
+    dtype: DTypeLike = np.float64,
+) -> np.memmap:
+    """Write chunks of modelled data to a ``.npy`` file, mapped in memory.
+
+    .. code-block:: python
+
+        values = write_chunks_to_npy(
+            model.iter_array("all", "Emission Yield", energy, theta),
+            "teey.npy",
+            n_energy=energy.size,
+        )
+
+    Parameters
+    ----------
+    chunks :
+        Chunks of data, as given by :meth:`.Model.iter_array`.
+    filepath :
+        Where the ``(n_energy, n_theta)`` values are written. The file can
+        be read back with ``np.load(filepath, mmap_mode="r")``.
+    n_energy :
+        Total number of energies.
+    dtype :
+        Type of the saved values.
+
+    Returns
+    -------
+    np.memmap
+        Written values, mapped in memory.
+
+    Raises
+    ------
+    ValueError
+        If ``chunks`` is empty, or if the number of energies does not match
+        ``n_energy``.
+
+    """
+    values: np.memmap | None = None
+    row = 0
+    for _, theta, chunk in chunks:
+        if values is None:
+            values = np.lib.format.open_memmap(
+                filepath, mode="w+", dtype=dtype, shape=(n_energy, theta.size)
+            )
+        values[row : row + chunk.shape[0]] = chunk
+        row += chunk.shape[0]
+
+    if values is None:
+        raise ValueError("No data was given.")
+    values.flush()
+    if row != n_energy:
+        raise ValueError(f"Received {row} energies instead of {n_energy}.")
+    return values
+
+
+def _member_prefix(population: str, emission_data_type: str) -> str:
+    """Give the prefix of the arrays of a table, eg ``all_emission_yield_``."""
+    return f"{population}_{emission_data_type.lower().replace(' ', '_')}_"
+
+
+def _provenance() -> dict[str, str]:
+    """Give versions and creation date."""
+    try:
+        version = importlib.metadata.version("eemilib")
+    except importlib.metadata.PackageNotFoundError:
+        version = "unknown"
+    return {
+        "eemilib_version": version,
+        "numpy_version": np.__version__,
+        "created": datetime.datetime.now(datetime.UTC).isoformat(),
+    }
+
+
+def _load_npz(filepath: Path) -> dict[str, NDArray]:
+    """Load all arrays of a ``.npz`` file in memory."""
+    with np.load(filepath) as npz:
+        return {name: npz[name] for name in npz.files}
+
+
+def _memmap_npz(filepath: Path) -> dict[str, NDArray]:
+    """Map all arrays of an uncompressed ``.npz`` file in memory.
+
+    Every member of the zip archive is a ``.npy`` file. As they are stored
+    without compression, their data can be mapped at its offset in the
+    archive.
+
+    """
+    arrays = {}
+    with zipfile.ZipFile(filepath) as archive, open(filepath, "rb") as file:
+        for info in archive.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(
+                    f"{info.filename} is compressed, use mmap=False."
+                )
+            # Local header: 30 bytes, then file name and extra field
+            file.seek(info.header_offset + 26)
+            name_length, extra_length = np.frombuffer(
+                file.read(4), dtype="<u2"
+            )
+            file.seek(info.header_offset + 30 + name_length + extra_length)
+
+            version = np.lib.format.read_magic(file)
+            read_header = (
+                np.lib.format.read_array_header_1_0
+                if version == (1, 0)
+                else np.lib.format.read_array_header_2_0
+            )
+            shape, fortran_order, dtype = read_header(file)
+            name = info.filename.removesuffix(".npy")
+            if dtype.hasobject:
+                raise ValueError(f"{name} holds Python objects.")
+            if math.prod(shape) <= 1:
+                # Scalars and empty arrays cannot be mapped
+                arrays[name] = np.fromfile(
+                    file, dtype=dtype, count=math.prod(shape)
+                ).reshape(shape)
+                continue
+            arrays[name] = np.memmap(
+                filepath,
+                dtype=dtype,
+                mode="r",
+                offset=file.tell(),
+                shape=shape,
+                order="F" if fortran_order else "C",
+            )
+    return arrays
@@ -0,0 +1,270 @@
+"""Define a fitting layer shared by the :class:`.Model` fitted with SciPy.
+
+It provides:
+
+- Warm-start: fits start from the current parameter values (last converged
+  ones after a first fit), clipped into the parameter bounds.
+- Multi-start: additional starting points are drawn within the bounds, and
+  the best fit is kept. Starts can run in parallel.
+- A cache of fit results, keyed by model class, implementation, locked
+  parameters state, fit arguments and a hash of the data content. Hence,
+  repeated fits on unchanged inputs are instant.
+
+"""
+
+import functools
+import hashlib
+import logging
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from eemilib.emission_data.data_matrix import DataMatrix
+from eemilib.model.parameter import Parameter
+from eemilib.model.uncertainty import Covariance
+from numpy.typing import NDArray
+from scipy.optimize import Bounds, OptimizeResult, least_squares
+
+#: Key of the :class:`FitCache`.
+FitKey = tuple[Hashable, ...]
+
+
+class FitCache:
+    """Store the results of previous fits, least recently used are dropped."""
+
+    def __init__(self, max_size: int = 128) -> None:
+        """Create an empty cache.
+
+        Parameters
+        ----------
+        max_size :
+            Maximum number of stored fit results.
+
+        """
+        self.max_size = max_size
+        self._results: OrderedDict[FitKey, dict[str, float]] = OrderedDict()
+        self._covariances: dict[FitKey, Covariance | None] = {}
+
+    def __len__(self) -> int:
+        """Give number of stored fit results."""
+        return len(self._results)
+
+    def get(self, key: FitKey) -> dict[str, float] | None:
+        """Give the parameter values stored under ``key``, if any."""
+        values = self._results.get(key)
+        if values is None:
+            return None
+        self._results.move_to_end(key)
+        return dict(values)
+
+    def get_covariance(self, key: FitKey) -> Covariance | None:
+        """Give the covariance of the parameters stored under ``key``."""
+        return self._covariances.get(key)
+
+    def set(
+        self,
+        key: FitKey,
+        values: dict[str, float],
+        covariance: Covariance | None = None,
+    ) -> None:
+        """Store parameter values and their covariance under ``key``."""
+        self._results[key] = dict(values)
+        self._covariances[key] = covariance
+        self._results.move_to_end(key)
+        while len(self._results) > self.max_size:
+            dropped, _ = self._results.popitem(last=False)
+            self._covariances.pop(dropped, None)
+
+    def clear(self) -> None:
+        """Remove all stored results."""
+        self._results.clear()
+        self._covariances.clear()
+
+
+#: Cache used by :func:`cached_fit`.
+FIT_CACHE = FitCache()
+
+
+def data_hash(data_matrix: DataMatrix) -> str:
+    """Hash the content of all the data stored in ``data_matrix``."""
+    digest = hashlib.sha1()
+    for emission_data in data_matrix.get_data():
+        digest.update(
+            f"{emission_data.population}{type(emission_data)}".encode()
+        )
+        digest.update(str(list(emission_data.data.columns)).encode())
+        digest.update(
+            pd.util.hash_pandas_object(emission_data.data, index=True)
+            .to_numpy()
+            .tobytes()
+        )
+    return digest.hexdigest()
+
+
+def fit_key(
+    model: Any,
+    data_matrix: DataMatrix,
+    fit_args: tuple[Any, ...] = (),
+    fit_kwargs: dict[str, Any] | None = None,
+) -> FitKey:
+    """Create the :class:`FitCache` key for ``model`` fitted on data.
+
+    Locked parameters are stored with their value, as they are not modified
+    by the fit. Bounds of free parameters are part of the key too, as well
+    as the other arguments of the fit (``n_starts``, ``seed``...).
+
+    """
+    parameters_state = tuple(
+        (
+            (name, True, param.value)
+            if param.is_locked
+            else (name, False, param.lower_bound, param.upper_bound)
+        )
+        for name, param in model.parameters.items()
+    )
+    return (
+        type(model).__module__,
+        type(model).__qualname__,
+        getattr(model, "current_implementation", None),
+        parameters_state,
+        data_hash(data_matrix),
+        tuple(fit_args),
+        tuple(sorted((fit_kwargs or {}).items())),
+    )
+
+
+def cached_fit(method: Callable[..., None]) -> Callable[..., None]:
+    """Cache results of a ``find_optimal_parameters`` method.
+
+    The decorated method accepts an additional ``use_cache`` keyword argument.
+    When it is ``True`` (default) and the same model was already fitted on
+    the same data, with the same locked parameters and the same fit
+    arguments, the stored values are set without fitting. The cache is
+    skipped when a fit argument is not hashable.
+
+    """
+
+    @functools.wraps(method)
+    def wrapper(
+        self, data_matrix: DataMatrix, *args, use_cache: bool = True, **kwargs
+    ) -> None:
+        if not use_cache:
+            return method(self, data_matrix, *args, **kwargs)
+
+        key = fit_key(self, data_matrix, args, kwargs)
+        try:
+            hash(key)
+        except TypeError:
+            return method(self, data_matrix, *args, **kwargs)
+        values = FIT_CACHE.get(key)
+        if values is not None:
+            logging.info("Data and model did not change, reusing last fit.")
+            self.set_parameters_values(values)
+            self.covariance = FIT_CACHE.get_covariance(key)
+            return
+
+        method(self, data_matrix, *args, **kwargs)
+        FIT_CACHE.set(
+            key,
+            {name: param.value for name, param in self.parameters.items()},
+            getattr(self, "covariance", None),
+        )
+
+    return wrapper
+
+
+def warm_start(parameters: list[Parameter]) -> NDArray[np.float64]:
+    """Give current values of ``parameters``, clipped into their bounds.
+
+    After a first fit, the current values are the last converged ones; they
+    are generally the best starting point for a new fit.
+
+    """
+    x0 = np.array([param.value for param in parameters], dtype=np.float64)
+    lower = np.array([param.lower_bound for param in parameters])
+    upper = np.array([param.upper_bound for param in parameters])
+    return np.clip(x0, lower, upper)
+
+
+def starting_points(
+    x0: NDArray[np.float64],
+    bounds: Bounds,
+    n_starts: int,
+    seed: int | None = None,
+) -> NDArray[np.float64]:
+    """Draw starting points for a multi-start fit.
+
+    Finite bounds are sampled uniformly. When a bound is infinite, the start
+    is drawn log-uniformly in a decade around ``x0``, and clipped into the
+    bounds.
+
+    Returns
+    -------
+    NDArray[np.float64]
+        Array of shape ``(n_starts + 1, n_parameters)``. First line is
+        ``x0``.
+
+    """
+    rng = np.random.default_rng(seed)
+    lower = np.broadcast_to(bounds.lb, x0.shape).astype(np.float64)
+    upper = np.broadcast_to(bounds.ub, x0.shape).astype(np.float64)
+    finite = np.isfinite(lower) & np.isfinite(upper)
+
+    uniform = rng.uniform(size=(n_starts, x0.size))
+    starts = np.where(
+        finite,
+        np.where(finite, lower, 0.0)
+        + uniform * np.where(finite, upper - lower, 0.0),
+        x0 * 10.0 ** (2.0 * uniform - 1.0),
+    )
+    starts = np.clip(starts, lower, upper)
+    return np.vstack((x0, starts))
+
+
+def multi_start_least_squares(
+    fun: Callable[..., NDArray[np.float64]],
+    x0: NDArray[np.float64],
+    bounds: Bounds,
+    args: tuple[Any, ...] = (),
+    jac: Callable[..., NDArray[np.float64]] | str = "2-point",
+    n_starts: int = 0,
+    max_workers: int | None = 1,
+    seed: int | None = None,
+) -> OptimizeResult:
+    """Run :func:`scipy.optimize.least_squares` from several starts.
+
+    Parameters
+    ----------
+    fun, x0, bounds, args, jac :
+        Passed to :func:`scipy.optimize.least_squares`. ``fun`` and ``jac``
+        must be picklable if ``max_workers`` is not 1.
+    n_starts :
+        Number of additional starting points, see :func:`starting_points`.
+        The default is a single fit starting from ``x0``.
+    max_workers :
+        Number of processes running the fits. If 1, fits are run
+        sequentially in current process.
+    seed :
+        Seed of the random generator drawing starting points.
+
+    Returns
+    -------
+    OptimizeResult
+        Result with the lowest cost.
+
+    """
+    starts = starting_points(np.atleast_1d(x0), bounds, n_starts, seed)
+    fit = functools.partial(
+        least_squares, fun, jac=jac, bounds=bounds, args=args
+    )
+    if n_starts == 0 or max_workers == 1:
+        results = list(map(fit, starts))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(fit, starts))
+
+    converged = [res for res in results if res.success] or results
+    return min(converged, key=lambda res: res.cost)
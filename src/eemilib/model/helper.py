@@ -0,0 +1,150 @@
+"""Define functions to extract some characteristics from modelled data.
+
+Contrary to :mod:`.emission_data.helper`, which works on sampled data, these
+functions work on the model itself. Crossover energies are found with a
+bracketing root-finding, maximum with a bounded scalar maximization. Hence,
+the precision does not depend on the resolution of an energy array.
+
+SciPy is imported on first call, as these functions are not needed to
+evaluate models.
+
+"""
+
+from collections.abc import Callable
+
+import numpy as np
+from numpy.typing import NDArray
+
+#: A function taking in |PEs| energies in :unit:`eV`, returning corresponding
+#: emission yield at normal incidence.
+YieldFunc = Callable[[NDArray[np.float64]], NDArray[np.float64]]
+
+
+def find_maximum(
+    func: YieldFunc,
+    e_low: float,
+    e_high: float,
+    n_coarse: int = 101,
+    xatol: float = 1e-8,
+) -> tuple[float, float]:
+    """Find the position and value of the maximum of ``func``.
+
+    A coarse scan locates the neighborhood of the global maximum, which is
+    then refined with a bounded scalar maximization.
+
+    Parameters
+    ----------
+    func :
+        Emission yield at normal incidence.
+    e_low :
+        Lower bound of the search interval in :unit:`eV`.
+    e_high :
+        Upper bound of the search interval in :unit:`eV`.
+    n_coarse :
+        Number of points of the coarse scan.
+    xatol :
+        Absolute tolerance over the energy of the maximum in :unit:`eV`.
+
+    Returns
+    -------
+    tuple[float, float]
+        Energy at maximum in :unit:`eV`, maximum value.
+
+    """
+    from scipy.optimize import minimize_scalar
+
+    energy = np.linspace(e_low, e_high, n_coarse)
+    values = func(energy)
+    i_max = int(np.nanargmax(values))
+    bounds = (energy[max(i_max - 1, 0)], energy[min(i_max + 1, n_coarse - 1)])
+
+    res = minimize_scalar(
+        lambda ene: -func(np.array([ene]))[0],
+        bounds=bounds,
+        method="bounded",
+        options={"xatol": xatol},
+    )
+    if not res.success or -res.fun < values[i_max]:
+        return float(energy[i_max]), float(values[i_max])
+    return float(res.x), float(-res.fun)
+
+
+def find_crossovers(
+    func: YieldFunc,
+    e_low: float,
+    e_high: float,
+    target: float = 1.0,
+    n_coarse: int = 101,
+    xtol: float = 1e-8,
+) -> NDArray[np.float64]:
+    """Find all the energies at which ``func`` crosses ``target``.
+
+    A coarse scan brackets the sign changes of ``func - target``; every
+    bracket is then refined with Brent's method.
+
+    Parameters
+    ----------
+    func :
+        Emission yield at normal incidence.
+    e_low :
+        Lower bound of the search interval in :unit:`eV`.
+    e_high :
+        Upper bound of the search interval in :unit:`eV`.
+    target :
+        Value that should be crossed.
+    n_coarse :
+        Number of points of the coarse scan. Two crossovers closer than the
+        coarse step may be missed.
+    xtol :
+        Absolute tolerance over the crossover energies in :unit:`eV`.
+
+    Returns
+    -------
+    NDArray[np.float64]
+        Crossover energies in :unit:`eV`, sorted by increasing values. Empty
+        if ``func`` does not cross ``target``.
+
+    """
+    from scipy.optimize import brentq
+
+    energy = np.linspace(e_low, e_high, n_coarse)
+    diff = func(energy) - target
+
+    crossovers = list(energy[diff == 0.0])
+    for i in np.flatnonzero(diff[:-1] * diff[1:] < 0.0):
+        crossovers.append(
+            brentq(
+                lambda ene: func(np.array([ene]))[0] - target,
+                energy[i],
+                energy[i + 1],
+                xtol=xtol,
+            )
+        )
+    return np.sort(np.array(crossovers, dtype=np.float64))
+
+
+def split_crossovers(
+    crossovers: NDArray[np.float64], e_max: float
+) -> tuple[float, float]:
+    """Give first and second crossover energies.
+
+    Parameters
+    ----------
+    crossovers :
+        All the crossover energies, sorted by increasing values.
+    e_max :
+        Energy at maximum emission yield. :math:`E_{c1}` is the last crossover
+        below this energy, :math:`E_{c2}` the first one above.
+
+    Returns
+    -------
+    tuple[float, float]
+        First and second crossover energies in :unit:`eV`. They are NaN if
+        they were not found.
+
+    """
+    below = crossovers[crossovers <= e_max]
+    above = crossovers[crossovers > e_max]
+    e_c1 = float(below[-1]) if below.size else np.nan
+    e_c2 = float(above[0]) if above.size else np.nan
+    return e_c1, e_c2
@@ -0,0 +1,132 @@
+"""Define the compiled backend used to evaluate models on float arrays.
+
+Every :class:`.Model` that supports it exposes two pure functions taking the
+model parameters as a flat ``float64`` vector:
+
+- An array *kernel*, ``kernel(energy, theta, parameters) -> values``.
+  ``energy`` (|PEs| energies in :unit:`eV`) and ``theta`` (incidence angles
+  in :unit:`deg`) are arrays broadcast against each other.
+- A *scalar kernel*, ``scalar_kernel(energy, theta, parameters) -> value``,
+  evaluating a single |PE|. Once compiled, it can be called from other Numba
+  functions, eg in a particle-tracking loop.
+
+.. code-block:: python
+
+    model = Vaughan()
+    kernel = model.kernel(backend="numba")
+    parameters = model.kernel_parameters_vector()
+    teey = kernel(energy, theta, parameters)
+
+With the NumPy backend, array kernels are vectorized NumPy functions. With
+the Numba backend, they are a compiled loop over the compiled scalar kernel.
+Numba is an optional dependency; when it is not installed, kernels fall back
+to NumPy.
+
+"""
+
+import importlib.util
+import logging
+from collections.abc import Callable
+from typing import Literal
+
+import numpy as np
+from numpy.typing import NDArray
+
+#: Evaluate a model on arrays of energies and angles.
+Kernel = Callable[
+    [NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]],
+    NDArray[np.float64],
+]
+#: Evaluate a model for a single energy and angle.
+ScalarKernel = Callable[[float, float, NDArray[np.float64]], float]
+
+Backend = Literal["auto", "numpy", "numba"]
+BACKENDS = ("auto", "numpy", "numba")
+
+_compiled: dict[ScalarKernel, tuple[ScalarKernel, Kernel]] = {}
+
+
+def numba_available() -> bool:
+    """Tell if Numba is installed, without importing it."""
+    return importlib.util.find_spec("numba") is not None
+
+
+def get_kernel(
+    kernel: Kernel, scalar_kernel: ScalarKernel, backend: Backend = "auto"
+) -> Kernel:
+    """Give the array kernel of a model for the desired ``backend``.
+
+    Parameters
+    ----------
+    kernel :
+        Vectorized NumPy kernel of the model.
+    scalar_kernel :
+        Scalar kernel of the model, compiled for the Numba backend.
+    backend :
+        ``"numpy"`` returns ``kernel``. ``"numba"`` returns a compiled loop
+        over ``scalar_kernel``; if Numba is not installed, a warning is
+        issued and ``kernel`` is returned. ``"auto"`` uses Numba only if it
+        is installed.
+
+    """
+    if not _use_numba(backend):
+        return kernel
+    return _compile(scalar_kernel)[1]
+
+
+def get_scalar_kernel(
+    scalar_kernel: ScalarKernel, backend: Backend = "auto"
+) -> ScalarKernel:
+    """Give the scalar kernel of a model, compiled if asked and possible.
+
+    See :func:`get_kernel` for the meaning of ``backend``.
+
+    """
+    if not _use_numba(backend):
+        return scalar_kernel
+    return _compile(scalar_kernel)[0]
+
+
+def _use_numba(backend: Backend) -> bool:
+    """Tell if Numba should be used, warn if it is asked but missing."""
+    if backend not in BACKENDS:
+        raise ValueError(f"{backend = } should be in {BACKENDS = }")
+    if backend == "numpy":
+        return False
+    if numba_available():
+        return True
+    if backend == "numba":
+        logging.warning(
+            "Numba is not installed, falling back on NumPy kernel. Install it"
+            " with `pip install EEmiLib[numba]`."
+        )
+    return False
+
+
+def _compile(scalar_kernel: ScalarKernel) -> tuple[ScalarKernel, Kernel]:
+    """Compile ``scalar_kernel`` and a loop over it, once per process."""
+    if scalar_kernel in _compiled:
+        return _compiled[scalar_kernel]
+
+    import numba
+
+    logging.debug(f"Compiling {scalar_kernel.__name__} with Numba.")
+    compiled_scalar = numba.njit(scalar_kernel)
+
+    @numba.njit
+    def compiled_kernel(
+        ene: NDArray[np.float64],
+        the: NDArray[np.float64],
+        parameters: NDArray[np.float64],
+    ) -> NDArray[np.float64]:
+        ene, the = np.broadcast_arrays(ene, the)
+        out = np.empty(ene.shape)
+        flat_out = out.reshape(-1)
+        i = 0
+        for index in np.ndindex(ene.shape):
+            flat_out[i] = compiled_scalar(ene[index], the[index], parameters)
+            i += 1
+        return out
+
+    _compiled[scalar_kernel] = (compiled_scalar, compiled_kernel)
+    return _compiled[scalar_kernel]
@@ -0,0 +1,240 @@
+"""Define a tabulated model, interpolated in constant time.
+
+Codes calling a model for every wall impact, such as multipactor
+Particle-In-Cell codes, can tabulate it once with
+:meth:`.Model.to_lookup_table`, then query the table:
+
+.. code-block:: python
+
+    table = model.to_lookup_table(
+        energy_grid=np.geomspace(1.0, 1e4, 1001),
+        angle_grid=np.linspace(0.0, 90.0, 91),
+        max_error=1e-3,
+    )
+    teey = table(energies, angles)
+
+The energy grid is evenly spaced in energy or in log-energy, and the angle
+grid is evenly spaced. Hence, the cell holding a query is found by a single
+division, and values are bilinearly interpolated.
+
+"""
+
+from typing import Any, Literal
+
+import numpy as np
+from numpy.typing import DTypeLike, NDArray
+
+EnergySpacing = Literal["linear", "log"]
+
+
+class LookupTable:
+    """Hold model values on a regular (energy, angle) grid.
+
+    Queries outside of the grid are clamped to its edges.
+
+    """
+
+    def __init__(
+        self,
+        energy: NDArray[np.float64],
+        theta: NDArray[np.float64],
+        values: NDArray[np.floating],
+        dtype: DTypeLike = np.float64,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """Store the table and set up the interpolation.
+
+        Parameters
+        ----------
+        energy :
+            |PEs| energies in :unit:`eV`. Must be evenly spaced, or evenly
+            spaced in log scale.
+        theta :
+            Incidence angles in :unit:`deg`. Must be evenly spaced. A single
+            angle is allowed for models that do not depend on it.
+        values :
+            Values of the model, of shape ``(n_energy, n_theta)``.
+        dtype :
+            Type used to store ``values``; ``np.float32`` halves the memory
+            footprint.
+        metadata :
+            Information on the tabulated model, eg its parameters.
+
+        """
+        values = np.asarray(values)
+        self.energy = np.asarray(energy, dtype=np.float64)
+        self.theta = np.asarray(theta, dtype=np.float64)
+        if values.shape != (self.energy.size, self.theta.size):
+            raise ValueError(
+                f"{values.shape = } does not match ({self.energy.size = }, "
+                f"{self.theta.size = })"
+            )
+        self.values = np.ascontiguousarray(values, dtype=dtype)
+        self.energy_spacing = _energy_spacing(self.energy)
+        if not _is_evenly_spaced(self.theta):
+            raise ValueError("Angle grid must be evenly spaced.")
+        self.metadata = metadata if metadata is not None else {}
+        #: Maximum interpolation error, measured by :meth:`check_error`.
+        self.max_error: float | None = None
+
+        axis = (
+            np.log(self.energy)
+            if self.energy_spacing == "log"
+            else self.energy
+        )
+        self._energy_axis = _RegularAxis(axis)
+        self._theta_axis = _RegularAxis(self.theta)
+
+    def __repr__(self) -> str:
+        """Give a short description of the table."""
+        return (
+            f"{self.__class__.__name__}({self.energy.size} "
+            f"{self.energy_spacing} energies x {self.theta.size} angles, "
+            f"{self.values.dtype})"
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Give the memory used by the tabulated values."""
+        return self.values.nbytes
+
+    def __call__(
+        self,
+        energy: float | NDArray[np.float64],
+        theta: float | NDArray[np.float64] = 0.0,
+    ) -> float | NDArray[np.float64]:
+        """Interpolate the table.
+
+        Parameters
+        ----------
+        energy :
+            |PEs| energies in :unit:`eV`.
+        theta :
+            Incidence angles in :unit:`deg`, broadcast against ``energy``.
+
+        Returns
+        -------
+            Interpolated values, as a float if ``energy`` and ``theta`` are
+            both scalars, as an array with their broadcast shape otherwise.
+
+        """
+        energy = np.asarray(energy, dtype=np.float64)
+        theta = np.asarray(theta, dtype=np.float64)
+        if self.energy_spacing == "log":
+            energy = np.log(np.maximum(energy, self.energy[0]))
+
+        i, u = self._energy_axis.locate(energy)
+        j, v = self._theta_axis.locate(theta)
+        i1 = np.minimum(i + 1, self.energy.size - 1)
+        j1 = np.minimum(j + 1, self.theta.size - 1)
+
+        values = self.values
+        out = (1.0 - u) * (
+            (1.0 - v) * values[i, j] + v * values[i, j1]
+        ) + u * ((1.0 - v) * values[i1, j] + v * values[i1, j1])
+        if out.ndim == 0:
+            return float(out)
+        return out
+
+    def check_error(
+        self, reference: NDArray[np.float64], max_error: float | None = None
+    ) -> float:
+        """Measure the interpolation error at the middle of every cell.
+
+        Parameters
+        ----------
+        reference :
+            Exact values at the cells centers, as given by
+            :meth:`cell_centers`.
+        max_error :
+            Maximum allowed absolute error.
+
+        Returns
+        -------
+        float
+            Maximum absolute error, also stored in :attr:`max_error`.
+
+        Raises
+        ------
+        ValueError
+            If the error is higher than ``max_error``.
+
+        """
+        energy, theta = self.cell_centers()
+        interpolated = self(energy[:, np.newaxis], theta[np.newaxis, :])
+        self.max_error = float(np.max(np.abs(interpolated - reference)))
+        self.metadata["max_error"] = self.max_error
+        if max_error is not None and self.max_error > max_error:
+            raise ValueError(
+                f"Interpolation error {self.max_error:.3e} is higher than "
+                f"{max_error = :.3e}. Use finer grids."
+            )
+        return self.max_error
+
+    def cell_centers(self) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Give energies and angles at the middle of the cells.
+
+        This is where linear interpolation error is the highest. Middle is
+        taken in log scale for log-spaced energies.
+
+        """
+        if self.energy_spacing == "log":
+            energy = np.sqrt(self.energy[:-1] * self.energy[1:])
+        else:
+            energy = 0.5 * (self.energy[:-1] + self.energy[1:])
+        theta = 0.5 * (self.theta[:-1] + self.theta[1:])
+        if theta.size == 0:
+            theta = self.theta
+        return energy, theta
+
+
+class _RegularAxis:
+    """Find the cell holding a value on an evenly spaced grid."""
+
+    def __init__(self, grid: NDArray[np.float64]) -> None:
+        """Store first value and step of the grid."""
+        self.start = float(grid[0])
+        self.n_cells = grid.size - 1
+        self.inv_step = (
+            1.0 / float(grid[1] - grid[0]) if self.n_cells > 0 else 0.0
+        )
+
+    def locate(
+        self, x: NDArray[np.float64]
+    ) -> tuple[NDArray[np.intp], NDArray[np.float64]]:
+        """Give index of the cell holding ``x``, position inside the cell.
+
+        Values outside of the grid are clamped to its edges.
+
+        """
+        position = (x - self.start) * self.inv_step
+        position = np.clip(position, 0.0, self.n_cells)
+        last_cell = max(self.n_cells - 1, 0)
+        index = np.minimum(position.astype(np.intp), last_cell)
+        return index, position - index
+
+
+def _is_evenly_spaced(grid: NDArray[np.float64], rtol: float = 1e-6) -> bool:
+    """Tell if ``grid`` is sorted and evenly spaced."""
+    if grid.ndim != 1 or grid.size == 0:
+        return False
+    if grid.size == 1:
+        return True
+    steps = np.diff(grid)
+    return bool(
+        np.all(steps > 0.0) and np.allclose(steps, steps[0], rtol=rtol)
+    )
+
+
+def _energy_spacing(energy: NDArray[np.float64]) -> EnergySpacing:
+    """Tell if energies are evenly spaced in linear or log scale."""
+    if energy.size < 2:
+        raise ValueError("Energy grid must hold at least two points.")
+    if _is_evenly_spaced(energy):
+        return "linear"
+    if energy[0] > 0.0 and _is_evenly_spaced(np.log(energy)):
+        return "log"
+    raise ValueError(
+        "Energy grid must be evenly spaced, eg with np.linspace, or evenly "
+        "spaced in log scale, eg with np.geomspace."
+    )
@@ -8,11 +8,16 @@ import math
 from typing import Any, TypedDict, overload
 
 import numpy as np
-import pandas as pd
 from eemilib.core.model_config import ModelConfig
 from eemilib.emission_data.data_matrix import DataMatrix
+from eemilib.model.fitting import (
+    cached_fit,
+    multi_start_least_squares,
+    warm_start,
+)
 from eemilib.model.model import Model
 from eemilib.model.parameter import Parameter
+from eemilib.model.uncertainty import covariance_from_least_squares
 from eemilib.util.constants import (
     ImplementedEmissionData,
     ImplementedPop,
@@ -22,7 +27,7 @@ from eemilib.util.constants import (
 from eemilib.util.markdown import NORM, TEMPERATURE
 from numpy.typing import NDArray
 from scipy.constants import pi
-from scipy.optimize import Bounds, least_squares
+from scipy.optimize import Bounds
 
 
 class MaxwellianParameters(TypedDict):
@@ -59,6 +64,7 @@ class Maxwellian(Model):
             "description": "Distribution re-normalization constant.",
         },
     }
+    kernel_parameters = ("temperature", "norm")
 
     def __init__(
         self, parameters_values: dict[str, Any] | None = None
@@ -84,8 +90,10 @@ class Maxwellian(Model):
             self.set_parameters_values(parameters_values)
 
         self._func = maxwellian_pdf
+        self._kernel = maxwellian_kernel
+        self._scalar_kernel = maxwellian_scalar_kernel
 
-    def get_data(
+    def get_array(
         self,
         population: ImplementedPop,
         emission_data_type: ImplementedEmissionData,
@@ -93,14 +101,17 @@ class Maxwellian(Model):
         theta: NDArray[np.float64],
         *args,
         **kwargs,
-    ) -> pd.DataFrame | None:
+    ) -> (
+        tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]
+        | None
+    ):
         """Return desired data according to current model.
 
-        Will return a dataframe only if the |SEs| energy distribution is asked.
+        Will return arrays only if the |SEs| energy distribution is asked.
 
         """
         if population != "SE" or emission_data_type != "Emission Energy":
-            return super().get_data(
+            return super().get_array(
                 population=population,
                 emission_data_type=emission_data_type,
                 energy=energy,
@@ -108,21 +119,35 @@ class Maxwellian(Model):
                 *args,
                 **kwargs,
             )
-        out = np.zeros(len(energy))
-        for i, ene in enumerate(energy):
-            out[i] = self._func(
-                ene,
-                temperature=self.parameters["temperature"],
-                norm=self.parameters["norm"],
-            )
-
-        out_dict = {col_normal: out, col_energy: energy}
-        return pd.DataFrame(out_dict)
+        energy = np.asarray(energy, dtype=np.float64)
+        out = self._func(
+            energy,
+            temperature=self.parameters["temperature"],
+            norm=self.parameters["norm"],
+        )
+        return energy, np.zeros(1), out[:, np.newaxis]
 
+    @cached_fit
     def find_optimal_parameters(
-        self, data_matrix: DataMatrix, **kwargs
+        self,
+        data_matrix: DataMatrix,
+        n_starts: int = 0,
+        max_workers: int | None = 1,
+        **kwargs,
     ) -> None:
-        """Fit model parameters on measurements."""
+        """Fit model parameters on measurements.
+
+        Parameters
+        ----------
+        data_matrix :
+            Holds the measured data.
+        n_starts :
+            Number of additional starting points for a multi-start fit. By
+            default, a single fit starts from the current parameter value.
+        max_workers :
+            Number of processes running the multi-start fits.
+
+        """
         if not data_matrix.has_all_mandatory_files(self.model_config):
             raise ValueError("Files are not all provided.")
 
@@ -131,20 +156,34 @@ class Maxwellian(Model):
 
         param = self.parameters["temperature"]
 
-        lsq = least_squares(
+        lsq = multi_start_least_squares(
             fun=_residue,
-            x0=param.value,
+            x0=warm_start([param]),
+            jac=_jacobian,
             bounds=Bounds(param.lower_bound, param.upper_bound),
+            n_starts=n_starts,
+            max_workers=max_workers,
             args=(
                 distribution.data[col_energy].to_numpy(),
                 distribution.data[col_normal].to_numpy(),
             ),
         )
-        temp = lsq.x[0]
+        values = {"temperature": float(lsq.x[0])}
         self.set_parameters_values(
-            {"temperature": temp, "norm": _maxwellian_norm(temp)}
+            values | self._derived_parameters_values(values)
+        )
+        self.covariance = covariance_from_least_squares(
+            lsq, {"temperature": param}
         )
 
+    def _derived_parameters_values(
+        self, values: dict[str, float]
+    ) -> dict[str, float]:
+        """Give the norm matching the ``temperature`` in ``values``."""
+        if "temperature" not in values or "norm" in values:
+            return {}
+        return {"norm": _maxwellian_norm(values["temperature"])}
+
 
 def _maxwellian_norm(temp: float) -> float:
     """Return norm value to have distribution maximum to unity.
@@ -189,6 +228,41 @@ def maxwellian_pdf(
     return 2 * norm_value * np.sqrt(ene / (pi * temp**3)) * np.exp(-ene / temp)
 
 
+def maxwellian_kernel(
+    ene: NDArray[np.float64],
+    the: NDArray[np.float64],
+    parameters: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """Compute the energy distribution with parameters as a flat vector.
+
+    Parameters
+    ----------
+    ene :
+        |SEs| energies in :unit:`eV`.
+    the :
+        |PEs| incidence angles in :unit:`deg`. Not used.
+    parameters :
+        Temperature in :unit:`eV` and norm.
+
+    """
+    temp = parameters[0]
+    norm = parameters[1]
+    return 2.0 * norm * np.sqrt(ene / (np.pi * temp**3)) * np.exp(-ene / temp)
+
+
+def maxwellian_scalar_kernel(
+    ene: float, the: float, parameters: NDArray[np.float64]
+) -> float:
+    """Evaluate :func:`maxwellian_kernel` at a single energy."""
+    temp = parameters[0]
+    return (
+        2.0
+        * parameters[1]
+        * math.sqrt(ene / (math.pi * temp**3))
+        * math.exp(-ene / temp)
+    )
+
+
 def _residue(
     temp: float, ene: NDArray[np.float64], measured: NDArray[np.float64]
 ) -> NDArray[np.float64]:
@@ -196,6 +270,28 @@ def _residue(
     return maxwellian_pdf(ene, temp) - measured
 
 
+def _jacobian(
+    temp: float, ene: NDArray[np.float64], measured: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    r"""Compute the Jacobian of :func:`_residue` w.r.t. temperature.
+
+    As the norm is set by :func:`_maxwellian_norm`, the distribution is
+    proportional to :math:`T^{-1/2}\mathrm{e}^{-E/T}`, hence:
+
+    .. math::
+       \frac{\partial f}{\partial T} = f \left(\frac{E}{T^2}
+       - \frac{1}{2T}\right)
+
+    Returns
+    -------
+        Array of shape ``(n_energy, 1)``.
+
+    """
+    temp = float(np.squeeze(temp))
+    modelled = maxwellian_pdf(ene, temp)
+    return (modelled * (ene / temp**2 - 0.5 / temp))[:, np.newaxis]
+
+
 # Append dynamically generated docs to the module docstring
 if __doc__ is None:
     __doc__ = ""
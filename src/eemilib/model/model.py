@@ -5,19 +5,39 @@
 
 """
 
+import copy
 import logging
 import math
 from abc import ABC, abstractmethod
-from collections.abc import Collection
+from collections.abc import Collection, Iterator, Sequence
+from pathlib import Path
 from pprint import pformat
-from typing import Any
+from typing import Any, Literal, overload
 
 import numpy as np
 import pandas as pd
 from eemilib.core.model_config import ModelConfig
 from eemilib.emission_data.data_matrix import DataMatrix, MissingDataError
 from eemilib.emission_data.emission_yield import EmissionYield
-from eemilib.emission_data.helper import get_ec1, get_max
+from eemilib.model.export import export_model
+from eemilib.model.helper import (
+    find_crossovers,
+    find_maximum,
+    split_crossovers,
+)
+from eemilib.model.kernels import (
+    Backend,
+    Kernel,
+    ScalarKernel,
+    get_kernel,
+    get_scalar_kernel,
+)
+from eemilib.model.lookup_table import LookupTable
+from eemilib.model.uncertainty import (
+    Covariance,
+    UncertaintyResult,
+    propagate_uncertainty,
+)
 from eemilib.plotter.plotter import Plotter
 from eemilib.util.constants import (
     ImplementedEmissionData,
@@ -27,7 +47,7 @@ from eemilib.util.constants import (
 )
 from eemilib.util.helper import documentation_url
 from eemilib.util.markdown import E_MAX, EC_1, SIGMA, SIGMA_MAX, tex_math
-from numpy.typing import NDArray
+from numpy.typing import DTypeLike, NDArray
 
 
 class Model(ABC):
@@ -52,6 +72,10 @@ class Model(ABC):
     implementations :
         List of different implementations for the same :class:`.Model`. See
         for example :class:`.vaughan.Vaughan`.
+    kernel_parameters :
+        Name of the entries of :meth:`kernel_parameters_vector`, in the order
+        expected by the :meth:`kernel`. Entries that are not in
+        :attr:`parameters` are derived by :meth:`kernel_parameters_vector`.
 
     """
 
@@ -63,6 +87,7 @@ class Model(ABC):
     initial_parameters: dict[str, dict[str, str | float | bool]]
     model_config: ModelConfig
     implementations: tuple[str, ...] | None = None
+    kernel_parameters: tuple[str, ...] = ()
 
     def __init__(
         self, *args, parameters_values: dict[str, Any] | None = None, **kwargs
@@ -80,6 +105,11 @@ class Model(ABC):
         #: A :class:`.TypedDict` specific to every :class:`.model.Model`. Keys
         #: are parameters names, values are :class:`.Parameter`.
         self.parameters: Any
+        #: Pure functions evaluating the model, see :mod:`.kernels`.
+        self._kernel: Kernel | None = None
+        self._scalar_kernel: ScalarKernel | None = None
+        #: Covariance of the fitted parameters, if estimated by the fit.
+        self.covariance: Covariance | None = None
 
     @classmethod
     def _generate_parameter_docs(cls) -> str:
@@ -110,65 +140,165 @@ class Model(ABC):
             doc_lines += doc
         return "\n".join(doc_lines)
 
+    @overload
+    def teey(
+        self,
+        energy: NDArray[np.float64],
+        theta: NDArray[np.float64],
+        *args,
+        as_array: Literal[False] = False,
+        **kwargs,
+    ) -> pd.DataFrame: ...
+
+    @overload
     def teey(
         self,
         energy: NDArray[np.float64],
         theta: NDArray[np.float64],
         *args,
+        as_array: Literal[True],
         **kwargs,
-    ) -> pd.DataFrame:
-        r"""Compute |TEEY| :math:`\sigma`."""
-        teey = self.get_data(
+    ) -> NDArray[np.float64]: ...
+
+    def teey(
+        self,
+        energy: NDArray[np.float64],
+        theta: NDArray[np.float64],
+        *args,
+        as_array: bool = False,
+        **kwargs,
+    ) -> pd.DataFrame | NDArray[np.float64]:
+        r"""Compute |TEEY| :math:`\sigma`.
+
+        If ``as_array``, return the raw ``(n_energy, n_theta)`` array instead
+        of a dataframe.
+
+        """
+        return self._get_or_dummy(
             "all",
             "Emission Yield",
-            energy=energy,
-            theta=theta,
+            energy,
+            theta,
             *args,
+            as_array=as_array,
+            quantity="TEEY",
             **kwargs,
         )
-        if teey is not None:
-            return teey
-        logging.warning("No TEEY data found, returning dummy.")
-        return _dummy_df(energy, theta)
+
+    @overload
+    def seey(
+        self,
+        energy: NDArray[np.float64],
+        theta: NDArray[np.float64],
+        *args,
+        as_array: Literal[False] = False,
+        **kwargs,
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def seey(
+        self,
+        energy: NDArray[np.float64],
+        theta: NDArray[np.float64],
+        *args,
+        as_array: Literal[True],
+        **kwargs,
+    ) -> NDArray[np.float64]: ...
 
     def seey(
         self,
         energy: NDArray[np.float64],
         theta: NDArray[np.float64],
         *args,
+        as_array: bool = False,
         **kwargs,
-    ) -> pd.DataFrame:
-        r"""Compute |SEEY| :math:`\delta`."""
-        seey = self.get_data(
-            "SE", "Emission Yield", energy=energy, theta=theta, *args, **kwargs
+    ) -> pd.DataFrame | NDArray[np.float64]:
+        r"""Compute |SEEY| :math:`\delta`.
+
+        If ``as_array``, return the raw ``(n_energy, n_theta)`` array instead
+        of a dataframe.
+
+        """
+        return self._get_or_dummy(
+            "SE",
+            "Emission Yield",
+            energy,
+            theta,
+            *args,
+            as_array=as_array,
+            quantity="SEEY",
+            **kwargs,
         )
-        if seey is not None:
-            return seey
-        logging.warning("No SEEY data found, returning dummy.")
-        return _dummy_df(energy, theta)
 
+    @overload
     def se_energy_distribution(
         self,
         energy: NDArray[np.float64],
         theta: NDArray[np.float64],
         *args,
+        as_array: Literal[False] = False,
         **kwargs,
-    ) -> pd.DataFrame:
-        r"""Compute |SEs| emission energy distribution."""
-        se_distrib = self.get_data(
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def se_energy_distribution(
+        self,
+        energy: NDArray[np.float64],
+        theta: NDArray[np.float64],
+        *args,
+        as_array: Literal[True],
+        **kwargs,
+    ) -> NDArray[np.float64]: ...
+
+    def se_energy_distribution(
+        self,
+        energy: NDArray[np.float64],
+        theta: NDArray[np.float64],
+        *args,
+        as_array: bool = False,
+        **kwargs,
+    ) -> pd.DataFrame | NDArray[np.float64]:
+        r"""Compute |SEs| emission energy distribution.
+
+        If ``as_array``, return the raw ``(n_energy, n_theta)`` array instead
+        of a dataframe.
+
+        """
+        return self._get_or_dummy(
             "SE",
             "Emission Energy",
-            energy=energy,
-            theta=theta,
+            energy,
+            theta,
             *args,
+            as_array=as_array,
+            quantity="SE energy distribution",
             **kwargs,
         )
-        if se_distrib is not None:
-            return se_distrib
-        logging.warning(
-            "No SE energy distribution data found, returning dummy."
+
+    def _get_or_dummy(
+        self,
+        population: ImplementedPop,
+        emission_data_type: ImplementedEmissionData,
+        energy: NDArray[np.float64],
+        theta: NDArray[np.float64],
+        *args,
+        as_array: bool,
+        quantity: str,
+        **kwargs,
+    ) -> pd.DataFrame | NDArray[np.float64]:
+        """Compute desired data; if not modelled, return null data."""
+        out = self.get_array(
+            population, emission_data_type, energy, theta, *args, **kwargs
         )
-        return _dummy_df(energy, theta)
+        if out is None:
+            logging.warning(f"No {quantity} data found, returning dummy.")
+            energy = np.asarray(energy, dtype=np.float64)
+            theta = np.asarray(theta, dtype=np.float64)
+            out = energy, theta, np.zeros((len(energy), len(theta)))
+
+        if as_array:
+            return out[2]
+        return _to_dataframe(*out)
 
     def get_data(
         self,
@@ -181,15 +311,378 @@ class Model(ABC):
     ) -> pd.DataFrame | None:
         """Return desired data according to current model.
 
-        You should override this method for each :class:`.Model` subclass.
-        When desired data is not found, a ``None`` is returned. If you want a
-        dummy dataframe instead, call the specific methods for every quantity:
+        This is a dataframe wrapper around :meth:`.Model.get_array`, which is
+        the method that :class:`.Model` subclasses should override. When
+        desired data is not found, a ``None`` is returned. If you want a dummy
+        dataframe instead, call the specific methods for every quantity:
         :meth:`.Model.teey`, :meth:`.Model.seey`,
         :meth:`.Model.se_energy_distribution`.
 
+        """
+        out = self.get_array(
+            population, emission_data_type, energy, theta, *args, **kwargs
+        )
+        if out is None:
+            return None
+        return _to_dataframe(*out)
+
+    def iter_array(
+        self,
+        population: ImplementedPop,
+        emission_data_type: ImplementedEmissionData,
+        energy: NDArray[np.float64],
+        theta: NDArray[np.float64],
+        *args,
+        chunk_size: int = 2**16,
+        **kwargs,
+    ) -> Iterator[
+        tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]
+    ]:
+        """Compute desired data by chunks of energies.
+
+        Only one chunk is held in memory at a time, so that very large grids
+        can be evaluated. See :func:`.write_chunks_to_npy` to write the
+        chunks to a file.
+
+        Parameters
+        ----------
+        population, emission_data_type, energy, theta :
+            Passed to :meth:`get_array`.
+        chunk_size :
+            Approximate number of values per chunk. Every chunk holds all the
+            angles and at least one energy.
+
+        Yields
+        ------
+        tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]
+            Output of :meth:`get_array` for a slice of ``energy``. Nothing is
+            yielded if desired data is not modelled.
+
+        """
+        energy = np.asarray(energy, dtype=np.float64)
+        theta = np.asarray(theta, dtype=np.float64)
+        n_energy = max(1, chunk_size // max(theta.size, 1))
+        for start in range(0, energy.size, n_energy):
+            out = self.get_array(
+                population,
+                emission_data_type,
+                energy[start : start + n_energy],
+                theta,
+                *args,
+                **kwargs,
+            )
+            if out is None:
+                logging.warning(
+                    f"No {emission_data_type} data found for {population}."
+                )
+                return
+            yield out
+
+    def iter_data(
+        self,
+        population: ImplementedPop,
+        emission_data_type: ImplementedEmissionData,
+        energy: NDArray[np.float64],
+        theta: NDArray[np.float64],
+        *args,
+        chunk_size: int = 2**16,
+        **kwargs,
+    ) -> Iterator[pd.DataFrame]:
+        """Compute desired data by chunks of energies, as dataframes.
+
+        This is a dataframe wrapper around :meth:`iter_array`. The index of
+        every dataframe continues the one of the previous chunk.
+
+        """
+        n_rows = 0
+        for out in self.iter_array(
+            population,
+            emission_data_type,
+            energy,
+            theta,
+            *args,
+            chunk_size=chunk_size,
+            **kwargs,
+        ):
+            df = _to_dataframe(*out)
+            df.index += n_rows
+            n_rows += len(df)
+            yield df
+
+    def get_array(
+        self,
+        population: ImplementedPop,
+        emission_data_type: ImplementedEmissionData,
+        energy: NDArray[np.float64],
+        theta: NDArray[np.float64],
+        *args,
+        **kwargs,
+    ) -> (
+        tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]
+        | None
+    ):
+        """Return desired data according to current model, as raw arrays.
+
+        You should override this method for each :class:`.Model` subclass.
+        When desired data is not found, a ``None`` is returned.
+
+        Returns
+        -------
+        NDArray[np.float64]
+            Energies in :unit:`eV`.
+        NDArray[np.float64]
+            Angles in :unit:`deg`. Models that do not consider the incidence
+            angle only return the normal incidence, ``[0.0]``.
+        NDArray[np.float64]
+            Contiguous ``(n_energy, n_theta)`` array holding modelled data.
+
         """
         return None
 
+    def kernel(self, backend: Backend = "auto") -> Kernel:
+        """Give a pure function evaluating the model on float arrays.
+
+        The kernel computes the same data as :meth:`get_array`, but takes the
+        parameters as the flat vector given by
+        :meth:`kernel_parameters_vector`. Hence, it can be compiled by Numba
+        and called in tight loops.
+
+        Parameters
+        ----------
+        backend :
+            Backend used to evaluate the kernel, see :func:`.get_kernel`.
+
+        Raises
+        ------
+        NotImplementedError
+            If the model does not define a kernel.
+
+        """
+        if self._kernel is None or self._scalar_kernel is None:
+            raise NotImplementedError(
+                f"{self.__class__.__name__} does not define a kernel."
+            )
+        return get_kernel(self._kernel, self._scalar_kernel, backend)
+
+    def scalar_kernel(self, backend: Backend = "auto") -> ScalarKernel:
+        """Give a pure function evaluating the model for a single |PE|.
+
+        With the Numba backend, the returned function can be called from
+        other compiled functions.
+
+        Raises
+        ------
+        NotImplementedError
+            If the model does not define a kernel.
+
+        """
+        if self._scalar_kernel is None:
+            raise NotImplementedError(
+                f"{self.__class__.__name__} does not define a kernel."
+            )
+        return get_scalar_kernel(self._scalar_kernel, backend)
+
+    def kernel_parameters_vector(self) -> NDArray[np.float64]:
+        """Give the current parameter values, in the order of the kernel."""
+        return np.array(
+            [self.parameters[name].value for name in self.kernel_parameters],
+            dtype=np.float64,
+        )
+
+    def kernel_parameters_vectors(
+        self, names: Sequence[str], samples: NDArray[np.float64]
+    ) -> NDArray[np.float64]:
+        """Give the kernel parameters for several values of some parameters.
+
+        The model is not modified.
+
+        Parameters
+        ----------
+        names :
+            Names of the parameters which values are given.
+        samples :
+            Values of the parameters, of shape ``(n_samples, len(names))``.
+
+        Returns
+        -------
+        NDArray[np.float64]
+            Array of shape ``(n_samples, n_kernel_parameters)``. Lines of
+            samples that are not valid for the model are NaN.
+
+        """
+        model = copy.deepcopy(self)
+        vectors: list[NDArray[np.float64] | None] = []
+        for sample in samples:
+            values = dict(zip(names, sample))
+            try:
+                model.set_parameters_values(
+                    values | model._derived_parameters_values(values)
+                )
+                vectors.append(model.kernel_parameters_vector())
+            except Exception as error:
+                logging.debug(f"Sample {sample} is not valid: {error!r}")
+                vectors.append(None)
+
+        size = max((v.size for v in vectors if v is not None), default=0)
+        stacked = np.full((len(vectors), size), np.nan)
+        for i, vector in enumerate(vectors):
+            if vector is not None:
+                stacked[i] = vector
+        return stacked
+
+    def batch_kernel(
+        self,
+        vectors: NDArray[np.float64],
+        energy: NDArray[np.float64],
+        theta: NDArray[np.float64],
+    ) -> NDArray[np.float64]:
+        """Evaluate the kernel for many parameter vectors in a single call.
+
+        Parameter vectors are stacked along a first axis, which the NumPy
+        kernel broadcasts against energies and angles.
+
+        Parameters
+        ----------
+        vectors :
+            Kernel parameters, of shape ``(n_vectors, n_kernel_parameters)``,
+            eg from :meth:`kernel_parameters_vectors`.
+        energy :
+            |PEs| energies in :unit:`eV`.
+        theta :
+            Incidence angles in :unit:`deg`. Ignored if the model does not
+            depend on the incidence angle.
+
+        Returns
+        -------
+        NDArray[np.float64]
+            Values of shape ``(n_vectors, n_energy, n_theta)``. ``n_theta``
+            is 1 for models that do not depend on the incidence angle.
+
+        """
+        parameters = np.asarray(vectors, dtype=np.float64).T
+        parameters = parameters[:, :, np.newaxis, np.newaxis]
+        energy = np.asarray(energy, dtype=np.float64)[
+            np.newaxis, :, np.newaxis
+        ]
+        theta = np.asarray(theta, dtype=np.float64)[np.newaxis, np.newaxis, :]
+        if not self.is_3d:
+            theta = np.zeros((1, 1, 1))
+        values = self.kernel("numpy")(energy, theta, parameters)
+        shape = (parameters.shape[1], energy.shape[1], theta.shape[2])
+        return np.broadcast_to(values, shape).copy()
+
+    def propagate_uncertainty(
+        self,
+        energy: NDArray[np.float64],
+        theta: NDArray[np.float64] | None = None,
+        **kwargs,
+    ) -> UncertaintyResult:
+        """Propagate the uncertainty of the fitted parameters to the curve.
+
+        See :func:`.propagate_uncertainty` for the arguments.
+
+        """
+        return propagate_uncertainty(self, energy, theta, **kwargs)
+
+    def _derived_parameters_values(
+        self, values: dict[str, float]
+    ) -> dict[str, float]:
+        """Give the parameters that are computed from ``values``.
+
+        Override this when some parameters are not fitted but computed from
+        others, eg a normalization factor.
+
+        """
+        return {}
+
+    def to_lookup_table(
+        self,
+        energy_grid: NDArray[np.float64],
+        angle_grid: NDArray[np.float64],
+        population: ImplementedPop | None = None,
+        emission_data_type: ImplementedEmissionData | None = None,
+        dtype: DTypeLike = np.float64,
+        max_error: float | None = None,
+    ) -> LookupTable:
+        r"""Tabulate the model for fast interpolation.
+
+        Parameters
+        ----------
+        energy_grid :
+            |PEs| energies in :unit:`eV`, evenly spaced in linear or log
+            scale.
+        angle_grid :
+            Incidence angles in :unit:`deg`, evenly spaced. Ignored by models
+            that do not depend on the incidence angle.
+        population :
+            Tabulated population. The default is the first of
+            :attr:`populations`.
+        emission_data_type :
+            Tabulated data. The default is the first of
+            :attr:`emission_data_types`.
+        dtype :
+            Type used to store the table.
+        max_error :
+            Maximum absolute interpolation error. It is measured against the
+            model at the center of every cell.
+            Discontinuities, eg the |TEEY| of :class:`.Vaughan` at
+            :math:`E_0` when :math:`\sigma_{low} \neq 0`, lead to an error
+            of the order of the jump.
+
+        Raises
+        ------
+        ValueError
+            If the interpolation error is higher than ``max_error``.
+
+        """
+        if population is None:
+            population = self.populations[0]
+        if emission_data_type is None:
+            emission_data_type = self.emission_data_types[0]
+
+        out = self.get_array(
+            population, emission_data_type, energy_grid, angle_grid
+        )
+        if out is None:
+            raise ValueError(
+                f"{self.__class__.__name__} does not model "
+                f"{emission_data_type} of {population}."
+            )
+        energy, theta, values = out
+        metadata = {
+            "model": self.__class__.__name__,
+            "implementation": getattr(self, "current_implementation", None),
+            "population": population,
+            "emission_data_type": emission_data_type,
+            "parameters": {
+                name: param.value for name, param in self.parameters.items()
+            },
+        }
+        table = LookupTable(energy, theta, values, dtype, metadata)
+
+        center_energy, center_theta = table.cell_centers()
+        reference = self.get_array(
+            population, emission_data_type, center_energy, center_theta
+        )
+        assert reference is not None
+        table.check_error(reference[2], max_error)
+        return table
+
+    def export(
+        self,
+        filepath: str | Path,
+        energy_grid: NDArray[np.float64],
+        angle_grid: NDArray[np.float64],
+        **kwargs,
+    ) -> Path:
+        """Save the tabulated model to a binary file.
+
+        See :func:`.export_model` for the arguments, and
+        :func:`.load_exported_model` to read the file.
+
+        """
+        return export_model(self, filepath, energy_grid, angle_grid, **kwargs)
+
     @abstractmethod
     def find_optimal_parameters(
         self, data_matrix: DataMatrix, **kwargs
@@ -268,7 +761,49 @@ class Model(ABC):
                 f"{emission_data_type = }. Skipping this plot."
             )
             return axes
+        return self.plot_data(
+            plotter,
+            to_plot,
+            population,
+            emission_data_type,
+            axes=axes,
+            grid=grid,
+            **kwargs,
+        )
 
+    def plot_data[T](
+        self,
+        plotter: Plotter,
+        to_plot: pd.DataFrame,
+        population: ImplementedPop,
+        emission_data_type: ImplementedEmissionData,
+        axes: T | None = None,
+        grid: bool = True,
+        **kwargs,
+    ) -> T | None:
+        """Plot modelled data already computed by :meth:`.Model.get_data`.
+
+        This is the drawing part of :meth:`.Model.plot`. It allows to compute
+        the data in a background thread, and to draw it in the GUI thread.
+
+        Parameters
+        ----------
+        plotter :
+            Object realizing the plot.
+        to_plot :
+            Modelled data, as returned by :meth:`.Model.get_data`.
+        population :
+            Population of ``to_plot``.
+        emission_data_type :
+            Type of ``to_plot``.
+        axes :
+            Axes to re-use if given.
+        grid :
+            If grid should be plotted.
+        kwargs :
+            Other keyword arguments passed to the :class:`.Plotter` method.
+
+        """
         if emission_data_type == "Emission Yield":
             return plotter.plot_emission_yield(
                 to_plot,
@@ -402,27 +937,101 @@ class Model(ABC):
         In particular: $E_{c1}$, $E_{max}$, $\sigma_{max}$.
 
         """
-        energy = np.linspace(0, 1e3, 10001, dtype=np.float64)
-        theta = np.array([0.0])
-        teey = self.teey(energy, theta)
-
-        e_c1 = get_ec1(teey)
-        e_max, sigma_max = get_max(teey)
+        e_max, sigma_max = self._teey_maximum()
+        e_c1, _ = self._teey_crossovers()
         return {
             f"Modelled {tex_math(EC_1)} [eV]": e_c1,
             f"Modelled {tex_math(E_MAX)} [eV]": e_max,
             f"Modelled {tex_math(SIGMA_MAX)}": sigma_max,
         }
 
+    def yield_characteristics(
+        self,
+        population: ImplementedPop = "all",
+        e_low: float = 0.0,
+        e_high: float = 1e3,
+    ) -> dict[str, float]:
+        """Compute crossover energies and maximum of modelled emission yield.
+
+        For the |TEEY|, closed form expressions are used when the model
+        defines them. Other populations are searched numerically, at normal
+        incidence.
+
+        Parameters
+        ----------
+        population :
+            Population which emission yield is studied.
+        e_low :
+            Lower bound of the search interval in :unit:`eV`.
+        e_high :
+            Upper bound of the search interval in :unit:`eV`.
+
+        Returns
+        -------
+        dict[str, float]
+            ``E_c1``, ``E_c2`` and ``E_max`` in :unit:`eV`, ``ey_max``. They
+            are NaN if they are not found, or if the emission yield of
+            ``population`` is not modelled.
+
+        """
+        names = ("E_c1", "E_c2", "E_max", "ey_max")
+        if population == "all":
+            e_max, ey_max = self._teey_maximum(e_low, e_high)
+            e_c1, e_c2 = self._teey_crossovers(e_low, e_high)
+            return dict(zip(names, (e_c1, e_c2, e_max, ey_max)))
+
+        zero = np.zeros(1)
+        if self.get_array(population, "Emission Yield", zero, zero) is None:
+            return dict.fromkeys(names, np.nan)
+
+        def normal_yield(energy: NDArray[np.float64]) -> NDArray[np.float64]:
+            out = self.get_array(population, "Emission Yield", energy, zero)
+            assert out is not None
+            return out[2][:, 0]
+
+        e_max, ey_max = find_maximum(normal_yield, e_low, e_high)
+        e_c1, e_c2 = split_crossovers(
+            find_crossovers(normal_yield, e_low, e_high), e_max
+        )
+        return dict(zip(names, (e_c1, e_c2, e_max, ey_max)))
+
+    def _normal_teey(self, energy: NDArray[np.float64]) -> NDArray[np.float64]:
+        """Compute |TEEY| at normal incidence; null if not modelled."""
+        out = self.get_array("all", "Emission Yield", energy, np.zeros(1))
+        if out is None:
+            return np.zeros_like(energy)
+        return out[2][:, 0]
+
+    def _teey_maximum(
+        self, e_low: float = 0.0, e_high: float = 1e3
+    ) -> tuple[float, float]:
+        r"""Compute $E_{max}$ and $\sigma_{max}$ of modelled |TEEY|.
+
+        Override this method for models where these quantities have a closed
+        form expression.
+
+        """
+        return find_maximum(self._normal_teey, e_low, e_high)
+
+    def _teey_crossovers(
+        self, e_low: float = 0.0, e_high: float = 1e3
+    ) -> tuple[float, float]:
+        r"""Compute $E_{c1}$ and $E_{c2}$ of modelled |TEEY| in :unit:`eV`.
+
+        Override this method for models where these quantities have a closed
+        form expression. Crossover energies that are not found are NaN.
+
+        """
+        e_max, _ = self._teey_maximum(e_low, e_high)
+        crossovers = find_crossovers(self._normal_teey, e_low, e_high)
+        return split_crossovers(crossovers, e_max)
+
     def _error_ec1(self, emission_yield: EmissionYield) -> float:
         """Compute relative error over first crossover energy in :unit:`%`."""
         measured_ec1 = emission_yield.e_c1
-        energy = np.linspace(0, 1.5 * measured_ec1, 10001, dtype=np.float64)
-        theta = np.array([0.0])
-        teey = self.teey(energy, theta)
-
-        idx_ec1 = (teey[col_normal] - 1.0).abs().idxmin()
-        model_ec1 = energy[idx_ec1]
+        model_ec1, _ = self._teey_crossovers(
+            e_high=max(1e3, 1.5 * measured_ec1)
+        )
 
         std = math.sqrt((measured_ec1 - model_ec1) ** 2)
         error = 100.0 * std / measured_ec1
@@ -442,9 +1051,7 @@ class Model(ABC):
         measured_teey = df.loc[mask, col_normal].to_numpy()
         measured_energy = df.loc[mask, col_energy].to_numpy()
         angles = np.array([0.0])
-        modelled_teey = self.teey(measured_energy, angles)[
-            col_normal
-        ].to_numpy()
+        modelled_teey = self.teey(measured_energy, angles, as_array=True)[:, 0]
 
         error = 100.0 * np.std((measured_teey - modelled_teey), ddof=1.0)
         return float(error)
@@ -460,13 +1067,12 @@ class Model(ABC):
         logging.info("Parameters values:\n" + pformat(msg))
 
 
-def _dummy_df(
-    energy: NDArray[np.float64], theta: NDArray[np.float64]
+def _to_dataframe(
+    energy: NDArray[np.float64],
+    theta: NDArray[np.float64],
+    values: NDArray[np.float64],
 ) -> pd.DataFrame:
-    """Return a null array with proper shape."""
-    n_energy = len(energy)
-    n_theta = len(theta)
-    out = np.zeros((n_energy, n_theta))
-    out_dict = {f"{the} [deg]": out[:, j] for the, j in enumerate(theta)}
-    out_dict["Energy [eV]"] = energy
+    """Wrap the output of :meth:`.Model.get_array` in a dataframe."""
+    out_dict = {f"{the} [deg]": values[:, j] for j, the in enumerate(theta)}
+    out_dict[col_energy] = energy
     return pd.DataFrame(out_dict)
@@ -9,17 +9,11 @@ import math
 from typing import Any, TypedDict
 
 import numpy as np
-import pandas as pd
 from eemilib.core.model_config import ModelConfig
 from eemilib.emission_data.data_matrix import DataMatrix
 from eemilib.model.model import Model
 from eemilib.model.parameter import Parameter
-from eemilib.util.constants import (
-    ImplementedEmissionData,
-    ImplementedPop,
-    col_energy,
-    col_normal,
-)
+from eemilib.util.constants import ImplementedEmissionData, ImplementedPop
 from eemilib.util.markdown import E_MAX, EC_1, SIGMA_MAX
 from numpy.typing import NDArray
 
@@ -70,6 +64,7 @@ class Sombrin(Model):
             "description": "First crossover energy.",
         },
     }
+    kernel_parameters = ("E_max", "teey_max", "E")
 
     def __init__(
         self, parameters_values: dict[str, Any] | None = None
@@ -84,6 +79,7 @@ class Sombrin(Model):
 
         """
         super().__init__(url_doc_override="manual/models/sombrin")
+        self._E: float | None = None
         self.parameters: SombrinParameters = {  # type: ignore
             name: Parameter(**kwargs)  # type: ignore
             for name, kwargs in self.initial_parameters.items()
@@ -93,7 +89,8 @@ class Sombrin(Model):
             self.set_parameters_values(parameters_values)
 
         self._func = sombrin_func
-        self._E: float | None = None
+        self._kernel = sombrin_kernel
+        self._scalar_kernel = sombrin_scalar_kernel
 
     @property
     def E(self) -> float:
@@ -107,7 +104,7 @@ class Sombrin(Model):
         )
         return self._E
 
-    def get_data(
+    def get_array(
         self,
         population: ImplementedPop,
         emission_data_type: ImplementedEmissionData,
@@ -115,14 +112,17 @@ class Sombrin(Model):
         theta: NDArray[np.float64],
         *args,
         **kwargs,
-    ) -> pd.DataFrame | None:
+    ) -> (
+        tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]
+        | None
+    ):
         """Return desired data according to current model.
 
-        Will return a dataframe only if the |TEEY| is asked.
+        Will return arrays only if the |TEEY| is asked.
 
         """
         if population != "all" or emission_data_type != "Emission Yield":
-            return super().get_data(
+            return super().get_array(
                 population=population,
                 emission_data_type=emission_data_type,
                 energy=energy,
@@ -130,18 +130,26 @@ class Sombrin(Model):
                 *args,
                 **kwargs,
             )
-        out = np.zeros(len(energy))
-        for i, ene in enumerate(energy):
-            out[i] = self._func(
-                ene,
-                E_max=self.parameters["E_max"],
-                teey_max=self.parameters["teey_max"],
-                E_c1=self.parameters["E_c1"],
-                E_param=self.E,
-            )
-
-        out_dict = {col_normal: out, col_energy: energy}
-        return pd.DataFrame(out_dict)
+        energy = np.asarray(energy, dtype=np.float64)
+        out = self._func(
+            energy,
+            E_max=self.parameters["E_max"],
+            teey_max=self.parameters["teey_max"],
+            E_c1=self.parameters["E_c1"],
+            E_param=self.E,
+        )
+        return energy, np.zeros(1), out[:, np.newaxis]
+
+    def kernel_parameters_vector(self) -> NDArray[np.float64]:
+        """Give the parameters vector expected by :func:`sombrin_kernel`."""
+        return np.array(
+            [
+                self.parameters["E_max"].value,
+                self.parameters["teey_max"].value,
+                self.E,
+            ],
+            dtype=np.float64,
+        )
 
     def set_parameter_value(self, name: str, value: Any) -> None:
         """Set ``E`` to None before updating the parameter."""
@@ -167,6 +175,35 @@ class Sombrin(Model):
             }
         )
 
+    def _teey_maximum(
+        self, e_low: float = 0.0, e_high: float = 1e3
+    ) -> tuple[float, float]:
+        r"""Give $E_{max}$ and $\sigma_{max}$, which are model parameters.
+
+        The search interval is not used.
+
+        """
+        return (
+            self.parameters["E_max"].value,
+            self.parameters["teey_max"].value,
+        )
+
+    def _teey_crossovers(
+        self, e_low: float = 0.0, e_high: float = 1e3
+    ) -> tuple[float, float]:
+        r"""Give $E_{c1}$ and $E_{c2}$ of modelled |TEEY| in :unit:`eV`.
+
+        :math:`E_{c1}` is a model parameter. As the model is symmetric in
+        :math:`\log(E / E_{max})`, :math:`E_{c2} = E_{max}^2 / E_{c1}`. The
+        search interval is not used.
+
+        """
+        e_c1 = self.parameters["E_c1"].value
+        e_max = self.parameters["E_max"].value
+        if self.parameters["teey_max"].value < 1.0 or e_c1 <= 0.0:
+            return np.nan, np.nan
+        return e_c1, e_max**2 / e_c1
+
     def evaluate(self, data_matrix: DataMatrix) -> dict[str, float]:
         """Evaluate the quality of the model using Fil criterions.
 
@@ -187,9 +224,42 @@ def sombrin_func(
     """Compute the |TEEY| for incident energy E."""
     if E_param is None:
         E_param = _e_parameter(teey_max, E_max, E_c1)
-    num = 2 * teey_max.value * (ene / E_max.value) ** E_param
-    denom = 1 + (ene / E_max.value) ** (2 * E_param)
-    return num / denom
+    return sombrin_kernel(
+        ene, 0.0, np.array([E_max.value, teey_max.value, E_param])
+    )
+
+
+def sombrin_kernel(
+    ene: NDArray[np.float64],
+    the: NDArray[np.float64],
+    parameters: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    r"""Compute the |TEEY| with parameters given as a flat vector.
+
+    Parameters
+    ----------
+    ene :
+        |PEs| energies in :unit:`eV`.
+    the :
+        |PEs| incidence angles in :unit:`deg`. Not used.
+    parameters :
+        :math:`E_{max}`, :math:`\sigma_{max}` and the Sombrin :math:`E`
+        parameter.
+
+    """
+    E_max = parameters[0]
+    teey_max = parameters[1]
+    E_param = parameters[2]
+    ratio = (ene / E_max) ** E_param
+    return 2.0 * teey_max * ratio / (1.0 + ratio**2)
+
+
+def sombrin_scalar_kernel(
+    ene: float, the: float, parameters: NDArray[np.float64]
+) -> float:
+    """Compute the |TEEY| of a single |PE|, see :func:`sombrin_kernel`."""
+    ratio = (ene / parameters[0]) ** parameters[2]
+    return 2.0 * parameters[1] * ratio / (1.0 + ratio**2)
 
 
 def _e_parameter(
@@ -0,0 +1,370 @@
+"""Estimate the uncertainty of fitted parameters and propagate it.
+
+Models fitted with :func:`scipy.optimize.least_squares` (:class:`.Dionne`,
+:class:`.Maxwellian`, :class:`.ChungEverhart`) store the covariance of their
+free parameters in :attr:`.Model.covariance`. It is estimated from the
+Jacobian at the solution, as :func:`scipy.optimize.curve_fit` does.
+
+The covariance is propagated to the modelled curves by Monte Carlo: parameter
+values are drawn from a multivariate normal distribution, and all the draws
+are evaluated in a single call of the vectorized model kernel (see
+:mod:`.kernels`).
+
+.. code-block:: python
+
+    model.find_optimal_parameters(data_matrix)
+    result = model.propagate_uncertainty(np.linspace(0.0, 1e3, 501))
+    lower, upper = result.band(confidence=0.95)
+
+"""
+
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from eemilib.emission_data.helper import find_crossings
+from eemilib.model.helper import split_crossovers
+from eemilib.model.parameter import Parameter
+from numpy.typing import NDArray
+
+if TYPE_CHECKING:
+    from scipy.optimize import OptimizeResult
+
+#: Names of the characteristics computed for emission yields.
+CHARACTERISTICS = ("E_c1", "E_c2", "E_max", "ey_max")
+
+
+class Covariance:
+    """Hold the covariance matrix of some parameters."""
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        matrix: NDArray[np.float64],
+        mean: NDArray[np.float64],
+    ) -> None:
+        """Store the covariance.
+
+        Parameters
+        ----------
+        names :
+            Names of the parameters.
+        matrix :
+            Covariance matrix, of shape ``(n_parameters, n_parameters)``.
+        mean :
+            Fitted values of the parameters.
+
+        """
+        self.names = tuple(names)
+        self.matrix = np.asarray(matrix, dtype=np.float64)
+        self.mean = np.asarray(mean, dtype=np.float64)
+        if self.matrix.shape != (len(self.names), len(self.names)):
+            raise ValueError(
+                f"{self.matrix.shape = } does not match {len(self.names)} "
+                "parameters."
+            )
+
+    def __repr__(self) -> str:
+        """Give parameters and their standard deviations."""
+        std = ", ".join(
+            f"{name}={mean:.4g}±{std:.2g}"
+            for name, mean, std in zip(self.names, self.mean, self.std)
+        )
+        return f"{self.__class__.__name__}({std})"
+
+    @property
+    def std(self) -> NDArray[np.float64]:
+        """Give the standard deviation of every parameter."""
+        return np.sqrt(np.diag(self.matrix))
+
+    @property
+    def correlation(self) -> NDArray[np.float64]:
+        """Give the correlation matrix."""
+        std = self.std
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.matrix / np.outer(std, std)
+
+    def draw(
+        self,
+        n_draws: int,
+        seed: int | None = None,
+        bounds: Mapping[str, tuple[float, float]] | None = None,
+    ) -> NDArray[np.float64]:
+        """Draw parameter values from a multivariate normal distribution.
+
+        Parameters
+        ----------
+        n_draws :
+            Number of draws.
+        seed :
+            Seed of the random generator.
+        bounds :
+            Lower and upper bound of some parameters; draws are clipped into
+            them.
+
+        Returns
+        -------
+        NDArray[np.float64]
+            Array of shape ``(n_draws, n_parameters)``.
+
+        """
+        rng = np.random.default_rng(seed)
+        draws = rng.multivariate_normal(
+            self.mean, self.matrix, size=n_draws, method="eigh"
+        )
+        for i, name in enumerate(self.names):
+            if bounds is not None and name in bounds:
+                draws[:, i] = np.clip(draws[:, i], *bounds[name])
+        return draws
+
+
+def covariance_from_least_squares(
+    result: "OptimizeResult", parameters: Mapping[str, Parameter]
+) -> Covariance | None:
+    """Estimate the covariance of the free parameters of a fit.
+
+    The covariance is :math:`s^2 (J^T J)^{-1}`, where :math:`J` is the
+    Jacobian of the residues at the solution and :math:`s^2` the residual
+    variance. Locked parameters are not part of it.
+
+    Parameters
+    ----------
+    result :
+        Output of :func:`scipy.optimize.least_squares`.
+    parameters :
+        Fitted parameters, in the order of ``result.x``.
+
+    Returns
+    -------
+    Covariance | None
+        Covariance of the free parameters. None if all parameters are locked,
+        or if there are not more residues than free parameters.
+
+    """
+    names = [name for name, param in parameters.items() if not param.is_locked]
+    free = np.array([not param.is_locked for param in parameters.values()])
+    jac = np.atleast_2d(np.asarray(result.jac, dtype=np.float64))[:, free]
+    n_residues, n_free = jac.shape
+    if n_free == 0 or n_residues <= n_free:
+        return None
+
+    # Moore-Penrose inverse of J^T J, discarding singular directions
+    _, singular, vt = np.linalg.svd(jac, full_matrices=False)
+    threshold = np.finfo(float).eps * max(jac.shape) * singular[0]
+    kept = singular > threshold
+    vt = vt[kept]
+    inverse = (vt.T / singular[kept] ** 2) @ vt
+
+    residual_variance = 2.0 * result.cost / (n_residues - n_free)
+    return Covariance(
+        names, inverse * residual_variance, np.asarray(result.x)[free]
+    )
+
+
+class UncertaintyResult:
+    """Hold the curves computed for every draw of the parameters."""
+
+    def __init__(
+        self,
+        covariance: Covariance,
+        draws: NDArray[np.float64],
+        energy: NDArray[np.float64],
+        theta: NDArray[np.float64],
+        nominal: NDArray[np.float64],
+        curves: NDArray[np.float64],
+        characteristics: dict[str, NDArray[np.float64]] | None = None,
+    ) -> None:
+        """Store the results.
+
+        Parameters
+        ----------
+        covariance :
+            Propagated covariance.
+        draws :
+            Drawn values of the parameters of ``covariance``, of shape
+            ``(n_draws, n_parameters)``.
+        energy :
+            Energies of the curves in :unit:`eV`.
+        theta :
+            Angles of the curves in :unit:`deg`.
+        nominal :
+            Curve computed with the fitted parameters, of shape
+            ``(n_energy, n_theta)``.
+        curves :
+            Curve for every draw, of shape ``(n_draws, n_energy, n_theta)``.
+        characteristics :
+            Crossover energies and maximum of the emission yield at normal
+            incidence, for every draw. Keys are :data:`CHARACTERISTICS`.
+
+        """
+        self.covariance = covariance
+        self.draws = draws
+        self.energy = energy
+        self.theta = theta
+        self.nominal = nominal
+        self.curves = curves
+        self.characteristics = characteristics or {}
+
+    def __len__(self) -> int:
+        """Give number of draws."""
+        return self.draws.shape[0]
+
+    def band(
+        self, confidence: float = 0.95
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Give the lower and upper bounds of the confidence band.
+
+        Parameters
+        ----------
+        confidence :
+            Probability for the curve to lie between the bounds, at every
+            energy and angle.
+
+        Returns
+        -------
+        tuple[NDArray[np.float64], NDArray[np.float64]]
+            Lower and upper bounds, of shape ``(n_energy, n_theta)``.
+
+        """
+        lower, upper = np.nanquantile(
+            self.curves, quantiles(confidence), axis=0
+        )
+        return lower, upper
+
+    def interval(
+        self, name: str, confidence: float = 0.95
+    ) -> tuple[float, float]:
+        """Give the confidence interval of a characteristic, eg ``"E_c1"``.
+
+        Draws where the characteristic is not defined are ignored.
+
+        """
+        values = self.characteristics[name]
+        lower, upper = np.nanquantile(values, quantiles(confidence))
+        return float(lower), float(upper)
+
+
+def propagate_uncertainty(
+    model: Any,
+    energy: NDArray[np.float64],
+    theta: NDArray[np.float64] | None = None,
+    n_draws: int = 2000,
+    seed: int | None = None,
+    covariance: Covariance | None = None,
+) -> UncertaintyResult:
+    """Propagate the uncertainty of the parameters to the modelled curve.
+
+    Parameters
+    ----------
+    model :
+        A :class:`.Model` defining a kernel.
+    energy :
+        |PEs| energies in :unit:`eV`.
+    theta :
+        Incidence angles in :unit:`deg`. The default is normal incidence.
+    n_draws :
+        Number of Monte Carlo draws.
+    seed :
+        Seed of the random generator.
+    covariance :
+        Covariance of some parameters of ``model``. The default is the one
+        estimated by the last fit, :attr:`.Model.covariance`.
+
+    Raises
+    ------
+    ValueError
+        If no covariance is given nor was estimated.
+
+    """
+    covariance = covariance or model.covariance
+    if covariance is None:
+        raise ValueError(
+            f"No covariance available for {model}. Fit it first, or give "
+            "one."
+        )
+    energy = np.asarray(energy, dtype=np.float64)
+    theta = np.zeros(1) if theta is None else np.asarray(theta, np.float64)
+    if not model.is_3d:
+        theta = np.zeros(1)
+
+    bounds = {
+        name: (
+            model.parameters[name].lower_bound,
+            model.parameters[name].upper_bound,
+        )
+        for name in covariance.names
+    }
+    draws = covariance.draw(n_draws, seed=seed, bounds=bounds)
+    vectors = model.kernel_parameters_vectors(covariance.names, draws)
+    curves = model.batch_kernel(vectors, energy, theta)
+    nominal = model.batch_kernel(
+        model.kernel_parameters_vector()[np.newaxis, :], energy, theta
+    )[0]
+
+    characteristics = None
+    if "Emission Yield" in model.emission_data_types:
+        characteristics = curves_characteristics(energy, curves[:, :, 0])
+    return UncertaintyResult(
+        covariance, draws, energy, theta, nominal, curves, characteristics
+    )
+
+
+def curves_characteristics(
+    energy: NDArray[np.float64], curves: NDArray[np.float64]
+) -> dict[str, NDArray[np.float64]]:
+    """Find crossover energies and maximum of many emission yield curves.
+
+    Crossovers are linearly interpolated between the points of ``energy``,
+    and split around the maximum as in :meth:`.Model.yield_characteristics`.
+    The maximum is the highest point; use a fine grid to resolve it.
+
+    Parameters
+    ----------
+    energy :
+        |PEs| energies in :unit:`eV`, sorted.
+    curves :
+        Emission yields, of shape ``(n_curves, n_energy)``.
+
+    Returns
+    -------
+    dict[str, NDArray[np.float64]]
+        Keys are :data:`CHARACTERISTICS`, values have ``n_curves`` elements.
+        Crossovers are NaN if not found.
+
+    """
+    rows = np.arange(curves.shape[0])
+    i_max = np.argmax(curves, axis=1)
+    e_max = energy[i_max]
+    crossovers = np.array(
+        [
+            split_crossovers(find_crossings(energy, curve), e)
+            for curve, e in zip(curves, e_max)
+        ],
+        dtype=np.float64,
+    ).reshape(-1, 2)
+    return {
+        "E_c1": crossovers[:, 0],
+        "E_c2": crossovers[:, 1],
+        "E_max": e_max,
+        "ey_max": curves[rows, i_max],
+    }
+
+
+def quantiles(confidence: float) -> tuple[float, float]:
+    """Give the quantiles bounding a centered interval.
+
+    Parameters
+    ----------
+    confidence :
+        Probability for a value to lie in the interval, in ``]0, 1[``.
+
+    Returns
+    -------
+    tuple[float, float]
+        Lower and upper quantiles, eg ``(0.025, 0.975)`` for a confidence of
+        0.95.
+
+    """
+    if not 0.0 < confidence < 1.0:
+        raise ValueError(f"{confidence = } should be in ]0, 1[.")
+    return 0.5 * (1.0 - confidence), 0.5 * (1.0 + confidence)
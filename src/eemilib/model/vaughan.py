@@ -13,7 +13,6 @@ import math
 from typing import Any, Callable, Literal, TypedDict
 
 import numpy as np
-import pandas as pd
 from eemilib.core.model_config import ModelConfig
 from eemilib.emission_data.data_matrix import DataMatrix
 from eemilib.model.model import Model
@@ -31,7 +30,6 @@ from eemilib.util.markdown import (
     rst_math,
 )
 from numpy.typing import NDArray
-from scipy.optimize import least_squares
 
 VaughanImplementation = Literal["original", "CST", "SPARK3D"]
 VAUGHAN_IMPLEMENTATIONS = ("original", "CST", "SPARK3D")
@@ -133,6 +131,15 @@ class Vaughan(Model):
         },
     }
     implementations = VAUGHAN_IMPLEMENTATIONS
+    kernel_parameters = (
+        "E_0",
+        "E_max",
+        "teey_max",
+        "teey_low",
+        "k_se",
+        "k_s",
+        "e_cutoff",
+    )
 
     def __init__(
         self,
@@ -167,6 +174,8 @@ class Vaughan(Model):
             self.set_parameters_values(parameters_values)
 
         self._func: Callable
+        self._kernel = vaughan_kernel
+        self._scalar_kernel = vaughan_scalar_kernel
         self.current_implementation: VaughanImplementation
         self.set_implementation(implementation)
 
@@ -238,7 +247,7 @@ class Vaughan(Model):
             return
         logging.error(f"{implementation = } not in {VaughanImplementation}")
 
-    def get_data(
+    def get_array(
         self,
         population: ImplementedPop,
         emission_data_type: ImplementedEmissionData,
@@ -246,17 +255,18 @@ class Vaughan(Model):
         theta: NDArray[np.float64],
         *args,
         **kwargs,
-    ) -> pd.DataFrame | None:
+    ) -> (
+        tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]
+        | None
+    ):
         """Return desired data according to current model.
 
-        Will return a dataframe only if the |TEEY| is asked.
-
-        .. todo::
-            This method could be so much simpler and efficient.
+        Will return arrays only if the |TEEY| is asked. The full (energy,
+        angle) grid is computed in a single call to the model function.
 
         """
         if population != "all" or emission_data_type != "Emission Yield":
-            return super().get_data(
+            return super().get_array(
                 population=population,
                 emission_data_type=emission_data_type,
                 energy=energy,
@@ -264,14 +274,23 @@ class Vaughan(Model):
                 *args,
                 **kwargs,
             )
-        out = np.zeros((len(energy), len(theta)))
-        for i, ene in enumerate(energy):
-            for j, the in enumerate(theta):
-                out[i, j] = self._func(ene, the, **self.parameters)
-
-        out_dict = {f"{the} [deg]": out[:, j] for j, the in enumerate(theta)}
-        out_dict["Energy [eV]"] = energy
-        return pd.DataFrame(out_dict)
+        energy = np.asarray(energy, dtype=np.float64)
+        theta = np.asarray(theta, dtype=np.float64)
+        out = self._func(
+            energy[:, np.newaxis], theta[np.newaxis, :], **self.parameters
+        )
+        return energy, theta, out
+
+    def kernel_parameters_vector(self) -> NDArray[np.float64]:
+        """Give the parameters vector expected by :func:`vaughan_kernel`."""
+        return _kernel_vector(
+            *(self.parameters[name] for name in self.kernel_parameters[:-1]),
+            e_cutoff=(
+                E_0_SPARK3D
+                if self.current_implementation == "SPARK3D"
+                else -np.inf
+            ),
+        )
 
     def find_optimal_parameters(
         self, data_matrix: DataMatrix, **kwargs
@@ -315,10 +334,12 @@ class Vaughan(Model):
 
     def _E_0_matching(self, *, E_c1: float) -> float:
         """Fit E_0 to retrieve E_c1 (SPARK3D)"""
+        from scipy.optimize import least_squares
+
         parameters = self.parameters.copy()
 
         def _to_minimize(E_0: float) -> float:
-            parameters["E_0"].value = E_0
+            parameters["E_0"].value = float(np.squeeze(E_0))
             teey_at_crossover = vaughan_func(ene=E_c1, the=0.0, **parameters)
             if isinstance(teey_at_crossover, np.ndarray):
                 teey_at_crossover = teey_at_crossover[0]
@@ -327,6 +348,55 @@ class Vaughan(Model):
         optimized_E_0 = least_squares(_to_minimize, x0=12.5).x
         return float(optimized_E_0[0])
 
+    def _teey_maximum(
+        self, e_low: float = 0.0, e_high: float = 1e3
+    ) -> tuple[float, float]:
+        r"""Give $E_{max}$ and $\sigma_{max}$ of modelled |TEEY|.
+
+        At normal incidence, they are directly model parameters. The search
+        interval is not used, unless the low-energy |TEEY| is higher than the
+        maximum, in which case we fall back on a numerical search.
+
+        """
+        e_max = self.parameters["E_max"].value
+        teey_max = self.parameters["teey_max"].value
+        if self.parameters["teey_low"].value > teey_max or (
+            self.current_implementation == "SPARK3D" and e_max < E_0_SPARK3D
+        ):
+            return super()._teey_maximum(e_low, e_high)
+        return e_max, teey_max
+
+    def _teey_crossovers(
+        self, e_low: float = 0.0, e_high: float = 1e3
+    ) -> tuple[float, float]:
+        r"""Compute $E_{c1}$ and $E_{c2}$ of modelled |TEEY| in :unit:`eV`.
+
+        At normal incidence, :math:`\sigma = 1` can be inverted with the
+        Lambert :math:`W` function in every :math:`\xi` regime. The search
+        interval is not used, unless the low-energy |TEEY| is higher than
+        unity, in which case we fall back on a numerical search.
+
+        """
+        E_0 = self.parameters["E_0"].value
+        E_max = self.parameters["E_max"].value
+        teey_max = self.parameters["teey_max"].value
+        if self.parameters["teey_low"].value >= 1.0 or E_0 >= E_max:
+            return super()._teey_crossovers(e_low, e_high)
+        if teey_max < 1.0:
+            return np.nan, np.nan
+
+        from scipy.special import lambertw
+
+        xi_c1 = -lambertw(-(teey_max ** (-1.0 / 0.56)) / math.e, 0).real
+        xi_c2 = -lambertw(-(teey_max ** (-1.0 / 0.25)) / math.e, -1).real
+        if xi_c2 > 3.6:
+            xi_c2 = (1.125 * teey_max) ** (1.0 / 0.35)
+
+        e_c1, e_c2 = (E_0 + xi * (E_max - E_0) for xi in (xi_c1, xi_c2))
+        if self.current_implementation == "SPARK3D":
+            e_c1 = max(e_c1, E_0_SPARK3D)
+        return float(e_c1), float(e_c2)
+
     def evaluate(self, data_matrix: DataMatrix) -> dict[str, float]:
         """Evaluate the quality of the model using Fil criterions.
 
@@ -337,8 +407,8 @@ class Vaughan(Model):
 
 
 def vaughan_func(
-    ene: float,
-    the: float,
+    ene: float | NDArray[np.float64],
+    the: float | NDArray[np.float64],
     E_0: Parameter,
     E_max: Parameter,
     teey_max: Parameter,
@@ -348,31 +418,31 @@ def vaughan_func(
     delta_E_transition: Parameter,
     **parameters,
 ) -> float | NDArray[np.float64]:
-    """Compute the |TEEY| for incident energy E."""
-    mod_e_max = E_max.value * (
-        1.0 + k_se.value * math.radians(the) ** 2 / (2.0 * math.pi)
-    )
-    mod_teey_max = teey_max.value * (
-        1.0 + k_s.value * math.radians(the) ** 2 / (2.0 * math.pi)
-    )
-    if ene < E_0.value:
-        return teey_low.value
+    r"""Compute the |TEEY| for incident energy E.
 
-    xi = (ene - E_0.value) / (mod_e_max - E_0.value)
+    ``ene`` and ``the`` are broadcast against each other. Hence, giving
+    ``energy[:, np.newaxis]`` and ``theta[np.newaxis, :]`` returns the full
+    (energy, angle) grid in a single call. See :func:`vaughan_kernel`.
 
-    if xi <= 1.0:
-        k = 0.56
-    elif xi <= 3.6:
-        k = 0.25
-    else:
-        return mod_teey_max * 1.125 / (xi**0.35)
+    Returns
+    -------
+        |TEEY|, as a float if ``ene`` and ``the`` are both scalars, as an
+        array with the broadcast shape of ``ene`` and ``the`` otherwise.
 
-    return mod_teey_max * (xi * np.exp(1.0 - xi)) ** k
+    """
+    teey = vaughan_kernel(
+        np.asarray(ene, dtype=np.float64),
+        np.asarray(the, dtype=np.float64),
+        _kernel_vector(E_0, E_max, teey_max, teey_low, k_se, k_s, -np.inf),
+    )
+    if teey.ndim == 0:
+        return float(teey)
+    return teey
 
 
 def vaughan_spark3d(
-    ene: float,
-    the: float,
+    ene: float | NDArray[np.float64],
+    the: float | NDArray[np.float64],
     E_0: Parameter,
     E_max: Parameter,
     teey_max: Parameter,
@@ -389,20 +459,105 @@ def vaughan_spark3d(
     that appears in the expression of :math:`\xi`.
 
     """
-    if ene >= E_0_SPARK3D:
-        return vaughan_func(
-            ene=ene,
-            the=the,
-            E_0=E_0,
-            E_max=E_max,
-            teey_max=teey_max,
-            teey_low=teey_low,
-            k_se=k_se,
-            k_s=k_s,
-            delta_E_transition=delta_E_transition,
-            **parameters,
-        )
-    return teey_low.value
+    teey = vaughan_kernel(
+        np.asarray(ene, dtype=np.float64),
+        np.asarray(the, dtype=np.float64),
+        _kernel_vector(E_0, E_max, teey_max, teey_low, k_se, k_s, E_0_SPARK3D),
+    )
+    if teey.ndim == 0:
+        return float(teey)
+    return teey
+
+
+def vaughan_kernel(
+    ene: NDArray[np.float64],
+    the: NDArray[np.float64],
+    parameters: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    r"""Compute the |TEEY| with parameters given as a flat vector.
+
+    The three :math:`\xi` regimes are evaluated with ``np.where`` instead of
+    scalar branching.
+
+    Parameters
+    ----------
+    ene :
+        |PEs| energies in :unit:`eV`.
+    the :
+        |PEs| incidence angles in :unit:`deg`, broadcast against ``ene``.
+    parameters :
+        :math:`E_0`, :math:`E_{max}`, :math:`\sigma_{max}`,
+        :math:`\sigma_{low}`, :math:`k_{se}`, :math:`k_s`, and the energy
+        below which |TEEY| is :math:`\sigma_{low}` whatever :math:`E_0`
+        (``-inf``, or ``E_0_SPARK3D`` for the SPARK3D implementation).
+
+    """
+    E_0 = parameters[0]
+    E_max = parameters[1]
+    teey_max = parameters[2]
+    teey_low = parameters[3]
+    k_se = parameters[4]
+    k_s = parameters[5]
+    e_cutoff = parameters[6]
+
+    angle_factor = np.radians(the) ** 2 / (2.0 * np.pi)
+    mod_e_max = E_max * (1.0 + k_se * angle_factor)
+    mod_teey_max = teey_max * (1.0 + k_s * angle_factor)
+
+    xi = (ene - E_0) / (mod_e_max - E_0)
+    # Clipped values avoid NaN in the branches that are not selected
+    xi_pos = np.maximum(xi, 0.0)
+    bell = xi_pos * np.exp(1.0 - xi_pos)
+    teey = mod_teey_max * np.where(
+        xi <= 1.0,
+        bell**0.56,
+        np.where(xi <= 3.6, bell**0.25, 1.125 / np.maximum(xi, 3.6) ** 0.35),
+    )
+    return np.where((ene < E_0) | (ene < e_cutoff), teey_low, teey)
+
+
+def vaughan_scalar_kernel(
+    ene: float, the: float, parameters: NDArray[np.float64]
+) -> float:
+    """Compute the |TEEY| of a single |PE|, see :func:`vaughan_kernel`."""
+    E_0 = parameters[0]
+    if ene < E_0 or ene < parameters[6]:
+        return parameters[3]
+
+    angle_factor = math.radians(the) ** 2 / (2.0 * math.pi)
+    mod_e_max = parameters[1] * (1.0 + parameters[4] * angle_factor)
+    mod_teey_max = parameters[2] * (1.0 + parameters[5] * angle_factor)
+
+    xi = (ene - E_0) / (mod_e_max - E_0)
+    if xi <= 1.0:
+        return mod_teey_max * (xi * math.exp(1.0 - xi)) ** 0.56
+    if xi <= 3.6:
+        return mod_teey_max * (xi * math.exp(1.0 - xi)) ** 0.25
+    return mod_teey_max * 1.125 / xi**0.35
+
+
+def _kernel_vector(
+    E_0: Parameter,
+    E_max: Parameter,
+    teey_max: Parameter,
+    teey_low: Parameter,
+    k_se: Parameter,
+    k_s: Parameter,
+    e_cutoff: float,
+) -> NDArray[np.float64]:
+    """Give the parameters vector expected by :func:`vaughan_kernel`."""
+    return np.array(
+        [
+            E_0.value,
+            E_max.value,
+            teey_max.value,
+            teey_low.value,
+            k_se.value,
+            k_s.value,
+            e_cutoff,
+        ],
+        dtype=np.float64,
+    )
 
 
 # Append dynamically generated docs to the module docstring
@@ -1,5 +1,15 @@
-"""Define the object that will take care of plotting the data."""
+"""Define the object that will take care of plotting the data.
 
-from .pandas import PandasPlotter
+Plotters are imported on first access, so that matplotlib is imported only
+when actually plotting.
 
-__all__ = ["PandasPlotter"]
+"""
+
+from typing import TYPE_CHECKING
+
+from eemilib.util.lazy import attach
+
+if TYPE_CHECKING:
+    from .pandas import PandasPlotter
+
+__getattr__, __dir__, __all__ = attach(__name__, {"PandasPlotter": ".pandas"})
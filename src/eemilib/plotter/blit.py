@@ -0,0 +1,78 @@
+"""Redraw a few artists of a figure without redrawing the whole figure.
+
+This is the blitting technique described in the matplotlib documentation.
+Managed artists are marked as animated, so that they are excluded from the
+normal draws. After every full draw of the canvas, the background (figure
+without the animated artists) is saved. Updating the animated artists then
+only costs restoring this background, drawing these artists and copying the
+result to the screen.
+
+"""
+
+from matplotlib.artist import Artist
+from matplotlib.backend_bases import DrawEvent, FigureCanvasBase
+
+
+class BlitManager:
+    """Handle the fast redraw of the animated artists of a canvas."""
+
+    def __init__(self, canvas: FigureCanvasBase) -> None:
+        """Connect to the draws of ``canvas``.
+
+        Parameters
+        ----------
+        canvas :
+            The canvas to update. It must support blitting, see
+            :attr:`FigureCanvasBase.supports_blit`.
+
+        """
+        self.canvas = canvas
+        self.artists: list[Artist] = []
+        self._background = None
+        self._draw_cid = canvas.mpl_connect("draw_event", self._on_draw)
+
+    def add_artist(self, artist: Artist) -> None:
+        """Manage ``artist``; it is marked as animated."""
+        artist.set_animated(True)
+        self.artists.append(artist)
+
+    def remove_artist(self, artist: Artist) -> None:
+        """Stop managing ``artist``."""
+        if artist in self.artists:
+            self.artists.remove(artist)
+        artist.set_animated(False)
+
+    def update(self) -> None:
+        """Redraw the managed artists over the saved background.
+
+        If no background was saved yet, the whole canvas is drawn instead.
+
+        """
+        if self._background is None:
+            self.canvas.draw()
+        else:
+            self.canvas.restore_region(self._background)
+            self._draw_artists()
+            self.canvas.blit(self.canvas.figure.bbox)
+        self.canvas.flush_events()
+
+    def _on_draw(self, event: DrawEvent | None) -> None:
+        """Save the new background, draw the managed artists over it.
+
+        Draws of another canvas are ignored; they happen when the figure is
+        saved to a file, on a temporary canvas.
+
+        """
+        if event is not None and event.canvas is not self.canvas:
+            return
+        self._background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self._draw_artists()
+
+    def _draw_artists(self) -> None:
+        """Draw the managed artists that are still in the figure."""
+        figure = self.canvas.figure
+        if figure.canvas is not self.canvas:
+            return
+        for artist in self.artists:
+            if artist.figure is figure:
+                figure.draw_artist(artist)
@@ -0,0 +1,253 @@
+"""Decimate dense curves to the resolution of the axes.
+
+A line of the axes cannot show more details than one vertical segment per
+pixel column. Above that, the points sent to matplotlib only cost time and
+memory. The functions of this module select a subset of the points of a
+curve:
+
+- ``"minmax"`` keeps, in every pixel column, the lowest and highest point.
+  The drawn envelope is exactly the one of the full curve.
+- ``"lttb"`` is the Largest-Triangle-Three-Buckets algorithm
+  :cite:`Steinarsson2013`. It keeps one point per bucket, chosen to preserve
+  the visual shape of the curve.
+
+:class:`Downsampler` keeps the full-resolution data of the lines, and
+decimates them again when the visible energy range changes (zoom, pan).
+
+.. note::
+    Abscissae must be sorted. Points with a non-finite ordinate are
+    discarded.
+
+"""
+
+from collections.abc import Sequence
+from typing import Literal
+from weakref import WeakKeyDictionary, WeakSet
+
+import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.lines import Line2D
+from numpy.typing import NDArray
+
+DownsamplingMethod = Literal["minmax", "lttb"]
+
+
+def minmax_indexes(
+    x: NDArray[np.float64], y: NDArray[np.float64], n_buckets: int
+) -> NDArray[np.intp]:
+    """Give indexes of the extrema of ``y`` in buckets of equal width.
+
+    Parameters
+    ----------
+    x :
+        Sorted abscissae.
+    y :
+        Ordinates, same shape as ``x``.
+    n_buckets :
+        Number of buckets, typically the width of the axes in pixels.
+
+    Returns
+    -------
+    NDArray[np.intp]
+        Sorted indexes of the first and last points, and of the minimum and
+        maximum of every bucket.
+
+    """
+    finite = np.flatnonzero(np.isfinite(y))
+    if finite.size <= 2 * n_buckets + 2:
+        return finite
+    x_finite, y_finite = x[finite], y[finite]
+    span = x_finite[-1] - x_finite[0]
+    if span <= 0.0:
+        bucket = np.zeros(finite.size, dtype=np.intp)
+    else:
+        bucket = ((x_finite - x_finite[0]) * (n_buckets / span)).astype(
+            np.intp
+        )
+        np.clip(bucket, 0, n_buckets - 1, out=bucket)
+
+    order = np.lexsort((y_finite, bucket))
+    sorted_bucket = bucket[order]
+    is_first = np.r_[True, sorted_bucket[1:] != sorted_bucket[:-1]]
+    is_last = np.r_[sorted_bucket[1:] != sorted_bucket[:-1], True]
+    kept = np.concatenate(
+        (order[is_first], order[is_last], [0, finite.size - 1])
+    )
+    return finite[np.unique(kept)]
+
+
+def lttb_indexes(
+    x: NDArray[np.float64], y: NDArray[np.float64], n_out: int
+) -> NDArray[np.intp]:
+    """Give indexes of the points selected by the LTTB algorithm.
+
+    Parameters
+    ----------
+    x :
+        Sorted abscissae.
+    y :
+        Ordinates, same shape as ``x``.
+    n_out :
+        Number of points to keep, including first and last one.
+
+    Returns
+    -------
+    NDArray[np.intp]
+        Sorted indexes of the kept points.
+
+    """
+    finite = np.flatnonzero(np.isfinite(y))
+    if n_out < 3 or finite.size <= n_out:
+        return finite
+    x_finite, y_finite = x[finite], y[finite]
+
+    # Bucket i spans [edges[i], edges[i + 1]); first and last points are
+    # buckets on their own
+    edges = np.linspace(1, finite.size - 1, n_out - 1).astype(np.intp)
+    kept = np.empty(n_out, dtype=np.intp)
+    kept[0], kept[-1] = 0, finite.size - 1
+    previous = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        # Third point of the triangle: average of next bucket
+        if i < n_out - 3:
+            x_next = x_finite[stop : edges[i + 2]].mean()
+            y_next = y_finite[stop : edges[i + 2]].mean()
+        else:
+            x_next, y_next = x_finite[-1], y_finite[-1]
+
+        x_a, y_a = x_finite[previous], y_finite[previous]
+        areas = np.abs(
+            (x_a - x_next) * (y_finite[start:stop] - y_a)
+            - (x_a - x_finite[start:stop]) * (y_next - y_a)
+        )
+        previous = start + int(np.argmax(areas))
+        kept[i + 1] = previous
+    return finite[kept]
+
+
+def downsample_indexes(
+    x: NDArray[np.float64],
+    ys: Sequence[NDArray[np.float64]],
+    n_pixels: int,
+    method: DownsamplingMethod = "minmax",
+    x_range: tuple[float, float] | None = None,
+) -> NDArray[np.intp]:
+    """Give indexes of the points to plot for curves sharing abscissae.
+
+    Parameters
+    ----------
+    x :
+        Sorted abscissae.
+    ys :
+        Ordinates of every curve.
+    n_pixels :
+        Width of the axes, in pixels.
+    method :
+        Decimation algorithm.
+    x_range :
+        Visible range of abscissae. The points outside are discarded, except
+        the first ones on each side so that lines reach the border of the
+        axes.
+
+    Returns
+    -------
+    NDArray[np.intp]
+        Sorted union of the indexes kept for every curve.
+
+    """
+    start, stop = 0, x.size
+    if x_range is not None:
+        low, high = sorted(x_range)
+        start = max(int(np.searchsorted(x, low)) - 1, 0)
+        stop = min(int(np.searchsorted(x, high, side="right")) + 1, x.size)
+    x_visible = x[start:stop]
+
+    kept = []
+    for y in ys:
+        y_visible = y[start:stop]
+        if method == "minmax":
+            indexes = minmax_indexes(x_visible, y_visible, n_pixels)
+        elif method == "lttb":
+            indexes = lttb_indexes(x_visible, y_visible, 2 * n_pixels)
+        else:
+            raise ValueError(f"{method = } is not implemented.")
+        kept.append(indexes)
+    if not kept:
+        return np.arange(start, stop)
+    return start + np.unique(np.concatenate(kept))
+
+
+def axes_width(axes: Axes) -> int:
+    """Give the width of the axes in pixels."""
+    return max(int(axes.get_window_extent().width), 1)
+
+
+class Downsampler:
+    """Show lines decimated to the visible resolution.
+
+    The full-resolution data of the lines is kept, and lines are decimated
+    again when the limits of their axes change. Lines are referenced
+    weakly: they are forgotten when they are deleted.
+
+    """
+
+    def __init__(self, method: DownsamplingMethod = "minmax") -> None:
+        """Set the decimation algorithm.
+
+        Parameters
+        ----------
+        method :
+            Decimation algorithm.
+
+        """
+        self.method = method
+        self._full_data: WeakKeyDictionary[
+            Line2D, tuple[NDArray[np.float64], NDArray[np.float64]]
+        ] = WeakKeyDictionary()
+        self._connected_axes: WeakSet[Axes] = WeakSet()
+
+    def set_data(
+        self, line: Line2D, x: NDArray[np.float64], y: NDArray[np.float64]
+    ) -> None:
+        """Give full-resolution data to ``line``, show it decimated.
+
+        ``line`` must already be in its axes. If the energy range of the axes
+        is not autoscaled (eg after a zoom), the data is decimated within
+        this range.
+
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        self._full_data[line] = (x, y)
+        axes = line.axes
+        assert axes is not None, f"{line} must be in an Axes."
+        if axes not in self._connected_axes:
+            # Not a bound method: the registry keeps it, and self, alive
+            axes.callbacks.connect(
+                "xlim_changed", lambda axes: self._on_xlim_changed(axes)
+            )
+            self._connected_axes.add(axes)
+        x_range = None if axes.get_autoscalex_on() else axes.get_xlim()
+        indexes = downsample_indexes(
+            x, (y,), axes_width(axes), self.method, x_range=x_range
+        )
+        line.set_data(x[indexes], y[indexes])
+
+    def full_data(
+        self, line: Line2D
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Give the full-resolution data of ``line``."""
+        return self._full_data[line]
+
+    def _on_xlim_changed(self, axes: Axes) -> None:
+        """Decimate the lines of ``axes`` within its new limits."""
+        n_pixels = axes_width(axes)
+        x_range = axes.get_xlim()
+        for line, (x, y) in list(self._full_data.items()):
+            if line.axes is not axes:
+                continue
+            indexes = downsample_indexes(
+                x, (y,), n_pixels, self.method, x_range=x_range
+            )
+            line.set_data(x[indexes], y[indexes])
@@ -1,27 +1,87 @@
-"""Define plotter relying on pandas."""
+"""Define plotter relying on pandas.
+
+In incremental mode, the lines are created once; following plots of the
+same population, emission data type and angle only update their data. When
+the new data fits in the current axes limits, only the updated lines are
+redrawn (see :mod:`.blit`), which is much faster than redrawing the figure.
+
+.. code-block:: python
+
+    plotter = PandasPlotter(incremental=True)
+    axes = model.plot(plotter, "all", "Emission Yield", energies, angles)
+    model.set_parameter_value("E_max", 350.0)
+    model.plot(plotter, "all", "Emission Yield", energies, angles, axes=axes)
+
+With ``downsample``, dense curves are decimated to the width of the axes
+before they are given to matplotlib, and decimated again on zoom (see
+:mod:`.downsample`).
+
+"""
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
+from eemilib.plotter.blit import BlitManager
+from eemilib.plotter.downsample import (
+    Downsampler,
+    DownsamplingMethod,
+    axes_width,
+    downsample_indexes,
+)
 from eemilib.plotter.helper import explicit_column_names
 from eemilib.plotter.plotter import Plotter
-from eemilib.util.constants import ImplementedPop, col_energy, md_ylabel
+from eemilib.util.constants import (
+    ImplementedEmissionData,
+    ImplementedPop,
+    col_energy,
+    md_ylabel,
+)
 from matplotlib.axes import Axes
+from matplotlib.backend_bases import FigureCanvasBase
+from matplotlib.lines import Line2D
+
+#: Key of the lines kept in incremental mode: population, emission data type
+#: and name of the plotted column (incidence angle).
+LineKey = tuple[ImplementedPop | None, ImplementedEmissionData, str]
 
 
 class PandasPlotter(Plotter):
     """A :class:`.Plotter` using pandas lib."""
 
-    def __init__(self, *args, gui: bool = False, **kwargs) -> None:
+    def __init__(
+        self,
+        *args,
+        gui: bool = False,
+        incremental: bool = False,
+        downsample: bool | DownsamplingMethod = False,
+        **kwargs,
+    ) -> None:
         """Instantiate object.
 
         Parameters
         ----------
         gui :
             Activates interactive plotting if using GUI.
+        incremental :
+            If plots should update the lines created by the previous plots
+            instead of creating new ones. Keep the same object between plots
+            to benefit from it.
+        downsample :
+            If dense curves should be decimated to the resolution of the
+            axes. Give ``"lttb"`` to use the LTTB algorithm instead of the
+            default ``"minmax"``.
 
         """
         if gui:
             plt.ion()
+        self.incremental = incremental
+        self.downsampler: Downsampler | None = None
+        if downsample:
+            method = "minmax" if downsample is True else downsample
+            self.downsampler = Downsampler(method)
+        #: Lines created in incremental mode.
+        self.lines: dict[LineKey, Line2D] = {}
+        self._blit_managers: dict[FigureCanvasBase, BlitManager] = {}
         return super().__init__(*args, gui=gui, **kwargs)
 
     def plot_emission_yield(
@@ -49,23 +109,18 @@ class PandasPlotter(Plotter):
             Additional keyword arguments passed to the |dfplot| method.
 
         """
-        if axes is not None:
-            axes.set_prop_cycle(None)
-        explicit = explicit_column_names(
-            df.columns,
+        if self.incremental:
+            return self._update_lines(
+                df, axes, population, "Emission Yield", **kwargs
+            )
+        return self._plot_dataframe(
+            df,
+            *args,
+            axes=axes,
             population=population,
             emission_data_type="Emission Yield",
-        )
-        updated = df.rename(columns=explicit, inplace=False)
-        axes = updated.plot(
-            *args,
-            x=explicit[col_energy],
-            ax=axes,
-            ylabel=md_ylabel["Emission Yield"],
             **kwargs,
         )
-        assert isinstance(axes, Axes)
-        return axes
 
     def plot_emission_energy_distribution(
         self,
@@ -91,34 +146,202 @@ class PandasPlotter(Plotter):
         kwargs :
             Additional keyword arguments passed to the |dfplot| method.
 
+        """
+        if self.incremental:
+            return self._update_lines(
+                df, axes, population, "Emission Energy", **kwargs
+            )
+        return self._plot_dataframe(
+            df,
+            *args,
+            axes=axes,
+            population=population,
+            emission_data_type="Emission Energy",
+            **kwargs,
+        )
+
+    def plot_emission_angle_distribution(
+        self,
+        df: pd.DataFrame,
+        *args,
+        axes: Axes | None = None,
+        population: ImplementedPop | None = None,
+        **kwargs,
+    ) -> Axes:
+        """Plot the given emission angles distribution, return Axes object."""
+        raise NotImplementedError(
+            "Plotting emission angle distribution not implemented yet."
+        )
+
+    def _plot_dataframe(
+        self,
+        df: pd.DataFrame,
+        *args,
+        axes: Axes | None,
+        population: ImplementedPop | None,
+        emission_data_type: ImplementedEmissionData,
+        **kwargs,
+    ) -> Axes:
+        """Plot every column of ``df`` against energy with |dfplot|.
+
+        When downsampling, only the points kept for the current width of the
+        axes are given to |dfplot|; the full data is then handed to the
+        :class:`.Downsampler`.
+
         """
         if axes is not None:
             axes.set_prop_cycle(None)
         explicit = explicit_column_names(
             df.columns,
             population=population,
-            emission_data_type="Emission Energy",
+            emission_data_type=emission_data_type,
+        )
+        updated = df.rename(columns=explicit, inplace=False)
+        if self.downsampler is None:
+            axes = updated.plot(
+                *args,
+                x=explicit[col_energy],
+                ax=axes,
+                ylabel=md_ylabel[emission_data_type],
+                **kwargs,
+            )
+            assert isinstance(axes, Axes)
+            return axes
+
+        if axes is None:
+            _, axes = plt.subplots()
+        x = df[col_energy].to_numpy(dtype=np.float64)
+        ys = [
+            df[col].to_numpy(dtype=np.float64)
+            for col in df.columns
+            if col != col_energy
+        ]
+        indexes = downsample_indexes(
+            x, ys, axes_width(axes), self.downsampler.method
         )
-        df.rename(columns=explicit, inplace=True)
-        axes = df.plot(
+        n_lines = len(axes.lines)
+        updated.iloc[indexes].plot(
             *args,
             x=explicit[col_energy],
             ax=axes,
-            ylabel=md_ylabel["Emission Energy"],
+            ylabel=md_ylabel[emission_data_type],
             **kwargs,
         )
-        assert isinstance(axes, Axes)
+        for line, y in zip(axes.lines[n_lines:], ys):
+            self.downsampler.set_data(line, x, y)
         return axes
 
-    def plot_emission_angle_distribution(
+    def _update_lines(
         self,
         df: pd.DataFrame,
-        *args,
-        axes: Axes | None = None,
-        population: ImplementedPop | None = None,
+        axes: Axes | None,
+        population: ImplementedPop | None,
+        emission_data_type: ImplementedEmissionData,
+        grid: bool = True,
         **kwargs,
     ) -> Axes:
-        """Plot the given emission angles distribution, return Axes object."""
-        raise NotImplementedError(
-            "Plotting emission angle distribution not implemented yet."
+        """Update the lines of a previous plot, create the missing ones.
+
+        The figure is fully redrawn when lines are created or removed, or
+        when the new data does not fit in the axes limits. Otherwise, only
+        the lines are redrawn.
+
+        Parameters
+        ----------
+        df :
+            Dataframe holding data to plot.
+        axes :
+            Axes to re-use if given. Lines plotted on other axes are not
+            updated.
+        population :
+            Type of population currently plotted.
+        emission_data_type :
+            Type of data currently plotted.
+        grid :
+            If grid should be plotted.
+        kwargs :
+            Additional keyword arguments passed to :meth:`Axes.plot` when a
+            line is created.
+
+        """
+        if axes is None:
+            _, axes = plt.subplots()
+        explicit = explicit_column_names(
+            df.columns,
+            population=population,
+            emission_data_type=emission_data_type,
         )
+        blit_manager = self._blit_manager(axes.figure.canvas)
+        x = df[col_energy].to_numpy()
+        columns = [col for col in df.columns if col != col_energy]
+
+        full_redraw = False
+        for i, col in enumerate(columns):
+            key = (population, emission_data_type, col)
+            y = df[col].to_numpy()
+            line = self.lines.get(key)
+            if line is not None and line in axes.lines:
+                self._set_line_data(line, x, y)
+                full_redraw |= not _fits_in_limits(axes, x, y)
+                continue
+
+            (line,) = axes.plot(
+                [], [], label=explicit[col], **({"color": f"C{i}"} | kwargs)
+            )
+            self._set_line_data(line, x, y)
+            self.lines[key] = line
+            if blit_manager is not None:
+                blit_manager.add_artist(line)
+            full_redraw = True
+
+        for key in list(self.lines):
+            if key[:2] != (population, emission_data_type):
+                continue
+            if key[2] in columns and self.lines[key] in axes.lines:
+                continue
+            line = self.lines.pop(key)
+            if blit_manager is not None:
+                blit_manager.remove_artist(line)
+            if line in axes.lines:
+                line.remove()
+                full_redraw = True
+
+        if full_redraw or blit_manager is None:
+            axes.relim()
+            axes.autoscale_view()
+            axes.set_xlabel(explicit.get(col_energy, col_energy))
+            axes.set_ylabel(md_ylabel[emission_data_type])
+            axes.grid(grid)
+            axes.legend()
+            axes.figure.canvas.draw_idle()
+            return axes
+        blit_manager.update()
+        return axes
+
+    def _set_line_data(
+        self, line: Line2D, x: np.ndarray, y: np.ndarray
+    ) -> None:
+        """Give data to ``line``, decimated if downsampling."""
+        if self.downsampler is None:
+            line.set_data(x, y)
+            return
+        self.downsampler.set_data(line, x, y)
+
+    def _blit_manager(self, canvas: FigureCanvasBase) -> BlitManager | None:
+        """Give the object redrawing the lines of ``canvas``, if possible."""
+        if not canvas.supports_blit:
+            return None
+        if canvas not in self._blit_managers:
+            self._blit_managers[canvas] = BlitManager(canvas)
+        return self._blit_managers[canvas]
+
+
+def _fits_in_limits(axes: Axes, x: np.ndarray, y: np.ndarray) -> bool:
+    """Tell if the finite points of ``x`` and ``y`` are within the axes."""
+    for values, (low, high) in zip((x, y), (axes.get_xlim(), axes.get_ylim())):
+        finite = values[np.isfinite(values)]
+        if finite.size == 0:
+            continue
+        if finite.min() < low or finite.max() > high:
+            return False
+    return True
@@ -0,0 +1,51 @@
+"""Define helpers to import the content of packages on first access.
+
+Package ``__init__`` files use :func:`attach` so that importing a
+sub-module, eg ``eemilib.model.vaughan``, does not import its siblings.
+
+"""
+
+import importlib
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+def attach(
+    package_name: str, attributes: Mapping[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]], list[str]]:
+    """Create the module-level ``__getattr__``, ``__dir__`` and ``__all__``.
+
+    Parameters
+    ----------
+    package_name :
+        Name of the package, ie ``__name__`` in its ``__init__``.
+    attributes :
+        Maps the public attribute names with the module defining them.
+        Relative module names are resolved w.r.t. ``package_name``.
+
+    Returns
+    -------
+    Callable[[str], Any]
+        Module ``__getattr__``, importing the module defining the asked
+        attribute.
+    Callable[[], list[str]]
+        Module ``__dir__``.
+    list[str]
+        Module ``__all__``.
+
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name not in attributes:
+            raise AttributeError(
+                f"module {package_name!r} has no attribute {name!r}"
+            )
+        module = importlib.import_module(attributes[name], package_name)
+        value = getattr(module, name)
+        setattr(importlib.import_module(package_name), name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(attributes)
+
+    return __getattr__, __dir__, sorted(attributes)
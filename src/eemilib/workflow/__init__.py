@@ -0,0 +1,24 @@
+"""Define workflows chaining loading, fitting and evaluation of data."""
+
+from typing import TYPE_CHECKING
+
+from eemilib.util.lazy import attach
+
+if TYPE_CHECKING:
+    from .batch import fit_batch
+    from .bootstrap import BootstrapResult, bootstrap
+    from .report import render_reports, samples_from_directory
+    from .sweep import SweepResult, sweep
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "BootstrapResult": ".bootstrap",
+        "bootstrap": ".bootstrap",
+        "fit_batch": ".batch",
+        "render_reports": ".report",
+        "samples_from_directory": ".report",
+        "SweepResult": ".sweep",
+        "sweep": ".sweep",
+    },
+)
@@ -0,0 +1,211 @@
+"""Fit a :class:`.Model` on many samples in parallel.
+
+Every sample is processed in its own worker process: files are loaded, the
+model is fitted and evaluated. Results are gathered in a tidy dataframe, with
+one row per sample, in the order in which samples were given.
+
+.. note::
+    The model class, the loader and the :class:`.DataMatrix` objects are sent
+    to the worker processes; they must be picklable.
+
+"""
+
+import logging
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+from eemilib.emission_data.data_matrix import DataMatrix
+from eemilib.loader.loader import Loader
+from eemilib.loader.pandas_loader import PandasLoader
+from eemilib.model.model import Model
+from eemilib.util.constants import ImplementedEmissionData, ImplementedPop
+
+#: A single sample: an already filled :class:`.DataMatrix`, or the path to a
+#: file that will be loaded in the worker.
+Sample = DataMatrix | str | Path
+
+#: Name of the column holding the sample labels.
+col_sample = "sample"
+#: Name of the column telling if the fit succeeded.
+col_status = "status"
+#: Name of the column holding the error message of failed fits.
+col_error = "error"
+
+
+def fit_batch(
+    samples: Sequence[Sample] | Mapping[str, Sample],
+    model_class: type[Model],
+    loader: Loader | None = None,
+    population: ImplementedPop = "all",
+    emission_data_type: ImplementedEmissionData = "Emission Yield",
+    model_kwargs: dict[str, Any] | None = None,
+    fit_kwargs: dict[str, Any] | None = None,
+    max_workers: int | None = None,
+    chunksize: int = 1,
+) -> pd.DataFrame:
+    """Fit ``model_class`` on every sample, concurrently.
+
+    Parameters
+    ----------
+    samples :
+        Data to fit. A :class:`.DataMatrix` is used as is. A path is set as
+        the ``population``, ``emission_data_type`` file of a new
+        :class:`.DataMatrix` and loaded with ``loader``. If a mapping is
+        given, its keys are used as sample labels; otherwise, labels are the
+        file stems, or ``sample_{index}`` for :class:`.DataMatrix`.
+    model_class :
+        The :class:`.Model` to instantiate and fit for every sample.
+    loader :
+        Object loading the files. The default is a :class:`.PandasLoader`.
+    population :
+        Population of the data held by files given as paths.
+    emission_data_type :
+        Type of data held by files given as paths.
+    model_kwargs :
+        Keyword arguments passed to ``model_class``, eg ``implementation``.
+    fit_kwargs :
+        Keyword arguments passed to :meth:`.Model.find_optimal_parameters`.
+    max_workers :
+        Maximum number of worker processes. The default lets
+        :class:`.ProcessPoolExecutor` decide. If 1, samples are fitted
+        sequentially in the current process, which eases debugging.
+    chunksize :
+        Number of samples sent at once to each worker.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per sample, in the same order as ``samples``. Columns are the
+        sample label, the fit status (``"ok"`` or ``"error"``), the error
+        message, the fitted parameters values and the evaluation criteria
+        given by :meth:`.Model.evaluate`. Parameters and criteria are NaN for
+        failed fits.
+
+    """
+    if isinstance(samples, Mapping):
+        labels = [str(label) for label in samples.keys()]
+        samples = list(samples.values())
+    else:
+        labels = [default_label(i, sample) for i, sample in enumerate(samples)]
+
+    worker = partial(
+        _fit_sample,
+        model_class=model_class,
+        loader=loader if loader is not None else PandasLoader(),
+        population=population,
+        emission_data_type=emission_data_type,
+        model_kwargs=model_kwargs or {},
+        fit_kwargs=fit_kwargs or {},
+    )
+
+    if max_workers == 1:
+        rows = list(map(worker, labels, samples))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            rows = list(
+                executor.map(worker, labels, samples, chunksize=chunksize)
+            )
+
+    n_errors = sum(row[col_status] == "error" for row in rows)
+    if n_errors:
+        logging.warning(f"{n_errors} out of {len(rows)} fits failed.")
+    return pd.DataFrame(rows)
+
+
+def default_label(index: int, sample: Sample) -> str:
+    """Give the label of a sample given without one.
+
+    Parameters
+    ----------
+    index :
+        Position of ``sample`` among the samples.
+    sample :
+        A :class:`.DataMatrix`, or the path to a data file.
+
+    Returns
+    -------
+    str
+        ``sample_{index}`` for a :class:`.DataMatrix`, the file stem
+        otherwise.
+
+    """
+    if isinstance(sample, DataMatrix):
+        return f"sample_{index}"
+    return Path(sample).stem
+
+
+def _fit_sample(
+    label: str,
+    sample: Sample,
+    model_class: type[Model],
+    loader: Loader,
+    population: ImplementedPop,
+    emission_data_type: ImplementedEmissionData,
+    model_kwargs: dict[str, Any],
+    fit_kwargs: dict[str, Any],
+) -> dict[str, Any]:
+    """Load, fit and evaluate a single sample.
+
+    Exceptions are caught and stored in the returned row, so that a single
+    faulty sample does not stop the whole batch.
+
+    """
+    row: dict[str, Any] = {
+        col_sample: label,
+        col_status: "ok",
+        col_error: None,
+    }
+    try:
+        data_matrix = to_data_matrix(
+            sample, loader, population, emission_data_type
+        )
+        model = model_class(**model_kwargs)
+        model.find_optimal_parameters(data_matrix, **fit_kwargs)
+        row.update(
+            {name: param.value for name, param in model.parameters.items()}
+        )
+        row.update(model.evaluate(data_matrix))
+    except Exception as error:
+        logging.error(f"Fit of {label} failed: {error!r}")
+        row[col_status] = "error"
+        row[col_error] = f"{type(error).__name__}: {error}"
+    return row
+
+
+def to_data_matrix(
+    sample: Sample,
+    loader: Loader,
+    population: ImplementedPop,
+    emission_data_type: ImplementedEmissionData,
+) -> DataMatrix:
+    """Create and load a :class:`.DataMatrix` if necessary.
+
+    Parameters
+    ----------
+    sample :
+        A :class:`.DataMatrix`, returned as is, or the path to a data file.
+    loader :
+        Object loading the file.
+    population :
+        Population of the data in the file.
+    emission_data_type :
+        Type of the data in the file.
+
+    Returns
+    -------
+    DataMatrix
+        ``sample``, or a new :class:`.DataMatrix` holding the loaded file.
+
+    """
+    if isinstance(sample, DataMatrix):
+        return sample
+    data_matrix = DataMatrix()
+    data_matrix.set_files(
+        [sample], population=population, emission_data_type=emission_data_type
+    )
+    data_matrix.load_data(loader)
+    return data_matrix
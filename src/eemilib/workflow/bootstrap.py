@@ -0,0 +1,296 @@
+r"""Estimate confidence intervals by bootstrap refitting of measurements.
+
+The measured points of an :class:`.EmissionData` are resampled with
+replacement many times. For every resample, the characteristics of the
+measured emission yield (:math:`E_{c1}`, :math:`E_{c2}`, :math:`E_{max}`,
+:math:`\sigma_{max}`) are extracted and the model is refitted. Resamples are
+distributed over a process pool; every fit warm-starts from the fit on the
+original data.
+
+.. code-block:: python
+
+    result = bootstrap(data_matrix, Vaughan, n_resamples=500)
+    result.summary(confidence=0.95)
+
+"""
+
+import copy
+import logging
+import math
+import os
+import warnings
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from eemilib.emission_data.data_matrix import DataMatrix
+from eemilib.emission_data.emission_data import EmissionData
+from eemilib.emission_data.emission_yield import EmissionYield
+from eemilib.model.model import Model
+from eemilib.model.uncertainty import quantiles
+from eemilib.util.constants import (
+    ImplementedEmissionData,
+    ImplementedPop,
+    col_energy,
+)
+
+#: Group of the columns holding the characteristics of the measurements.
+MEASURED = "measured"
+#: Group of the columns holding the fitted parameters.
+PARAMETERS = "parameters"
+#: Names of the measured emission yield characteristics.
+CHARACTERISTICS = ("E_c1", "E_c2", "E_max", "ey_max")
+
+
+class BootstrapResult:
+    """Hold the values obtained for every resample."""
+
+    def __init__(self, nominal: pd.Series, resamples: pd.DataFrame) -> None:
+        """Store the results.
+
+        Parameters
+        ----------
+        nominal :
+            Values obtained with the original data. Index has two levels:
+            :data:`MEASURED` or :data:`PARAMETERS`, and the name of the
+            value.
+        resamples :
+            One row per resample. Columns have the same two levels as
+            ``nominal``. Values are NaN when the resample failed.
+
+        """
+        self.nominal = nominal
+        self.resamples = resamples
+
+    def __len__(self) -> int:
+        """Give number of resamples."""
+        return len(self.resamples)
+
+    @property
+    def n_failed(self) -> int:
+        """Give number of resamples which fit failed."""
+        return int(self.resamples[PARAMETERS].isna().all(axis=1).sum())
+
+    def interval(
+        self, name: str, group: str = PARAMETERS, confidence: float = 0.95
+    ) -> tuple[float, float]:
+        """Give the percentile confidence interval of a value.
+
+        Parameters
+        ----------
+        name :
+            Name of the value, eg ``"E_max"``.
+        group :
+            :data:`PARAMETERS` for a fitted parameter, :data:`MEASURED` for a
+            characteristic of the measurements.
+        confidence :
+            Probability for the value to lie in the interval.
+
+        """
+        lower, upper = np.nanquantile(
+            self.resamples[group, name].to_numpy(dtype=np.float64),
+            quantiles(confidence),
+        )
+        return float(lower), float(upper)
+
+    def summary(self, confidence: float = 0.95) -> pd.DataFrame:
+        """Summarize the distribution of every value.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per value. Columns are the nominal value, mean and
+            standard deviation of the resamples, bounds of the percentile
+            confidence interval and number of valid resamples.
+
+        """
+        values = self.resamples.to_numpy(dtype=np.float64)
+        with warnings.catch_warnings():
+            # Values never defined, eg E_c2 above the measured energies
+            warnings.simplefilter("ignore", RuntimeWarning)
+            lower, upper = np.nanquantile(
+                values, quantiles(confidence), axis=0
+            )
+            mean = np.nanmean(values, axis=0)
+            std = np.nanstd(values, axis=0, ddof=1)
+        return pd.DataFrame(
+            {
+                "nominal": self.nominal.reindex(self.resamples.columns),
+                "mean": mean,
+                "std": std,
+                "lower": lower,
+                "upper": upper,
+                "n_valid": np.sum(~np.isnan(values), axis=0),
+            },
+            index=self.resamples.columns,
+        )
+
+
+def bootstrap(
+    data_matrix: DataMatrix,
+    model_class: type[Model],
+    n_resamples: int = 200,
+    population: ImplementedPop = "all",
+    emission_data_type: ImplementedEmissionData = "Emission Yield",
+    model_kwargs: dict[str, Any] | None = None,
+    fit_kwargs: dict[str, Any] | None = None,
+    seed: int | None = None,
+    max_workers: int | None = None,
+    chunksize: int | None = None,
+) -> BootstrapResult:
+    """Refit ``model_class`` on resampled measurements.
+
+    Parameters
+    ----------
+    data_matrix :
+        Holds the measured data. It is not modified.
+    model_class :
+        The :class:`.Model` to fit.
+    n_resamples :
+        Number of resamples.
+    population :
+        Population of the resampled data.
+    emission_data_type :
+        Type of the resampled data. Other data in ``data_matrix`` are used
+        as is.
+    model_kwargs :
+        Keyword arguments passed to ``model_class``, eg ``implementation``.
+    fit_kwargs :
+        Keyword arguments passed to :meth:`.Model.find_optimal_parameters`.
+        Results of bootstrap fits are not cached.
+    seed :
+        Seed of the resampling. Results do not depend on ``max_workers`` nor
+        ``chunksize``.
+    max_workers :
+        Maximum number of worker processes. The default lets
+        :class:`.ProcessPoolExecutor` decide. If 1, resamples are fitted
+        sequentially in the current process.
+    chunksize :
+        Number of resamples sent at once to each worker. The default gives
+        about four chunks per worker.
+
+    """
+    emission_data = data_matrix.get_data(
+        population=population, emission_data_type=emission_data_type
+    )
+    if not isinstance(emission_data, EmissionData):
+        raise ValueError(
+            f"No {population} {emission_data_type} data in {data_matrix}."
+        )
+
+    model = model_class(**(model_kwargs or {}))
+    fit_kwargs = (fit_kwargs or {}) | {"use_cache": False}
+    model.find_optimal_parameters(data_matrix, **fit_kwargs)
+    nominal = pd.Series(_to_row(emission_data, model))
+
+    seeds = np.random.SeedSequence(seed).spawn(n_resamples)
+    if chunksize is None:
+        n_workers = max_workers or os.cpu_count() or 1
+        chunksize = max(1, math.ceil(n_resamples / (4 * n_workers)))
+    chunks = [
+        seeds[start : start + chunksize]
+        for start in range(0, n_resamples, chunksize)
+    ]
+    worker = partial(
+        _fit_resamples,
+        data_matrix=data_matrix,
+        emission_data=emission_data,
+        emission_data_type=emission_data_type,
+        model=model,
+        fit_kwargs=fit_kwargs,
+    )
+    if max_workers == 1:
+        rows = [row for chunk in map(worker, chunks) for row in chunk]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            rows = [
+                row for chunk in executor.map(worker, chunks) for row in chunk
+            ]
+
+    resamples = pd.DataFrame(rows, columns=nominal.index, dtype=np.float64)
+    result = BootstrapResult(nominal, resamples)
+    if result.n_failed:
+        logging.warning(
+            f"{result.n_failed} out of {n_resamples} bootstrap fits failed."
+        )
+    return result
+
+
+def resample(
+    emission_data: EmissionData, rng: np.random.Generator
+) -> EmissionData:
+    """Draw measured points with replacement.
+
+    Points are sorted by energy. A point drawn several times appears several
+    times, so that it weighs more in the fits. Characteristics of an
+    :class:`.EmissionYield` are interpolated between distinct energies.
+
+    """
+    data = emission_data.data
+    indexes = np.sort(rng.integers(0, len(data), size=len(data)))
+    resampled = data.iloc[indexes].sort_values(col_energy, kind="stable")
+    return type(emission_data)(
+        emission_data.population, resampled.reset_index(drop=True)
+    )
+
+
+def _fit_resamples(
+    seeds: Sequence[np.random.SeedSequence],
+    data_matrix: DataMatrix,
+    emission_data: EmissionData,
+    emission_data_type: ImplementedEmissionData,
+    model: Model,
+    fit_kwargs: dict[str, Any],
+) -> list[dict[tuple[str, str], float]]:
+    """Resample the data and refit the model, once per seed.
+
+    Every fit starts from the nominal parameter values. Errors are caught,
+    so that a single failed fit does not stop the bootstrap.
+
+    """
+    data_matrix = copy.deepcopy(data_matrix)
+    model = copy.deepcopy(model)
+    nominal_values = {
+        name: param.value for name, param in model.parameters.items()
+    }
+    rows = []
+    for seed in seeds:
+        rng = np.random.default_rng(seed)
+        try:
+            resampled = resample(emission_data, rng)
+            data_matrix.set_data(
+                resampled,
+                population=emission_data.population,
+                emission_data_type=emission_data_type,
+            )
+            model.set_parameters_values(nominal_values)
+            model.find_optimal_parameters(data_matrix, **fit_kwargs)
+            rows.append(_to_row(resampled, model))
+        except Exception as error:
+            logging.debug(f"Bootstrap fit failed: {error!r}")
+            rows.append({})
+    return rows
+
+
+def _to_row(
+    emission_data: EmissionData, model: Model
+) -> dict[tuple[str, str], float]:
+    """Gather measured characteristics and fitted parameter values."""
+    row: dict[tuple[str, str], float] = {}
+    if isinstance(emission_data, EmissionYield) and hasattr(
+        emission_data, "e_max"
+    ):
+        measured = (
+            emission_data.e_c1,
+            emission_data.e_c2,
+            emission_data.e_max,
+            emission_data.ey_max,
+        )
+        for name, value in zip(CHARACTERISTICS, measured):
+            row[MEASURED, name] = np.nan if value is None else float(value)
+    for name, param in model.parameters.items():
+        row[PARAMETERS, name] = float(param.value)
+    return row
@@ -0,0 +1,419 @@
+"""Render measured and modelled data of many samples, without GUI.
+
+Every sample is loaded, fitted and evaluated as in :func:`.fit_batch`; a
+figure comparing the measured data with the fitted model is saved for each
+of them, and the evaluation criteria of all samples are gathered in a table.
+The figure has one panel per loaded data: the fitted data, the other data of
+the model configuration, then any other data of the sample (eg energy
+distributions next to a |TEEY|).
+Samples are distributed over a process pool. Figures are drawn with the Agg
+backend, and every worker process reuses the same figure for all its
+samples.
+
+.. code-block:: python
+
+    samples = samples_from_directory("campaign/", pattern="*.csv")
+    table = render_reports(samples, Vaughan, "campaign/report")
+
+The same is available from the command line:
+
+.. code-block:: bash
+
+    eemilib-report campaign/ --model Vaughan --formats png pdf
+
+"""
+
+import argparse
+import logging
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from eemilib.core.registry import load_plugin
+from eemilib.emission_data.data_matrix import DataKey, DataMatrix
+from eemilib.emission_data.emission_data import EmissionData
+from eemilib.loader.loader import Loader
+from eemilib.loader.pandas_loader import PandasLoader
+from eemilib.model.model import Model
+from eemilib.plotter.pandas import PandasPlotter
+from eemilib.util.constants import (
+    IMPLEMENTED_EMISSION_DATA,
+    IMPLEMENTED_POP,
+    ImplementedEmissionData,
+    ImplementedPop,
+)
+from eemilib.util.log_manager import set_up_logging
+from eemilib.workflow.batch import (
+    Sample,
+    col_error,
+    col_sample,
+    col_status,
+    default_label,
+    to_data_matrix,
+)
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from numpy.typing import NDArray
+
+#: Name of the file holding the evaluations of all samples.
+EVALUATIONS_FILENAME = "evaluations.csv"
+
+
+def samples_from_directory(
+    directory: str | Path, pattern: str = "*.csv"
+) -> dict[str, Path]:
+    """Give the files of ``directory`` matching ``pattern``.
+
+    Returns
+    -------
+    dict[str, Path]
+        Keys are the file stems, used as sample labels; files are sorted by
+        name.
+
+    """
+    filepaths = sorted(Path(directory).glob(pattern))
+    if not filepaths:
+        logging.warning(f"No file matching {pattern} in {directory}.")
+    return {filepath.stem: filepath for filepath in filepaths}
+
+
+def render_reports(
+    samples: Sequence[Sample] | Mapping[str, Sample],
+    model_class: type[Model],
+    output_dir: str | Path,
+    loader: Loader | None = None,
+    population: ImplementedPop = "all",
+    emission_data_type: ImplementedEmissionData = "Emission Yield",
+    energies: NDArray[np.float64] | None = None,
+    angles: NDArray[np.float64] | None = None,
+    formats: Sequence[str] = ("png",),
+    model_kwargs: dict[str, Any] | None = None,
+    fit_kwargs: dict[str, Any] | None = None,
+    figsize: tuple[float, float] = (6.4, 4.8),
+    dpi: float = 100.0,
+    max_workers: int | None = None,
+    chunksize: int = 1,
+) -> pd.DataFrame:
+    """Fit ``model_class`` on every sample, save figures and evaluations.
+
+    The figure of a sample is saved as ``{output_dir}/{label}.{format}``, for
+    every format. It has one panel per data loaded in the sample, the fitted
+    data being the first one. The evaluations are saved in
+    ``{output_dir}/evaluations.csv``.
+
+    Parameters
+    ----------
+    samples :
+        Data to fit, see :func:`.fit_batch`.
+    model_class :
+        The :class:`.Model` to instantiate and fit for every sample.
+    output_dir :
+        Where figures and evaluations are saved. It is created if necessary.
+    loader :
+        Object loading the files. The default is a :class:`.PandasLoader`.
+    population :
+        Population of the data to fit and to plot.
+    emission_data_type :
+        Type of the data to fit and to plot.
+    energies :
+        Energies in :unit:`eV` at which the model is plotted on the panel of
+        the fitted data. The default, always used on other panels, is 1001
+        points spanning the measured energies.
+    angles :
+        Angles in :unit:`deg` at which the model is plotted on the panel of
+        the fitted data. The default, always used on other panels, is the
+        measured angles.
+    formats :
+        Formats of the saved figures, eg ``("png", "pdf")``.
+    model_kwargs :
+        Keyword arguments passed to ``model_class``, eg ``implementation``.
+    fit_kwargs :
+        Keyword arguments passed to :meth:`.Model.find_optimal_parameters`.
+    figsize :
+        Size of every panel of the figures in inches.
+    dpi :
+        Resolution of the raster figures.
+    max_workers :
+        Maximum number of worker processes. The default lets
+        :class:`.ProcessPoolExecutor` decide. If 1, samples are processed
+        sequentially in the current process.
+    chunksize :
+        Number of samples sent at once to each worker.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per sample, in the same order as ``samples``, with the same
+        columns as the output of :func:`.fit_batch`.
+
+    """
+    if isinstance(samples, Mapping):
+        labels = [str(label) for label in samples.keys()]
+        samples = list(samples.values())
+    else:
+        labels = [default_label(i, sample) for i, sample in enumerate(samples)]
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    worker = partial(
+        _report_sample,
+        model_class=model_class,
+        output_dir=output_dir,
+        loader=loader if loader is not None else PandasLoader(),
+        population=population,
+        emission_data_type=emission_data_type,
+        energies=energies,
+        angles=angles,
+        formats=tuple(formats),
+        model_kwargs=model_kwargs or {},
+        fit_kwargs=fit_kwargs or {},
+        figsize=figsize,
+        dpi=dpi,
+    )
+
+    if max_workers == 1:
+        rows = list(map(worker, labels, samples))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            rows = list(
+                executor.map(worker, labels, samples, chunksize=chunksize)
+            )
+
+    n_errors = sum(row[col_status] == "error" for row in rows)
+    if n_errors:
+        logging.warning(f"{n_errors} out of {len(rows)} reports failed.")
+    table = pd.DataFrame(rows)
+    table.to_csv(output_dir / EVALUATIONS_FILENAME, index=False)
+    return table
+
+
+def _report_sample(
+    label: str,
+    sample: Sample,
+    model_class: type[Model],
+    output_dir: Path,
+    loader: Loader,
+    population: ImplementedPop,
+    emission_data_type: ImplementedEmissionData,
+    energies: NDArray[np.float64] | None,
+    angles: NDArray[np.float64] | None,
+    formats: tuple[str, ...],
+    model_kwargs: dict[str, Any],
+    fit_kwargs: dict[str, Any],
+    figsize: tuple[float, float],
+    dpi: float,
+) -> dict[str, Any]:
+    """Load, fit, evaluate and plot a single sample.
+
+    Exceptions are caught and stored in the returned row, so that a single
+    faulty sample does not stop the whole batch.
+
+    """
+    row: dict[str, Any] = {
+        col_sample: label,
+        col_status: "ok",
+        col_error: None,
+    }
+    try:
+        data_matrix = to_data_matrix(
+            sample, loader, population, emission_data_type
+        )
+        model = model_class(**model_kwargs)
+        model.find_optimal_parameters(data_matrix, **fit_kwargs)
+        row.update(
+            {name: param.value for name, param in model.parameters.items()}
+        )
+        row.update(model.evaluate(data_matrix))
+
+        fitted = (population, emission_data_type)
+        panels = _panels(data_matrix, model, fitted)
+        figure, all_axes = _figure_template(figsize, dpi, len(panels))
+        for axes, panel in zip(all_axes, panels):
+            axes.clear()
+            is_fitted = panel == fitted
+            _plot_sample(
+                axes,
+                data_matrix,
+                model,
+                *panel,
+                energies=energies if is_fitted else None,
+                angles=angles if is_fitted else None,
+            )
+        figure.suptitle(label)
+        for extension in formats:
+            figure.savefig(output_dir / f"{label}.{extension}", dpi=dpi)
+    except Exception as error:
+        logging.error(f"Report of {label} failed: {error!r}")
+        row[col_status] = "error"
+        row[col_error] = f"{type(error).__name__}: {error}"
+    return row
+
+
+def _panels(
+    data_matrix: DataMatrix, model: Model, fitted: DataKey
+) -> list[DataKey]:
+    """Give the data to plot, one per panel.
+
+    The fitted data comes first, then the other data of the model
+    configuration, then the other data loaded in ``data_matrix``.
+
+    """
+    config = model.model_config
+    candidates = [fitted] + [
+        (population, emission_data_type)
+        for emission_data_type in IMPLEMENTED_EMISSION_DATA
+        for population in config.mandatory_populations(emission_data_type)
+    ]
+    loaded = [key for key, _ in data_matrix.items()]
+    return [
+        key
+        for key in dict.fromkeys(candidates + loaded)
+        if key == fitted or key in loaded
+    ]
+
+
+@lru_cache(maxsize=4)
+def _figure_template(
+    figsize: tuple[float, float], dpi: float, n_panels: int = 1
+) -> tuple[Figure, list[Axes]]:
+    """Create the figure reused for all the samples of a process.
+
+    The figure is not handled by :mod:`matplotlib.pyplot`, and is drawn by
+    the Agg backend whatever the backend of the current process.
+
+    """
+    width, height = figsize
+    figure = Figure(
+        figsize=(width * n_panels, height), dpi=dpi, layout="tight"
+    )
+    FigureCanvasAgg(figure)
+    all_axes = list(figure.subplots(1, n_panels, squeeze=False)[0])
+    return figure, all_axes
+
+
+def _plot_sample(
+    axes: Axes,
+    data_matrix: DataMatrix,
+    model: Model,
+    population: ImplementedPop,
+    emission_data_type: ImplementedEmissionData,
+    energies: NDArray[np.float64] | None,
+    angles: NDArray[np.float64] | None,
+) -> None:
+    """Plot measured and modelled data on ``axes``."""
+    measured = data_matrix.get_data(
+        population=population, emission_data_type=emission_data_type
+    )
+    if not isinstance(measured, EmissionData):
+        raise ValueError(
+            f"No {population} {emission_data_type} data in {data_matrix}."
+        )
+    if energies is None:
+        energies = np.linspace(
+            np.min(measured.energies), np.max(measured.energies), 1001
+        )
+    if angles is None:
+        angles = np.asarray(measured.angles, dtype=np.float64)
+
+    plotter = PandasPlotter()
+    data_matrix.plot(
+        plotter,
+        population=population,
+        emission_data_type=emission_data_type,
+        axes=axes,
+    )
+    model.plot(
+        plotter,
+        population=population,
+        emission_data_type=emission_data_type,
+        energies=energies,
+        angles=angles,
+        axes=axes,
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Render the reports of the files of a directory."""
+    parser = argparse.ArgumentParser(
+        prog="eemilib-report",
+        description=(
+            "Fit a model on every file of a directory; save a figure per "
+            "file and a table of evaluations."
+        ),
+    )
+    parser.add_argument("directory", type=Path, help="Folder of the files.")
+    parser.add_argument(
+        "-m", "--model", default="Vaughan", help="Name of the model to fit."
+    )
+    parser.add_argument(
+        "-l", "--loader", default="PandasLoader", help="Name of the loader."
+    )
+    parser.add_argument(
+        "-p", "--pattern", default="*.csv", help="Pattern of the files."
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=None,
+        help="Output folder. The default is a report/ subfolder.",
+    )
+    parser.add_argument("--population", default="all", choices=IMPLEMENTED_POP)
+    parser.add_argument(
+        "--emission-data-type",
+        default="Emission Yield",
+        choices=IMPLEMENTED_EMISSION_DATA,
+    )
+    parser.add_argument(
+        "-f",
+        "--formats",
+        nargs="+",
+        default=["png"],
+        help="Formats of the figures.",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes. The default uses all cores.",
+    )
+    parser.add_argument(
+        "--log-file",
+        type=Path,
+        default=None,
+        help="Log file. The default is eemilib.log in the output folder.",
+    )
+    args = parser.parse_args(argv)
+
+    output_dir = args.output or args.directory / "report"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    set_up_logging(
+        "EEmiLib", logfile_file=args.log_file or output_dir / "eemilib.log"
+    )
+    model_class = load_plugin("Model", args.model)
+    loader = load_plugin("Loader", args.loader)()
+
+    table = render_reports(
+        samples_from_directory(args.directory, args.pattern),
+        model_class,
+        output_dir,
+        loader=loader,
+        population=args.population,
+        emission_data_type=args.emission_data_type,
+        formats=args.formats,
+        max_workers=args.workers,
+    )
+    n_ok = int((table[col_status] == "ok").sum()) if len(table) else 0
+    logging.info(
+        f"{n_ok} out of {len(table)} reports written in {output_dir}."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+"""Study how the parameters of a :class:`.Model` affect its outputs.
+
+Parameters are sampled on a grid or with a Latin hypercube. For every sample,
+the characteristics of the modelled emission yield (crossover energies,
+maximum) and, optionally, the :meth:`.Model.evaluate` criteria are computed,
+in a process pool. Full curves are computed for all samples at once with
+the vectorized model kernel (see :mod:`.kernels`).
+
+.. code-block:: python
+
+    result = sweep(
+        Vaughan(),
+        {"k_s": np.linspace(0.0, 2.0, 21), "k_se": np.linspace(0.0, 2.0, 21)},
+    )
+    heatmap = result.grid("E_c1")  # shape (21, 21)
+
+"""
+
+import copy
+import logging
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import product
+from typing import Any, Literal
+
+import numpy as np
+import pandas as pd
+from eemilib.emission_data.data_matrix import DataMatrix
+from eemilib.model.model import Model
+from eemilib.util.constants import ImplementedPop
+from numpy.typing import ArrayLike, NDArray
+
+SamplingMethod = Literal["grid", "lhs"]
+
+
+class SweepResult:
+    """Hold the samples of a sweep and the corresponding outputs."""
+
+    def __init__(
+        self,
+        parameter_names: Sequence[str],
+        samples: NDArray[np.float64],
+        metric_names: Sequence[str],
+        metrics: NDArray[np.float64],
+        grid_shape: tuple[int, ...] | None = None,
+        energy: NDArray[np.float64] | None = None,
+        theta: NDArray[np.float64] | None = None,
+        curves: NDArray[np.float64] | None = None,
+    ) -> None:
+        """Store the results.
+
+        Parameters
+        ----------
+        parameter_names :
+            Names of the swept parameters.
+        samples :
+            Parameter values, of shape ``(n_samples, n_parameters)``.
+        metric_names :
+            Names of the computed metrics.
+        metrics :
+            Metric values, of shape ``(n_samples, n_metrics)``. NaN when the
+            computation failed.
+        grid_shape :
+            Number of values of every parameter, for grid samplings.
+        energy :
+            Energies of the curves in :unit:`eV`.
+        theta :
+            Angles of the curves in :unit:`deg`.
+        curves :
+            Modelled values, of shape ``(n_samples, n_energy, n_theta)``.
+
+        """
+        self.parameter_names = tuple(parameter_names)
+        self.samples = samples
+        self.metric_names = tuple(metric_names)
+        self.metrics = metrics
+        self.grid_shape = grid_shape
+        self.energy = energy
+        self.theta = theta
+        self.curves = curves
+
+    def __len__(self) -> int:
+        """Give number of samples."""
+        return self.samples.shape[0]
+
+    def __getitem__(self, metric: str) -> NDArray[np.float64]:
+        """Give the values of ``metric`` for every sample."""
+        return self.metrics[:, self.metric_names.index(metric)]
+
+    def grid(self, metric: str) -> NDArray[np.float64]:
+        """Give ``metric`` reshaped on the grid of parameters, for heatmaps.
+
+        Axis ``i`` of the returned array corresponds to parameter
+        ``parameter_names[i]``.
+
+        Raises
+        ------
+        ValueError
+            If samples were not taken on a grid.
+
+        """
+        if self.grid_shape is None:
+            raise ValueError("Samples were not taken on a grid.")
+        return self[metric].reshape(self.grid_shape)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Give one row per sample, with parameters and metrics values.
+
+        Columns are grouped under ``"parameters"`` and ``"metrics"``, as a
+        metric can have the same name as a parameter (eg ``E_max``).
+
+        """
+        columns = pd.MultiIndex.from_tuples(
+            [("parameters", name) for name in self.parameter_names]
+            + [("metrics", name) for name in self.metric_names]
+        )
+        return pd.DataFrame(
+            np.hstack((self.samples, self.metrics)), columns=columns
+        )
+
+
+def grid_samples(
+    ranges: Mapping[str, ArrayLike],
+) -> tuple[NDArray[np.float64], tuple[int, ...]]:
+    """Give all the combinations of the parameter values.
+
+    Returns
+    -------
+    NDArray[np.float64]
+        Samples, of shape ``(n_samples, n_parameters)``. Last parameter
+        varies fastest.
+    tuple[int, ...]
+        Number of values of every parameter.
+
+    """
+    values = [
+        np.atleast_1d(np.asarray(v, dtype=np.float64)) for v in ranges.values()
+    ]
+    samples = np.array(list(product(*values)), dtype=np.float64)
+    return samples.reshape(-1, len(values)), tuple(v.size for v in values)
+
+
+def latin_hypercube_samples(
+    ranges: Mapping[str, ArrayLike], n_samples: int, seed: int | None = None
+) -> NDArray[np.float64]:
+    """Draw parameter values with a Latin hypercube.
+
+    Only the minimum and maximum of every range are used.
+
+    Returns
+    -------
+    NDArray[np.float64]
+        Samples, of shape ``(n_samples, n_parameters)``.
+
+    """
+    from scipy.stats import qmc
+
+    lower = [float(np.min(v)) for v in ranges.values()]
+    upper = [float(np.max(v)) for v in ranges.values()]
+    unit_samples = qmc.LatinHypercube(d=len(lower), seed=seed).random(
+        n_samples
+    )
+    return lower + unit_samples * (np.array(upper) - lower)
+
+
+def sweep(
+    model: Model,
+    ranges: Mapping[str, ArrayLike],
+    method: SamplingMethod = "grid",
+    n_samples: int = 64,
+    seed: int | None = None,
+    population: ImplementedPop | None = None,
+    data_matrix: DataMatrix | None = None,
+    energy: NDArray[np.float64] | None = None,
+    theta: NDArray[np.float64] | None = None,
+    e_low: float = 0.0,
+    e_high: float = 1e3,
+    max_workers: int | None = 1,
+    chunksize: int = 64,
+) -> SweepResult:
+    """Evaluate ``model`` for many values of its parameters.
+
+    Parameters
+    ----------
+    model :
+        Model to study. It is not modified; parameters that are not swept
+        keep their current value.
+    ranges :
+        Keys are parameter names, values the parameter values.
+    method :
+        ``"grid"`` evaluates all the combinations of the values in
+        ``ranges``. ``"lhs"`` draws ``n_samples`` samples with a Latin
+        hypercube between the minimum and maximum of every range.
+    n_samples :
+        Number of samples for the Latin hypercube.
+    seed :
+        Seed of the Latin hypercube.
+    population :
+        Population which emission yield characteristics are computed, see
+        :meth:`.Model.yield_characteristics`. The default is the first of
+        :attr:`.Model.populations`.
+    data_matrix :
+        If provided, the :meth:`.Model.evaluate` criteria are computed
+        against this data for every sample.
+    energy :
+        If provided, full curves are computed at these energies in
+        :unit:`eV`, with the model kernel.
+    theta :
+        Angles of the curves in :unit:`deg`. The default is normal
+        incidence.
+    e_low, e_high :
+        Bounds of the search for crossover energies and maximum, in
+        :unit:`eV`.
+    max_workers :
+        Number of worker processes computing the metrics. If 1, they are
+        computed sequentially in the current process.
+    chunksize :
+        Number of samples sent at once to every worker.
+
+    """
+    unknown = set(ranges) - set(model.parameters)
+    if unknown:
+        raise ValueError(f"{unknown} are not parameters of {model}.")
+
+    grid_shape = None
+    if method == "grid":
+        samples, grid_shape = grid_samples(ranges)
+    elif method == "lhs":
+        samples = latin_hypercube_samples(ranges, n_samples, seed)
+    else:
+        raise ValueError(f"{method = } should be 'grid' or 'lhs'.")
+    names = list(ranges)
+
+    worker = partial(
+        _evaluate_samples,
+        model=model,
+        names=names,
+        population=population or model.populations[0],
+        data_matrix=data_matrix,
+        e_low=e_low,
+        e_high=e_high,
+    )
+    chunks = [
+        samples[start : start + chunksize]
+        for start in range(0, len(samples), chunksize)
+    ]
+    if max_workers == 1:
+        rows = [row for chunk in map(worker, chunks) for row in chunk]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            rows = [
+                row for chunk in executor.map(worker, chunks) for row in chunk
+            ]
+
+    metric_names = list(next((row for row in rows if row), {}))
+    metrics = np.array(
+        [[row.get(name, np.nan) for name in metric_names] for row in rows],
+        dtype=np.float64,
+    ).reshape(len(rows), len(metric_names))
+    n_errors = sum(not row for row in rows)
+    if n_errors:
+        logging.warning(f"{n_errors} out of {len(rows)} samples failed.")
+
+    result = SweepResult(names, samples, metric_names, metrics, grid_shape)
+    if energy is not None:
+        if theta is None:
+            theta = np.zeros(1)
+        result.energy = np.asarray(energy, dtype=np.float64)
+        result.theta = (
+            np.asarray(theta, dtype=np.float64) if model.is_3d else np.zeros(1)
+        )
+        result.curves = sweep_curves(model, names, samples, energy, theta)
+    return result
+
+
+def sweep_curves(
+    model: Model,
+    names: Sequence[str],
+    samples: NDArray[np.float64],
+    energy: NDArray[np.float64],
+    theta: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """Compute the model curves for all samples in a single kernel call.
+
+    See :meth:`.Model.kernel_parameters_vectors` and
+    :meth:`.Model.batch_kernel`.
+
+    Returns
+    -------
+    NDArray[np.float64]
+        Modelled values, of shape ``(n_samples, n_energy, n_theta)``.
+        ``n_theta`` is 1 for models that do not depend on the angle. Curves
+        of samples which parameters are invalid are NaN.
+
+    """
+    vectors = model.kernel_parameters_vectors(names, samples)
+    return model.batch_kernel(vectors, energy, theta)
+
+
+def _evaluate_samples(
+    samples: NDArray[np.float64],
+    model: Model,
+    names: Sequence[str],
+    population: ImplementedPop,
+    data_matrix: DataMatrix | None,
+    e_low: float,
+    e_high: float,
+) -> list[dict[str, Any]]:
+    """Compute the metrics of several samples.
+
+    A sample raising an error gives an empty dictionary, so that it does not
+    stop the whole sweep.
+
+    """
+    model = copy.deepcopy(model)
+    rows = []
+    for sample in samples:
+        try:
+            values = dict(zip(names, sample))
+            model.set_parameters_values(
+                values | model._derived_parameters_values(values)
+            )
+            row = model.yield_characteristics(population, e_low, e_high)
+            if data_matrix is not None:
+                row.update(model.evaluate(data_matrix))
+        except Exception as error:
+            logging.debug(f"Sample {sample} failed: {error!r}")
+            row = {}
+        rows.append(row)
+    return rows
@@ -0,0 +1,111 @@
+"""Test the registry of loaders, models and plotters."""
+
+import json
+import subprocess
+import sys
+from importlib.metadata import EntryPoint
+
+import pytest
+from eemilib.core import registry
+from eemilib.core.registry import (
+    BASE_CLASSES,
+    BUILTIN_PLUGINS,
+    PLUGIN_KINDS,
+    available_plugins,
+    load_plugin,
+    register_plugin,
+    unregister_plugin,
+)
+from eemilib.util.helper import get_classes
+
+
+@pytest.fixture
+def cleanup_registered():
+    """Remove the plugins registered during a test."""
+    yield
+    for kind in PLUGIN_KINDS:
+        registry._registered[kind].clear()
+
+
+@pytest.mark.parametrize(
+    "kind, package",
+    [
+        ("Loader", "eemilib.loader"),
+        ("Model", "eemilib.model"),
+        ("Plotter", "eemilib.plotter"),
+    ],
+)
+def test_manifest_matches_package(kind: str, package: str) -> None:
+    """Check that the manifest lists every class of the package."""
+    base_class = registry._import_target(BASE_CLASSES[kind])
+    expected = {
+        name: f"{module}:{name}"
+        for name, module in get_classes(package, base_class).items()
+    }
+    assert BUILTIN_PLUGINS[kind] == expected
+
+
+@pytest.mark.parametrize("kind", PLUGIN_KINDS)
+def test_load_builtins(kind: str) -> None:
+    """Check that every built-in plugin can be imported."""
+    for name in BUILTIN_PLUGINS[kind]:
+        assert load_plugin(kind, name).__name__ == name
+
+
+def test_listing_does_not_import() -> None:
+    """Check that listing plugins does not import them."""
+    code = (
+        "import json, sys\n"
+        "from eemilib.core.registry import available_plugins\n"
+        "for kind in ('Loader', 'Model', 'Plotter'):\n"
+        "    available_plugins(kind)\n"
+        "print(json.dumps(sorted(sys.modules)))"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+    loaded = json.loads(output.splitlines()[-1])
+    for module in ("eemilib.model.vaughan", "eemilib.loader", "matplotlib"):
+        assert module not in loaded
+
+
+def test_register_plugin(cleanup_registered) -> None:
+    """Check that a plugin registered at runtime can be loaded."""
+    register_plugin("Model", "MyModel", "eemilib.model.vaughan:Vaughan")
+    assert available_plugins("Model")["MyModel"] == (
+        "eemilib.model.vaughan:Vaughan"
+    )
+    assert load_plugin("Model", "MyModel").__name__ == "Vaughan"
+
+    unregister_plugin("Model", "MyModel")
+    assert "MyModel" not in available_plugins("Model")
+
+
+def test_entry_points(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Check that plugins declared as entry points are listed."""
+    entry_point = EntryPoint(
+        name="ThirdParty",
+        value="eemilib.model.sombrin:Sombrin",
+        group="eemilib.models",
+    )
+
+    def fake_entry_points(group: str) -> list[EntryPoint]:
+        return [entry_point] if group == entry_point.group else []
+
+    monkeypatch.setattr(registry, "entry_points", fake_entry_points)
+    assert "ThirdParty" in available_plugins("Model")
+    assert "ThirdParty" not in available_plugins("Loader")
+    assert load_plugin("Model", "ThirdParty").__name__ == "Sombrin"
+
+
+def test_wrong_base_class(cleanup_registered) -> None:
+    """Check that a plugin must inherit from the proper base class."""
+    register_plugin("Loader", "NotALoader", "eemilib.model.vaughan:Vaughan")
+    with pytest.raises(TypeError):
+        load_plugin("Loader", "NotALoader")
+
+
+def test_unknown_plugin() -> None:
+    """Check error when the plugin does not exist."""
+    with pytest.raises(KeyError):
+        load_plugin("Model", "DoesNotExist")
+    with pytest.raises(ValueError):
+        available_plugins("Unknown")
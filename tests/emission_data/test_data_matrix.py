@@ -0,0 +1,149 @@
+"""Test the storage of files and data in :class:`.DataMatrix`."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from eemilib import emission_energy_ag, teey_cu
+from eemilib.emission_data.data_matrix import (
+    DataMatrix,
+    MissingDataError,
+    n_cols,
+    n_rows,
+)
+from eemilib.emission_data.emission_energy_distribution import (
+    EmissionEnergyDistribution,
+)
+from eemilib.emission_data.emission_yield import EmissionYield
+from eemilib.loader.pandas_loader import PandasLoader
+from eemilib.util.constants import col_energy, col_normal
+
+
+@pytest.fixture
+def teey() -> EmissionYield:
+    """Create a simple |TEEY|."""
+    energy = np.linspace(0.0, 1000.0, 21)
+    data = pd.DataFrame(
+        {col_energy: energy, col_normal: 2.0 - np.abs(energy - 400.0) / 300}
+    )
+    return EmissionYield("all", data)
+
+
+@pytest.fixture
+def distribution() -> EmissionEnergyDistribution:
+    """Create a simple |SE| energy distribution."""
+    energy = np.linspace(0.0, 50.0, 11)
+    data = pd.DataFrame({col_energy: energy, col_normal: np.exp(-energy)})
+    return EmissionEnergyDistribution("SE", data)
+
+
+@pytest.fixture
+def data_matrix(
+    teey: EmissionYield, distribution: EmissionEnergyDistribution
+) -> DataMatrix:
+    """Create a data matrix holding a |TEEY| and a distribution."""
+    data_matrix = DataMatrix()
+    data_matrix.set_data(
+        teey, population="all", emission_data_type="Emission Yield"
+    )
+    data_matrix.set_data(
+        distribution, population="SE", emission_data_type="Emission Energy"
+    )
+    return data_matrix
+
+
+def test_get_by_natures_and_indexes(
+    data_matrix: DataMatrix, teey: EmissionYield
+) -> None:
+    """Check that data is found by name or by row and column."""
+    assert data_matrix.teey is teey
+    assert data_matrix.get_data(row=3, col=0) is teey
+    assert (
+        data_matrix.get_data(
+            population="all", emission_data_type="Emission Yield"
+        )
+        is teey
+    )
+    assert data_matrix.get_data(row=0, col=0) is None
+    with pytest.raises(MissingDataError):
+        data_matrix.seey
+    with pytest.raises(ValueError):
+        data_matrix.get_data(row=0)
+
+
+def test_get_several(
+    data_matrix: DataMatrix,
+    teey: EmissionYield,
+    distribution: EmissionEnergyDistribution,
+) -> None:
+    """Check the data given for a population or a data type."""
+    assert data_matrix.get_data() == [teey, distribution]
+    assert data_matrix.get_data(population="all") == [teey]
+    assert data_matrix.get_data(emission_data_type="Emission Energy") == [
+        distribution
+    ]
+    assert data_matrix.get_data(population="BE") == []
+
+
+def test_items(
+    data_matrix: DataMatrix,
+    teey: EmissionYield,
+    distribution: EmissionEnergyDistribution,
+) -> None:
+    """Check the iteration over all data."""
+    assert list(data_matrix.items()) == [
+        (("all", "Emission Yield"), teey),
+        (("SE", "Emission Energy"), distribution),
+    ]
+
+
+def test_files(tmp_path: Path) -> None:
+    """Check that files are stored and removed."""
+    data_matrix = DataMatrix()
+    files = [tmp_path / "teey.csv"]
+    data_matrix.set_files(
+        files, population="all", emission_data_type="Emission Yield"
+    )
+
+    assert data_matrix.get_files(row=3, col=0) is files
+    assert data_matrix.files_matrix[3][0] is files
+    with pytest.raises(TypeError):
+        data_matrix.files_matrix[3][0] = None  # type: ignore
+    data_matrix.set_files(None, row=3, col=0)
+    assert data_matrix.files_matrix == ((None,) * n_cols,) * n_rows
+
+
+def test_nested_lists(data_matrix: DataMatrix, teey: EmissionYield) -> None:
+    """Check the compatibility with the former nested lists storage."""
+    nested = data_matrix.data_matrix
+    assert len(nested) == n_rows and len(nested[0]) == n_cols
+    assert nested[3][0] is teey
+
+    other = DataMatrix()
+    other.data_matrix = nested
+    assert other.teey is teey
+    assert list(other.items()) == list(data_matrix.items())
+
+
+def test_load_data_progress() -> None:
+    """Check that loading reports its progress."""
+    data_matrix = DataMatrix()
+    data_matrix.set_files(
+        [Path(teey_cu / "measured_TEEY_Cu_1_eroded.csv")],
+        population="all",
+        emission_data_type="Emission Yield",
+    )
+    data_matrix.set_files(
+        [Path(emission_energy_ag / "corrected_cleanAg0_150eV_2018.05.30.csv")],
+        population="SE",
+        emission_data_type="Emission Energy",
+    )
+    reports = []
+    data_matrix.load_data(
+        PandasLoader(),
+        progress=lambda done, total: reports.append((done, total)),
+    )
+
+    assert reports == [(1, 2), (2, 2)]
+    assert isinstance(data_matrix.teey, EmissionYield)
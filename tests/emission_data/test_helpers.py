@@ -2,8 +2,14 @@
 
 import numpy as np
 import pandas as pd
-from eemilib.emission_data.helper import resample, trim
+from eemilib.emission_data.helper import (
+    crossover_energies,
+    find_crossings,
+    parabolic_maximum,
+    trim,
+)
 from eemilib.util.constants import col_energy, col_normal
+from pytest import approx
 
 
 class TestTrim:
@@ -41,31 +47,49 @@ class TestTrim:
         assert np.array_equal(expected, returned)
 
 
-class TestResample:
-    """Test that resampling emission yield works."""
-
-    def _generate_fake_ey(self, n_points: int) -> pd.DataFrame:
-        """Generate a generic emission yield."""
-        assert n_points % 2 == 1
-        half = int((n_points + 1) / 2)
-        fake_ey = pd.DataFrame(
-            {
-                col_energy: np.linspace(0, 200, n_points),
-                col_normal: np.hstack(
-                    (
-                        np.linspace(0.5, 2.5, half),
-                        np.linspace(2.5, 0.5, half)[1:],
-                    )
-                ),
-            }
+class TestCharacteristics:
+    """Test extraction of characteristics without resampling."""
+
+    energy = np.linspace(0.0, 400.0, 9)
+    ey = 2.0 - ((energy - 210.0) / 100.0) ** 2
+
+    def test_find_crossings(self) -> None:
+        """Test that crossings are interpolated between samples."""
+        returned = find_crossings(self.energy, self.ey)
+        # Linear interpolation between 100 and 150 eV, 300 and 350 eV
+        expected = np.array(
+            [100.0 + 50.0 * 0.21 / 0.85, 300.0 + 50.0 * 0.19 / 1.15]
+        )
+        assert returned == approx(expected)
+
+    def test_find_exact_crossing(self) -> None:
+        """Test that a sample exactly at unity is detected once."""
+        returned = find_crossings(
+            np.array([0.0, 1.0, 2.0]), np.array([0.5, 1.0, 1.5])
+        )
+        assert returned == approx(np.array([1.0]))
+
+    def test_parabolic_maximum(self) -> None:
+        """Test that the vertex of a parabola is found exactly."""
+        e_max, ey_max = parabolic_maximum(self.energy, self.ey)
+        assert e_max == approx(210.0)
+        assert ey_max == approx(2.0)
+
+    def test_parabolic_maximum_at_edge(self) -> None:
+        """Test that a maximum on the last sample is returned as is."""
+        e_max, ey_max = parabolic_maximum(self.energy, self.energy)
+        assert (e_max, ey_max) == (400.0, 400.0)
+
+    def test_crossover_energies(self) -> None:
+        """Test discrimination of first and second crossover energies."""
+        ec1, ec2 = crossover_energies(self.energy, self.ey, e_max=210.0)
+        assert ec1 == approx(100.0 + 50.0 * 0.21 / 0.85)
+        assert ec2 == approx(300.0 + 50.0 * 0.19 / 1.15)
+
+    def test_no_second_crossover(self) -> None:
+        """Test that E_c2 is None when unity is not crossed again."""
+        ec1, ec2 = crossover_energies(
+            self.energy[:6], self.ey[:6], e_max=210.0
         )
-        return fake_ey
-
-    def test_resample(self) -> None:
-        """Test resampling the emission yield."""
-        n_orig, n_resample = 11, 15
-        expected = self._generate_fake_ey(n_resample)
-        original = self._generate_fake_ey(n_orig)
-        returned = resample(original, n_resample)
-        print(returned - expected)
-        assert np.allclose(returned, expected, atol=1e-15)
+        assert ec1 is not None
+        assert ec2 is None
@@ -0,0 +1,14 @@
+"""Define the fixtures shared by the GUI tests."""
+
+import os
+
+import pytest
+from PyQt5.QtWidgets import QApplication
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def app() -> QApplication:
+    """Give the application processing the signals and owning the widgets."""
+    return QApplication.instance() or QApplication([])
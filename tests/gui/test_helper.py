@@ -0,0 +1,75 @@
+"""Test the conversions between parameter values and slider positions."""
+
+import pytest
+from eemilib.gui.helper import (
+    SLIDER_STEPS,
+    set_slider_value,
+    setup_parameter_slider,
+    slider_to_value,
+)
+from eemilib.model.parameter import Parameter
+from PyQt5.QtWidgets import QApplication
+
+
+def _parameter(value: float, low: float = 10.0, high: float = 30.0):
+    """Create a bounded parameter."""
+    return Parameter("x", value=value, lower_bound=low, upper_bound=high)
+
+
+@pytest.mark.parametrize("value", [10.0, 13.37, 20.0, 30.0])
+def test_round_trip(app: QApplication, value: float) -> None:
+    """Check that a value within the bounds goes back and forth."""
+    parameter = _parameter(value)
+    slider = setup_parameter_slider(parameter)
+    assert slider is not None
+
+    back = slider_to_value(slider.value(), parameter)
+    step = (parameter.upper_bound - parameter.lower_bound) / SLIDER_STEPS
+    assert back == pytest.approx(value, abs=0.5 * step)
+
+
+@pytest.mark.parametrize(
+    "value, position", [(-5.0, 0), (9.99, 0), (30.01, SLIDER_STEPS)]
+)
+def test_out_of_bounds_is_clamped(
+    app: QApplication, value: float, position: int
+) -> None:
+    """Check that a value out of the bounds puts the slider at one end."""
+    parameter = _parameter(20.0)
+    slider = setup_parameter_slider(parameter)
+    assert slider is not None
+
+    parameter.value = value
+    set_slider_value(slider, parameter)
+    assert slider.value() == position
+
+
+def test_equal_bounds(app: QApplication) -> None:
+    """Check that a parameter with equal bounds does not divide by zero."""
+    parameter = _parameter(5.0, low=5.0, high=5.0)
+    slider = setup_parameter_slider(parameter)
+    assert slider is not None
+
+    assert slider.value() == 0
+    assert slider_to_value(slider.value(), parameter) == 5.0
+    assert slider_to_value(SLIDER_STEPS, parameter) == 5.0
+
+
+def test_infinite_bounds(app: QApplication) -> None:
+    """Check that no slider is created without finite bounds."""
+    parameter = Parameter("x", value=1.0, lower_bound=0.0)
+    assert setup_parameter_slider(parameter) is None
+
+
+def test_no_signal_is_emitted(app: QApplication) -> None:
+    """Check that moving the slider programmatically emits nothing."""
+    parameter = _parameter(20.0)
+    slider = setup_parameter_slider(parameter)
+    assert slider is not None
+    emitted = []
+    slider.valueChanged.connect(emitted.append)
+
+    parameter.value = 25.0
+    set_slider_value(slider, parameter)
+    assert slider.value() == 750
+    assert emitted == []
@@ -0,0 +1,64 @@
+"""Test the debouncing of the live preview of the model."""
+
+from collections.abc import Iterator
+
+import pytest
+from eemilib.gui.gui import MainWindow
+from PyQt5.QtTest import QTest
+from PyQt5.QtWidgets import QApplication
+
+
+@pytest.fixture
+def calls(monkeypatch: pytest.MonkeyPatch) -> list[MainWindow]:
+    """Record the calls to :meth:`.MainWindow.live_preview`."""
+    recorded = []
+
+    def live_preview(self: MainWindow) -> None:
+        recorded.append(self)
+
+    monkeypatch.setattr(MainWindow, "live_preview", live_preview)
+    return recorded
+
+
+@pytest.fixture
+def window(app: QApplication, calls: list[MainWindow]) -> Iterator[MainWindow]:
+    """Create the GUI, with the live preview not plotting anything."""
+    window = MainWindow()
+    yield window
+    window.close()
+    window.deleteLater()
+
+
+def test_burst_gives_one_preview(
+    window: MainWindow, calls: list[MainWindow]
+) -> None:
+    """Check that many changes within the delay lead to a single replot."""
+    window.live_preview_checkbox.setChecked(True)
+    for _ in range(20):
+        window.schedule_live_preview()
+    assert calls == []
+
+    QTest.qWait(10 * window.live_preview_delay)
+    assert calls == [window]
+
+
+def test_separate_changes_give_several_previews(
+    window: MainWindow, calls: list[MainWindow]
+) -> None:
+    """Check that changes separated by more than the delay all replot."""
+    window.live_preview_checkbox.setChecked(True)
+    QTest.qWait(10 * window.live_preview_delay)
+    window.schedule_live_preview()
+    QTest.qWait(10 * window.live_preview_delay)
+    assert calls == [window, window]
+
+
+def test_unchecked_gives_no_preview(
+    window: MainWindow, calls: list[MainWindow]
+) -> None:
+    """Check that nothing is replotted when the live preview is off."""
+    for _ in range(20):
+        window.schedule_live_preview()
+
+    QTest.qWait(10 * window.live_preview_delay)
+    assert calls == []
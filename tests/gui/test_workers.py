@@ -0,0 +1,98 @@
+"""Test the execution of GUI jobs in background threads."""
+
+import threading
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from eemilib.gui.workers import Progress, Worker
+from PyQt5.QtCore import QCoreApplication, QThreadPool
+
+
+def _run(
+    app: QCoreApplication,
+    worker: Worker,
+    before_wait: Callable[[], None] | None = None,
+) -> dict[str, list[Any]]:
+    """Execute ``worker`` and gather the signals it emitted."""
+    emitted: dict[str, list[Any]] = {
+        "progress": [],
+        "result": [],
+        "error": [],
+        "finished": [],
+    }
+    worker.signals.progress.connect(
+        lambda *args: emitted["progress"].append(args)
+    )
+    worker.signals.result.connect(emitted["result"].append)
+    worker.signals.error.connect(emitted["error"].append)
+    worker.signals.finished.connect(lambda: emitted["finished"].append(True))
+
+    pool = QThreadPool()
+    pool.start(worker)
+    if before_wait is not None:
+        before_wait()
+    assert pool.waitForDone(5000)
+    app.processEvents()
+    return emitted
+
+
+def _add(a: int, b: int, progress: Progress) -> int:
+    """Add two numbers, reporting progress."""
+    progress(0, 1)
+    progress(1, 1)
+    return a + b
+
+
+def _fail(progress: Progress) -> None:
+    """Raise an error."""
+    raise ValueError("Job failed.")
+
+
+def _wait_for(event: threading.Event) -> Callable[[Progress], str]:
+    """Create a job waiting for ``event`` before reporting progress."""
+
+    def job(progress: Progress) -> str:
+        assert event.wait(5.0)
+        progress(1, 2)
+        return "done"
+
+    return job
+
+
+def test_result_is_emitted(app: QCoreApplication) -> None:
+    """Check that the returned object and progress are emitted."""
+    emitted = _run(app, Worker(_add, 1, b=2))
+
+    assert emitted["result"] == [3]
+    assert emitted["progress"] == [(0, 1), (1, 1)]
+    assert emitted["error"] == []
+    assert emitted["finished"] == [True]
+
+
+def test_error_is_emitted(app: QCoreApplication) -> None:
+    """Check that an exception is sent to the ``error`` signal."""
+    emitted = _run(app, Worker(_fail))
+
+    assert emitted["result"] == []
+    assert len(emitted["error"]) == 1
+    assert isinstance(emitted["error"][0], ValueError)
+    assert emitted["finished"] == [True]
+
+
+def test_cancel_suppresses_result(app: QCoreApplication) -> None:
+    """Check that a job cancelled before its next progress report stops."""
+    event = threading.Event()
+    worker = Worker(_wait_for(event))
+
+    def cancel() -> None:
+        worker.cancel()
+        event.set()
+
+    emitted = _run(app, worker, before_wait=cancel)
+
+    assert worker.is_cancelled
+    assert emitted["result"] == []
+    assert emitted["progress"] == []
+    assert emitted["error"] == []
+    assert emitted["finished"] == [True]
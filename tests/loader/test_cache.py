@@ -0,0 +1,96 @@
+"""Test the on-disk cache of loaded files."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+from eemilib.loader import pandas_loader
+from eemilib.loader.cache import LoaderCache
+from eemilib.loader.pandas_loader import PandasLoader
+from pandas.testing import assert_frame_equal
+
+CONTENT = """# Some comment
+0,0,60
+0,0.814,0.918
+10,0.574,0.803
+"""
+
+
+@pytest.fixture
+def teey_file(tmp_path: Path) -> Path:
+    """Write a small emission yield file."""
+    filepath = tmp_path / "teey.csv"
+    filepath.write_text(CONTENT)
+    return filepath
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> LoaderCache:
+    """Create a cache in a temporary directory."""
+    return LoaderCache(tmp_path / "cache")
+
+
+def _load(loader: PandasLoader, filepath: Path) -> tuple[pd.DataFrame, int]:
+    """Load ``filepath``, count the calls to the CSV parser."""
+    with patch.object(
+        pandas_loader.pd, "read_csv", wraps=pd.read_csv
+    ) as read_csv:
+        df = loader.load_emission_yield(filepath)
+    return df, read_csv.call_count
+
+
+def test_second_load_from_cache(teey_file: Path, cache: LoaderCache) -> None:
+    """Check that a file is parsed only once."""
+    loader = PandasLoader(cache=cache)
+    expected, n_parsed = _load(loader, teey_file)
+    assert n_parsed == 1
+
+    returned, n_parsed = _load(PandasLoader(cache=cache), teey_file)
+    assert n_parsed == 0
+    assert_frame_equal(returned, expected)
+
+
+def test_modified_file_is_reloaded(
+    teey_file: Path, cache: LoaderCache
+) -> None:
+    """Check that modifying a file invalidates its cache entry."""
+    loader = PandasLoader(cache=cache)
+    _load(loader, teey_file)
+
+    teey_file.write_text(CONTENT + "20,0.632,0.817\n")
+    returned, n_parsed = _load(loader, teey_file)
+    assert n_parsed == 1
+    assert len(returned) == 3
+
+
+def test_settings_are_part_of_key(teey_file: Path, cache: LoaderCache) -> None:
+    """Check that changing the loader settings leads to a new parsing."""
+    _load(PandasLoader(cache=cache), teey_file)
+    _, n_parsed = _load(PandasLoader(sep=";", cache=cache), teey_file)
+    assert n_parsed == 1
+
+
+def test_no_cache(teey_file: Path, cache: LoaderCache) -> None:
+    """Check that nothing is written without cache."""
+    loader = PandasLoader()
+    _load(loader, teey_file)
+    _, n_parsed = _load(loader, teey_file)
+    assert n_parsed == 1
+    assert not cache.directory.exists()
+
+
+def test_eviction(tmp_path: Path) -> None:
+    """Check that least recently used entries are removed first."""
+    cache = LoaderCache(tmp_path / "cache")
+    cache.set("old", b"x" * 100)
+    cache.set("recent", b"x" * 100)
+    old, recent = (cache.directory / f"{key}.pkl" for key in ("old", "recent"))
+    os.utime(old, ns=(0, 0))
+    assert cache.get("old") is not None  # makes "old" the most recent
+
+    cache.max_size = old.stat().st_size + 10
+    cache.evict()
+    assert old.exists()
+    assert not recent.exists()
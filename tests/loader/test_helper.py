@@ -0,0 +1,54 @@
+"""Test the helper functions for loading files."""
+
+import builtins
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+from eemilib import emission_energy_ag, teey_cu
+from eemilib.loader.helper import read_commented_csv
+from eemilib.util.constants import col_energy
+from pandas.testing import assert_frame_equal
+
+
+@pytest.mark.parametrize(
+    "filepath",
+    [
+        pytest.param(
+            teey_cu / "measured_TEEY_Cu_1_eroded.csv", id="Emission yield"
+        ),
+        pytest.param(
+            emission_energy_ag / "corrected_cleanAg0_150eV_2018.05.30.csv",
+            id="Emission energy",
+        ),
+    ],
+)
+def test_single_pass_matches_multiple_passes(filepath: Path) -> None:
+    """Check that reading in one pass gives same data and comments."""
+    with open(filepath) as file:
+        lines = file.readlines()
+    expected_comments = [line[1:] for line in lines if line.startswith("#")]
+    header = lines[len(expected_comments)].strip().split(",")
+    names = [col_energy] + [f"{float(angle)} [deg]" for angle in header[1:]]
+    expected_df = pd.read_csv(
+        filepath,
+        comment="#",
+        sep=",",
+        names=names,
+        skiprows=len(expected_comments) + 1,
+    )
+
+    with patch.object(builtins, "open", wraps=builtins.open) as mock_open:
+        df, comments = read_commented_csv(filepath)
+    assert mock_open.call_count == 1
+    assert_frame_equal(df, expected_df)
+    assert comments == expected_comments
+
+
+def test_no_header(tmp_path: Path) -> None:
+    """Check that a file with only comments raises an error."""
+    filepath = tmp_path / "only_comments.csv"
+    filepath.write_text("# A comment\n# Another one\n")
+    with pytest.raises(OSError):
+        read_commented_csv(filepath)
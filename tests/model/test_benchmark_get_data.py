@@ -0,0 +1,111 @@
+"""Benchmark the array evaluation of models against a scalar loop.
+
+Run with ``pytest -m slow``.
+
+"""
+
+import time
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+from eemilib.model.chung_and_everhart import ChungEverhart
+from eemilib.model.dionne import Dionne
+from eemilib.model.maxwellian import Maxwellian
+from eemilib.model.model import Model
+from eemilib.model.sombrin import Sombrin
+from numpy.typing import NDArray
+
+N_POINTS = 100_000
+#: Minimum speed-up of the array evaluation w.r.t. the scalar loop.
+MIN_SPEEDUP = 10.0
+
+
+def _sombrin_point(model: Sombrin, ene: float) -> float:
+    """Evaluate the Sombrin model at a single energy."""
+    return model._func(
+        ene,
+        E_max=model.parameters["E_max"],
+        teey_max=model.parameters["teey_max"],
+        E_c1=model.parameters["E_c1"],
+        E_param=model.E,
+    )
+
+
+def _dionne_point(model: Dionne, ene: float) -> float:
+    """Evaluate the Dionne model at a single energy."""
+    return model._func(ene, **model.parameters)
+
+
+def _maxwellian_point(model: Maxwellian, ene: float) -> float:
+    """Evaluate the Maxwellian model at a single energy."""
+    return model._func(
+        ene,
+        temperature=model.parameters["temperature"],
+        norm=model.parameters["norm"],
+    )
+
+
+def _chung_everhart_point(model: ChungEverhart, ene: float) -> float:
+    """Evaluate the Chung and Everhart model at a single energy."""
+    return model._func(
+        ene, W_f=model.parameters["W_f"], norm=model.parameters["norm"]
+    )
+
+
+def _timed[T](func: Callable[[], T]) -> tuple[T, float]:
+    """Return output of ``func`` and its execution time in seconds."""
+    start = time.perf_counter()
+    out = func()
+    return out, time.perf_counter() - start
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "model,method,point",
+    [
+        pytest.param(
+            Sombrin(
+                parameters_values={
+                    "E_max": 300.0,
+                    "teey_max": 2.1,
+                    "E_c1": 30.0,
+                }
+            ),
+            "teey",
+            _sombrin_point,
+            id="Sombrin",
+        ),
+        pytest.param(Dionne(), "seey", _dionne_point, id="Dionne"),
+        pytest.param(
+            Maxwellian(),
+            "se_energy_distribution",
+            _maxwellian_point,
+            id="Maxwellian",
+        ),
+        pytest.param(
+            ChungEverhart(),
+            "se_energy_distribution",
+            _chung_everhart_point,
+            id="Chung and Everhart",
+        ),
+    ],
+)
+def test_array_evaluation_speedup(
+    model: Model, method: str, point: Callable[[Model, float], float]
+) -> None:
+    """Check that evaluating whole arrays is much faster than a loop."""
+    energy = np.linspace(0.0, 1000.0, N_POINTS)
+    theta = np.array([0.0])
+
+    def scalar_loop() -> NDArray[np.float64]:
+        return np.array([point(model, ene) for ene in energy])
+
+    def array_call() -> NDArray[np.float64]:
+        return getattr(model, method)(energy, theta).to_numpy()[:, 0]
+
+    expected, scalar_time = _timed(scalar_loop)
+    returned, array_time = _timed(array_call)
+
+    np.testing.assert_allclose(returned, expected, rtol=1e-12)
+    assert scalar_time / array_time > MIN_SPEEDUP
@@ -0,0 +1,89 @@
+"""Count residue evaluations of fits with and without analytic Jacobians.
+
+Run with ``pytest -m slow``.
+
+"""
+
+from collections.abc import Callable
+from types import ModuleType
+
+import numpy as np
+import pytest
+from eemilib.model import chung_and_everhart, dionne, maxwellian
+from numpy.typing import NDArray
+from pytest import approx
+from scipy.optimize import least_squares
+
+
+class _CountedResidue:
+    """Wrap a residue function and count its calls."""
+
+    def __init__(self, func: Callable[..., NDArray[np.float64]]) -> None:
+        """Set the wrapped function."""
+        self.func = func
+        self.n_calls = 0
+
+    def __call__(self, *args, **kwargs) -> NDArray[np.float64]:
+        """Call the wrapped function."""
+        self.n_calls += 1
+        return self.func(*args, **kwargs)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "module,energy,x_true,x0,bounds",
+    [
+        pytest.param(
+            maxwellian,
+            np.linspace(0.0, 100.0, 501),
+            np.array([4.9]),
+            np.array([7.5]),
+            (0.0, np.inf),
+            id="Maxwellian",
+        ),
+        pytest.param(
+            chung_and_everhart,
+            np.linspace(0.0, 100.0, 501),
+            np.array([5.0]),
+            np.array([8.0]),
+            (0.0, np.inf),
+            id="Chung and Everhart",
+        ),
+        pytest.param(
+            dionne,
+            np.linspace(0.0, 2000.0, 501),
+            np.array([4.6, 3.0, 0.4, 2.0, 1.4]),
+            np.array([4.6, 2.0, 0.5, 1.0, 1.2]),
+            (
+                np.array([0.0, 0.0, 0.0, 0.0, 1.0]),
+                np.array([np.inf, np.inf, 1.0, np.inf, np.inf]),
+            ),
+            id="Dionne",
+        ),
+    ],
+)
+def test_analytic_jacobian_saves_evaluations(
+    module: ModuleType,
+    energy: NDArray[np.float64],
+    x_true: NDArray[np.float64],
+    x0: NDArray[np.float64],
+    bounds: tuple[float | NDArray[np.float64], float | NDArray[np.float64]],
+) -> None:
+    """Check that fits converge with fewer residue evaluations."""
+    measured = module._residue(x_true, energy, np.zeros_like(energy))
+
+    finite_differences = _CountedResidue(module._residue)
+    lsq_fd = least_squares(
+        finite_differences, x0, bounds=bounds, args=(energy, measured)
+    )
+    analytic = _CountedResidue(module._residue)
+    lsq_an = least_squares(
+        analytic,
+        x0,
+        jac=module._jacobian,
+        bounds=bounds,
+        args=(energy, measured),
+    )
+
+    assert lsq_an.cost == approx(lsq_fd.cost, abs=1e-10)
+    assert analytic.n_calls < finite_differences.n_calls
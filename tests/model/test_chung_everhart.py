@@ -0,0 +1,76 @@
+"""Define tests for the Chung and Everhart model."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from eemilib.model.chung_and_everhart import (
+    ChungEverhart,
+    _jacobian,
+    _residue,
+)
+from eemilib.util.constants import col_normal
+from numpy.testing import assert_allclose, assert_array_almost_equal
+from scipy.optimize import approx_fprime
+
+
+@pytest.fixture
+def chung_everhart_model() -> ChungEverhart:
+    """Create a default instance of :class:`.ChungEverhart` model."""
+    return ChungEverhart()
+
+
+def test_initial_parameters(chung_everhart_model: ChungEverhart) -> None:
+    """Check that the mandatory parameters are defined."""
+    expected_parameters = {"W_f", "norm"}
+    assert (
+        set(chung_everhart_model.initial_parameters.keys())
+        == expected_parameters
+    )
+
+
+def test_emission_energy_distribution_output_shape(
+    chung_everhart_model: ChungEverhart,
+) -> None:
+    """Check that energy pdf array has proper shape."""
+    energy = np.linspace(0, 100, 5, dtype=np.float64)
+    theta = np.linspace(0, 90, 3, dtype=np.float64)  # will be ignored
+    result = chung_everhart_model.se_energy_distribution(energy, theta)
+    assert isinstance(result, pd.DataFrame)
+    assert result.shape == (5, 2)  # 1 theta column + 1 energy column
+
+
+def test_vectorized_distribution_matches_scalar(
+    chung_everhart_model: ChungEverhart,
+) -> None:
+    """Check that the array evaluation matches point-by-point calls."""
+    energy = np.linspace(0.0, 100.0, 401)
+    expected = np.array(
+        [
+            chung_everhart_model._func(
+                ene,
+                W_f=chung_everhart_model.parameters["W_f"],
+                norm=chung_everhart_model.parameters["norm"],
+            )
+            for ene in energy
+        ]
+    )
+
+    returned = chung_everhart_model.se_energy_distribution(
+        energy, np.array([0.0])
+    )[col_normal].to_numpy()
+    assert_array_almost_equal(returned, expected, decimal=12)
+
+
+@pytest.mark.parametrize("w_f", [2.0, 8.0, 15.0])
+def test_jacobian_matches_finite_differences(w_f: float) -> None:
+    """Check the analytic Jacobian against numerical derivatives."""
+    energy = np.linspace(0.0, 100.0, 201)
+    measured = np.zeros_like(energy)
+    x = np.array([w_f])
+
+    expected = approx_fprime(x, _residue, 1e-6 * w_f, energy, measured)
+    returned = _jacobian(x, energy, measured)
+    assert returned.shape == (energy.size, 1)
+    assert_allclose(
+        returned, expected, rtol=1e-4, atol=1e-6 * np.abs(expected).max()
+    )
@@ -0,0 +1,69 @@
+"""Define tests for the Dionne model."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from eemilib.model.dionne import Dionne, _jacobian, _residue
+from eemilib.util.constants import col_normal
+from numpy.testing import assert_allclose, assert_array_almost_equal
+from scipy.optimize import approx_fprime
+
+
+@pytest.fixture
+def dionne_model() -> Dionne:
+    """Create a default instance of :class:`.Dionne` model."""
+    return Dionne()
+
+
+def test_initial_parameters(dionne_model: Dionne) -> None:
+    """Check that the mandatory parameters are defined."""
+    expected_parameters = {
+        "excitation_energy",
+        "diffusion_length",
+        "escape_probability",
+        "power_law_scale",
+        "power_law_exponent",
+    }
+    assert set(dionne_model.initial_parameters.keys()) == expected_parameters
+
+
+def test_seey_output_shape(dionne_model: Dionne) -> None:
+    """Check that SEEY array has proper shape."""
+    energy = np.linspace(0, 100, 5, dtype=np.float64)
+    theta = np.linspace(0, 90, 3, dtype=np.float64)  # will be ignored
+    result = dionne_model.seey(energy, theta)
+    assert isinstance(result, pd.DataFrame)
+    assert result.shape == (5, 2)  # 1 theta column + 1 energy column
+
+
+def test_vectorized_seey_matches_scalar(dionne_model: Dionne) -> None:
+    """Check that the array evaluation matches point-by-point calls."""
+    energy = np.linspace(0.0, 2000.0, 401)
+    expected = np.array(
+        [dionne_model._func(ene, **dionne_model.parameters) for ene in energy]
+    )
+
+    returned = dionne_model.seey(energy, np.array([0.0]))[
+        col_normal
+    ].to_numpy()
+    assert_array_almost_equal(returned, expected, decimal=12)
+
+
+@pytest.mark.parametrize(
+    "x",
+    [
+        pytest.param(np.array([4.6, 2.0, 0.5, 1.0, 1.2]), id="Default"),
+        pytest.param(np.array([10.0, 5.0, 0.8, 50.0, 1.6]), id="Other"),
+    ],
+)
+def test_jacobian_matches_finite_differences(x: np.ndarray) -> None:
+    """Check the analytic Jacobian against numerical derivatives."""
+    energy = np.linspace(0.0, 2000.0, 201)
+    measured = np.zeros_like(energy)
+
+    expected = approx_fprime(x, _residue, 1e-7 * x, energy, measured)
+    returned = _jacobian(x, energy, measured)
+    assert returned.shape == (energy.size, 5)
+    # Derivatives w.r.t. each parameter have very different magnitudes
+    scale = np.abs(expected).max(axis=0)
+    assert_allclose(returned / scale, expected / scale, rtol=1e-4, atol=1e-6)
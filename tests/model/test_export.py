@@ -0,0 +1,78 @@
+"""Test the export of tabulated models."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+from eemilib.model.export import load_exported_model
+from eemilib.model.maxwellian import Maxwellian
+from eemilib.model.vaughan import Vaughan
+
+ENERGY = np.linspace(0.0, 1e3, 101)
+THETA = np.linspace(0.0, 90.0, 10)
+
+
+@pytest.fixture
+def vaughan() -> Vaughan:
+    """Give a SPARK3D Vaughan model."""
+    return Vaughan(
+        implementation="SPARK3D",
+        parameters_values={"E_max": 300.0, "teey_max": 2.0},
+    )
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_round_trip(vaughan: Vaughan, tmp_path: Path, mmap: bool) -> None:
+    """Check that exported tables and metadata are retrieved."""
+    filepath = vaughan.export(
+        tmp_path / "vaughan",
+        ENERGY,
+        THETA,
+        dtype=np.float32,
+        provenance={"sample": "Cu"},
+    )
+    assert filepath.suffix == ".npz"
+
+    exported = load_exported_model(filepath, mmap=mmap)
+    assert exported.model == "Vaughan"
+    assert exported.implementation == "SPARK3D"
+    assert exported.parameters == {
+        name: param.value for name, param in vaughan.parameters.items()
+    }
+    assert exported.metadata["provenance"]["sample"] == "Cu"
+
+    energy, theta, values = exported["all", "Emission Yield"]
+    assert isinstance(values, np.memmap) is mmap
+    assert values.dtype == np.float32
+    expected = vaughan.get_array("all", "Emission Yield", ENERGY, THETA)
+    assert expected is not None
+    np.testing.assert_array_equal(energy, ENERGY)
+    np.testing.assert_array_equal(theta, THETA)
+    np.testing.assert_allclose(values, expected[2], rtol=1e-6)
+
+
+def test_readable_by_numpy(vaughan: Vaughan, tmp_path: Path) -> None:
+    """Check that exported files can be read without EEmiLib."""
+    filepath = vaughan.export(tmp_path / "vaughan.npz", ENERGY, THETA)
+    with np.load(filepath) as npz:
+        assert npz["all_emission_yield_values"].shape == (101, 10)
+        assert "SPARK3D" in str(npz["metadata"])
+
+
+def test_lookup_table_without_copy(vaughan: Vaughan, tmp_path: Path) -> None:
+    """Check that lookup tables are created on the mapped values."""
+    filepath = vaughan.export(tmp_path / "vaughan", ENERGY, THETA)
+    exported = load_exported_model(filepath)
+    table = exported.lookup_table(("all", "Emission Yield"))
+
+    assert np.shares_memory(table.values, exported["all", "Emission Yield"][2])
+    assert table(300.0, 0.0) == pytest.approx(2.0)
+
+
+def test_energy_distribution(tmp_path: Path) -> None:
+    """Check that energy distributions are exported with a single angle."""
+    filepath = Maxwellian().export(tmp_path / "maxwellian", ENERGY, THETA)
+    exported = load_exported_model(filepath)
+    assert list(exported.tables) == [("SE", "Emission Energy")]
+    assert exported.implementation is None
+    assert exported["SE", "Emission Energy"][2].shape == (101, 1)
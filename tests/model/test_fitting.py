@@ -0,0 +1,137 @@
+"""Test the warm-start, multi-start and cached fits."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from eemilib import emission_energy_ag
+from eemilib.emission_data.data_matrix import DataMatrix
+from eemilib.loader.pandas_loader import PandasLoader
+from eemilib.model import maxwellian
+from eemilib.model.fitting import (
+    FIT_CACHE,
+    FitCache,
+    multi_start_least_squares,
+    starting_points,
+)
+from eemilib.model.maxwellian import Maxwellian
+from numpy.typing import NDArray
+from pytest import approx
+from scipy.optimize import Bounds
+
+
+@pytest.fixture(autouse=True)
+def empty_cache() -> None:
+    """Start every test with an empty fit cache."""
+    FIT_CACHE.clear()
+
+
+@pytest.fixture
+def data_matrix() -> DataMatrix:
+    """Load a measured |SE| energy distribution."""
+    data_matrix = DataMatrix()
+    data_matrix.set_files(
+        [Path(emission_energy_ag / "corrected_cleanAg0_150eV_2018.05.30.csv")],
+        population="SE",
+        emission_data_type="Emission Energy",
+    )
+    data_matrix.load_data(PandasLoader())
+    return data_matrix
+
+
+def _rastrigin(x: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Residues of 1D Rastrigin function: many local minima, global at 0."""
+    return np.array([x[0], np.sqrt(20.0) * np.sin(np.pi * x[0])])
+
+
+class TestFitCache:
+    """Test the storage of fit results."""
+
+    def test_least_recently_used_dropped(self) -> None:
+        """Check that oldest results are removed first."""
+        cache = FitCache(max_size=2)
+        cache.set(("a",), {"x": 1.0})
+        cache.set(("b",), {"x": 2.0})
+        assert cache.get(("a",)) == {"x": 1.0}
+        cache.set(("c",), {"x": 3.0})
+
+        assert len(cache) == 2
+        assert cache.get(("b",)) is None
+        assert cache.get(("a",)) == {"x": 1.0}
+
+
+class TestCachedFit:
+    """Test that fits on unchanged inputs are not repeated."""
+
+    def _fit(self, model: Maxwellian, data_matrix: DataMatrix, **kwargs):
+        """Fit and return the number of calls to the optimizer."""
+        with patch.object(
+            maxwellian,
+            "multi_start_least_squares",
+            wraps=multi_start_least_squares,
+        ) as optimizer:
+            model.find_optimal_parameters(data_matrix, **kwargs)
+        return optimizer.call_count
+
+    def test_repeated_fit_is_cached(self, data_matrix: DataMatrix) -> None:
+        """Check that second fit reuses first result."""
+        model = Maxwellian()
+        assert self._fit(model, data_matrix) == 1
+        expected = model.parameters["temperature"].value
+
+        other_model = Maxwellian()
+        assert self._fit(other_model, data_matrix) == 0
+        assert other_model.parameters["temperature"].value == expected
+
+    def test_lock_invalidates_cache(self, data_matrix: DataMatrix) -> None:
+        """Check that locking a parameter leads to a new fit."""
+        model = Maxwellian()
+        self._fit(model, data_matrix)
+        model.parameters["temperature"].lock()
+        assert self._fit(model, data_matrix) == 1
+
+    def test_multi_start_after_plain_fit(
+        self, data_matrix: DataMatrix
+    ) -> None:
+        """Check that a multi-start fit is not replaced by a cached fit."""
+        model = Maxwellian()
+        self._fit(model, data_matrix)
+        assert self._fit(model, data_matrix, n_starts=3) == 1
+        assert self._fit(model, data_matrix, n_starts=3) == 0
+
+    def test_cache_can_be_skipped(self, data_matrix: DataMatrix) -> None:
+        """Check that the cache is not used when asked."""
+        model = Maxwellian()
+        self._fit(model, data_matrix)
+        assert self._fit(model, data_matrix, use_cache=False) == 1
+
+
+class TestMultiStart:
+    """Test the multi-start fit."""
+
+    bounds = Bounds(np.array([-5.0]), np.array([5.0]))
+
+    def test_starting_points(self) -> None:
+        """Check that starts are within bounds, first one being x0."""
+        x0 = np.array([3.2])
+        starts = starting_points(x0, self.bounds, n_starts=10, seed=0)
+        assert starts.shape == (11, 1)
+        assert starts[0] == approx(x0)
+        assert np.all((starts >= -5.0) & (starts <= 5.0))
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_global_minimum(self, max_workers: int) -> None:
+        """Check that multi-start escapes the local minimum near x0."""
+        x0 = np.array([3.2])
+        single = multi_start_least_squares(_rastrigin, x0, self.bounds)
+        multi = multi_start_least_squares(
+            _rastrigin,
+            x0,
+            self.bounds,
+            n_starts=20,
+            max_workers=max_workers,
+            seed=0,
+        )
+        assert single.x[0] == approx(3.0, abs=0.1)
+        assert multi.x[0] == approx(0.0, abs=1e-6)
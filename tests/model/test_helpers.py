@@ -0,0 +1,58 @@
+"""Test the helper functions extracting characteristics from models."""
+
+import numpy as np
+from eemilib.model.helper import (
+    find_crossovers,
+    find_maximum,
+    split_crossovers,
+)
+from numpy.typing import NDArray
+from pytest import approx
+
+
+def _parabola(energy: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Give a fake emission yield crossing unity at 100 and 300 eV."""
+    return 2.0 - ((energy - 200.0) / 100.0) ** 2
+
+
+class TestFindMaximum:
+    """Test that the maximum is found with sub-sample precision."""
+
+    def test_maximum(self) -> None:
+        """Test on a parabola whose vertex is between coarse points."""
+        e_max, ey_max = find_maximum(
+            lambda ene: _parabola(ene - 3.3), 0.0, 1000.0, n_coarse=11
+        )
+        assert e_max == approx(203.3, abs=1e-6)
+        assert ey_max == approx(2.0)
+
+    def test_maximum_at_bound(self) -> None:
+        """Test that a monotonous function has its maximum at the bound."""
+        e_max, ey_max = find_maximum(lambda ene: ene / 100.0, 0.0, 500.0)
+        assert e_max == approx(500.0, abs=1e-6)
+        assert ey_max == approx(5.0, abs=1e-6)
+
+
+class TestFindCrossovers:
+    """Test that crossovers are found by root-finding."""
+
+    def test_crossovers(self) -> None:
+        """Test that both crossovers are found."""
+        returned = find_crossovers(_parabola, 0.0, 1000.0, n_coarse=7)
+        assert returned == approx(np.array([100.0, 300.0]), abs=1e-6)
+
+    def test_no_crossover(self) -> None:
+        """Test that an empty array is returned when unity is not crossed."""
+        returned = find_crossovers(lambda ene: 0.5 + 0.0 * ene, 0.0, 100.0)
+        assert returned.size == 0
+
+    def test_split_crossovers(self) -> None:
+        """Test that first and second crossovers are discriminated."""
+        e_c1, e_c2 = split_crossovers(np.array([100.0, 300.0]), e_max=200.0)
+        assert (e_c1, e_c2) == (100.0, 300.0)
+
+    def test_split_missing_crossover(self) -> None:
+        """Test that a missing second crossover is NaN."""
+        e_c1, e_c2 = split_crossovers(np.array([100.0]), e_max=200.0)
+        assert e_c1 == 100.0
+        assert np.isnan(e_c2)
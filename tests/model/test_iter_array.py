@@ -0,0 +1,101 @@
+"""Test the evaluation of models by chunks."""
+
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from eemilib.model.export import write_chunks_to_npy
+from eemilib.model.maxwellian import Maxwellian
+from eemilib.model.vaughan import Vaughan
+
+THETA = np.linspace(0.0, 90.0, 10)
+
+
+@pytest.fixture
+def vaughan() -> Vaughan:
+    """Give a Vaughan model."""
+    return Vaughan(parameters_values={"E_max": 300.0, "teey_max": 2.0})
+
+
+@pytest.mark.parametrize("chunk_size", [1, 95, 1000, 10**6])
+def test_chunks_match_full_grid(vaughan: Vaughan, chunk_size: int) -> None:
+    """Check that concatenated chunks give the full grid."""
+    energy = np.linspace(0.0, 1e3, 1001)
+    chunks = list(
+        vaughan.iter_array(
+            "all", "Emission Yield", energy, THETA, chunk_size=chunk_size
+        )
+    )
+    for _, _, values in chunks:
+        assert values.size <= max(chunk_size, THETA.size)
+
+    expected = vaughan.get_array("all", "Emission Yield", energy, THETA)
+    assert expected is not None
+    np.testing.assert_array_equal(
+        np.concatenate([chunk[0] for chunk in chunks]), energy
+    )
+    np.testing.assert_array_equal(
+        np.concatenate([chunk[2] for chunk in chunks]), expected[2]
+    )
+
+
+def test_dataframe_chunks(vaughan: Vaughan) -> None:
+    """Check that dataframe chunks can be concatenated."""
+    energy = np.linspace(0.0, 1e3, 101)
+    df = pd.concat(
+        vaughan.iter_data(
+            "all", "Emission Yield", energy, THETA, chunk_size=200
+        )
+    )
+    expected = vaughan.get_data("all", "Emission Yield", energy, THETA)
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_not_modelled(vaughan: Vaughan) -> None:
+    """Check that nothing is yielded for data that is not modelled."""
+    chunks = vaughan.iter_array(
+        "SE", "Emission Energy", np.linspace(0.0, 1e3, 11), THETA
+    )
+    assert list(chunks) == []
+
+
+def test_write_chunks(tmp_path: Path) -> None:
+    """Check that chunks are written to a ``.npy`` file."""
+    model = Maxwellian()
+    energy = np.linspace(0.0, 50.0, 1001)
+    filepath = tmp_path / "maxwellian.npy"
+    values = write_chunks_to_npy(
+        model.iter_array(
+            "SE", "Emission Energy", energy, THETA, chunk_size=64
+        ),
+        filepath,
+        n_energy=energy.size,
+        dtype=np.float32,
+    )
+    expected = model.get_array("SE", "Emission Energy", energy, THETA)
+    assert expected is not None
+
+    read = np.load(filepath, mmap_mode="r")
+    assert read.shape == values.shape == (1001, 1)
+    assert read.dtype == np.float32
+    np.testing.assert_allclose(read, expected[2], rtol=1e-6)
+
+
+def test_bounded_memory(vaughan: Vaughan, tmp_path: Path) -> None:
+    """Check that memory usage does not scale with the grid size."""
+    energy = np.linspace(0.0, 1e3, 200_000)
+    full_size = energy.size * THETA.size * 8
+
+    tracemalloc.start()
+    write_chunks_to_npy(
+        vaughan.iter_array(
+            "all", "Emission Yield", energy, THETA, chunk_size=10_000
+        ),
+        tmp_path / "vaughan.npy",
+        n_energy=energy.size,
+    )
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak < full_size / 10
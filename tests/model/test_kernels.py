@@ -0,0 +1,141 @@
+"""Test the kernels evaluating models on float arrays."""
+
+import logging
+
+import numpy as np
+import pytest
+from eemilib.model import kernels
+from eemilib.model.chung_and_everhart import ChungEverhart
+from eemilib.model.dionne import Dionne
+from eemilib.model.maxwellian import Maxwellian
+from eemilib.model.model import Model
+from eemilib.model.sombrin import Sombrin
+from eemilib.model.vaughan import Vaughan, vaughan_kernel
+
+ENERGY = np.linspace(0.0, 1000.0, 501)
+THETA = np.linspace(0.0, 80.0, 5)
+
+CASES = [
+    pytest.param(
+        lambda: Vaughan(parameters_values={"E_max": 300.0, "teey_max": 2.0}),
+        "all",
+        "Emission Yield",
+        id="Vaughan",
+    ),
+    pytest.param(
+        lambda: Vaughan(
+            implementation="SPARK3D",
+            parameters_values={"E_max": 300.0, "teey_max": 2.0},
+        ),
+        "all",
+        "Emission Yield",
+        id="Vaughan SPARK3D",
+    ),
+    pytest.param(
+        lambda: Sombrin(
+            parameters_values={"E_max": 300.0, "teey_max": 2.0, "E_c1": 30.0}
+        ),
+        "all",
+        "Emission Yield",
+        id="Sombrin",
+    ),
+    pytest.param(Dionne, "SE", "Emission Yield", id="Dionne"),
+    pytest.param(Maxwellian, "SE", "Emission Energy", id="Maxwellian"),
+    pytest.param(ChungEverhart, "SE", "Emission Energy", id="ChungEverhart"),
+]
+
+
+def _reference(
+    model: Model, population: str, emission_data_type: str
+) -> tuple[np.ndarray, np.ndarray]:
+    """Give angles and values computed by :meth:`.Model.get_array`."""
+    out = model.get_array(population, emission_data_type, ENERGY, THETA)
+    assert out is not None
+    _, theta, values = out
+    return theta, values
+
+
+@pytest.mark.parametrize("backend", ["numpy", "numba"])
+@pytest.mark.parametrize(
+    "model_factory, population, emission_data_type", CASES
+)
+def test_kernel_matches_get_array(
+    model_factory, population: str, emission_data_type: str, backend: str
+) -> None:
+    """Check that the kernel gives the same values as the model."""
+    if backend == "numba":
+        pytest.importorskip("numba")
+    model = model_factory()
+    theta, expected = _reference(model, population, emission_data_type)
+
+    kernel = model.kernel(backend=backend)
+    returned = kernel(
+        ENERGY[:, np.newaxis],
+        theta[np.newaxis, :],
+        model.kernel_parameters_vector(),
+    )
+    np.testing.assert_allclose(
+        np.broadcast_to(returned, expected.shape), expected, rtol=1e-12
+    )
+
+
+@pytest.mark.parametrize("backend", ["numpy", "numba"])
+@pytest.mark.parametrize(
+    "model_factory, population, emission_data_type", CASES
+)
+def test_scalar_kernel_matches_get_array(
+    model_factory, population: str, emission_data_type: str, backend: str
+) -> None:
+    """Check that the scalar kernel gives the same values as the model."""
+    if backend == "numba":
+        pytest.importorskip("numba")
+    model = model_factory()
+    theta, expected = _reference(model, population, emission_data_type)
+
+    scalar_kernel = model.scalar_kernel(backend=backend)
+    parameters = model.kernel_parameters_vector()
+    returned = [
+        [scalar_kernel(ene, the, parameters) for the in theta]
+        for ene in ENERGY
+    ]
+    np.testing.assert_allclose(returned, expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize(
+    "model_factory, population, emission_data_type", CASES
+)
+def test_kernel_parameters_layout(
+    model_factory, population: str, emission_data_type: str
+) -> None:
+    """Check that every entry of the parameters vector is named."""
+    model = model_factory()
+    vector = model.kernel_parameters_vector()
+    assert len(model.kernel_parameters) == vector.size
+    for name, value in zip(model.kernel_parameters, vector):
+        if name in model.parameters:
+            assert value == model.parameters[name].value
+
+
+def test_numba_fallback(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Check that NumPy kernel is used when Numba is missing."""
+    monkeypatch.setattr(kernels, "numba_available", lambda: False)
+    model = Vaughan()
+
+    assert model.kernel(backend="auto") is vaughan_kernel
+    with caplog.at_level(logging.WARNING):
+        assert model.kernel(backend="numba") is vaughan_kernel
+    assert "Numba is not installed" in caplog.text
+
+
+def test_compiled_once() -> None:
+    """Check that kernels are compiled only once."""
+    pytest.importorskip("numba")
+    assert Vaughan().kernel("numba") is Vaughan().kernel("numba")
+
+
+def test_invalid_backend() -> None:
+    """Check error on unknown backend."""
+    with pytest.raises(ValueError):
+        Vaughan().kernel(backend="cython")  # type: ignore
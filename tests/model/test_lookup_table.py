@@ -0,0 +1,119 @@
+"""Test the tabulation of models."""
+
+import numpy as np
+import pytest
+from eemilib.model.lookup_table import LookupTable
+from eemilib.model.maxwellian import Maxwellian
+from eemilib.model.sombrin import Sombrin
+from eemilib.model.vaughan import Vaughan
+
+
+@pytest.fixture
+def vaughan() -> Vaughan:
+    """Give a Vaughan model without discontinuity."""
+    return Vaughan(
+        implementation="CST",
+        parameters_values={"E_max": 300.0, "teey_max": 2.0},
+    )
+
+
+@pytest.fixture
+def sombrin() -> Sombrin:
+    """Give a Sombrin model."""
+    return Sombrin(
+        parameters_values={"E_max": 300.0, "teey_max": 2.0, "E_c1": 30.0}
+    )
+
+
+@pytest.mark.parametrize(
+    "energy_grid, spacing",
+    [
+        pytest.param(np.linspace(0.0, 1e3, 101), "linear", id="linear"),
+        pytest.param(np.geomspace(1.0, 1e4, 101), "log", id="log"),
+    ],
+)
+def test_exact_at_nodes(
+    vaughan: Vaughan, energy_grid: np.ndarray, spacing: str
+) -> None:
+    """Check that table is exact on grid nodes."""
+    angle_grid = np.linspace(0.0, 90.0, 10)
+    table = vaughan.to_lookup_table(energy_grid, angle_grid)
+    assert table.energy_spacing == spacing
+
+    expected = vaughan.get_array(
+        "all", "Emission Yield", energy_grid, angle_grid
+    )
+    assert expected is not None
+    returned = table(energy_grid[:, np.newaxis], angle_grid[np.newaxis, :])
+    np.testing.assert_allclose(returned, expected[2], rtol=1e-12)
+
+
+def test_max_error(sombrin: Sombrin) -> None:
+    """Check that interpolation error is measured and enforced."""
+    angle_grid = np.array([0.0])
+    fine = sombrin.to_lookup_table(
+        np.geomspace(1.0, 1e4, 2001), angle_grid, max_error=1e-3
+    )
+    assert fine.max_error is not None and fine.max_error < 1e-3
+
+    energy = np.linspace(1.0, 1e3, 1234)
+    expected = sombrin.get_array("all", "Emission Yield", energy, angle_grid)
+    assert expected is not None
+    np.testing.assert_allclose(fine(energy), expected[2][:, 0], atol=1e-3)
+
+    with pytest.raises(ValueError):
+        sombrin.to_lookup_table(
+            np.geomspace(1.0, 1e4, 11), angle_grid, max_error=1e-3
+        )
+
+
+def test_scalar_and_batched_queries(vaughan: Vaughan) -> None:
+    """Check types and shapes of interpolated values."""
+    table = vaughan.to_lookup_table(
+        np.linspace(0.0, 1e3, 101), np.linspace(0.0, 90.0, 10)
+    )
+    assert isinstance(table(300.0, 0.0), float)
+    assert table(300.0, 0.0) == pytest.approx(2.0)
+    assert table(np.full(7, 300.0), np.zeros(7)).shape == (7,)
+    assert table(np.zeros((3, 1)), np.zeros((1, 4))).shape == (3, 4)
+
+
+def test_clamped_outside_grid(vaughan: Vaughan) -> None:
+    """Check that queries outside of the grid take the edge values."""
+    table = vaughan.to_lookup_table(
+        np.linspace(10.0, 1e3, 100), np.linspace(0.0, 60.0, 7)
+    )
+    assert table(5.0, 0.0) == pytest.approx(table(10.0, 0.0))
+    assert table(2e3, 80.0) == pytest.approx(table(1e3, 60.0))
+
+
+def test_energy_only_model() -> None:
+    """Check that single-angle tables do not depend on the angle."""
+    model = Maxwellian()
+    table = model.to_lookup_table(
+        np.linspace(0.0, 50.0, 501), np.linspace(0.0, 90.0, 4)
+    )
+    assert table.values.shape == (501, 1)
+    assert table(3.75, 0.0) == table(3.75, 45.0)
+
+
+def test_float32(sombrin: Sombrin) -> None:
+    """Check that table can be stored in simple precision."""
+    energy_grid = np.linspace(0.0, 1e3, 101)
+    table = sombrin.to_lookup_table(
+        energy_grid, np.array([0.0]), dtype=np.float32
+    )
+    assert table.values.dtype == np.float32
+    assert table.nbytes == 4 * energy_grid.size
+
+
+def test_irregular_grid() -> None:
+    """Check that irregular grids are refused."""
+    with pytest.raises(ValueError):
+        LookupTable(
+            np.array([0.0, 1.0, 3.0]), np.array([0.0]), np.zeros((3, 1))
+        )
+    with pytest.raises(ValueError):
+        LookupTable(
+            np.array([0.0, 1.0]), np.array([0.0, 1.0, 5.0]), np.zeros((2, 3))
+        )
@@ -12,7 +12,11 @@ from eemilib.emission_data.emission_energy_distribution import (
 )
 from eemilib.loader import PandasLoader
 from eemilib.model import Maxwellian
+from eemilib.model.maxwellian import _jacobian, _residue
+from eemilib.util.constants import col_normal
+from numpy.testing import assert_allclose, assert_array_almost_equal
 from pytest import approx
+from scipy.optimize import approx_fprime
 
 
 @pytest.fixture
@@ -57,6 +61,41 @@ def test_emission_energy_distribution_output_shape(
     assert result.shape == (5, 2)  # 1 theta column + 1 energy column
 
 
+def test_get_array_output_shape(maxwellian_model: Maxwellian) -> None:
+    """Check that raw arrays hold only normal incidence."""
+    energy = np.linspace(0, 100, 5, dtype=np.float64)
+    theta = np.linspace(0, 90, 3, dtype=np.float64)  # will be ignored
+    out = maxwellian_model.get_array("SE", "Emission Energy", energy, theta)
+    assert out is not None
+    returned_energy, returned_theta, values = out
+    assert_array_almost_equal(returned_energy, energy)
+    assert_array_almost_equal(returned_theta, np.array([0.0]))
+    assert values.shape == (5, 1)
+    assert values.flags.c_contiguous
+
+
+def test_vectorized_distribution_matches_scalar(
+    maxwellian_model: Maxwellian,
+) -> None:
+    """Check that the array evaluation matches point-by-point calls."""
+    energy = np.linspace(0.0, 100.0, 401)
+    expected = np.array(
+        [
+            maxwellian_model._func(
+                ene,
+                temperature=maxwellian_model.parameters["temperature"],
+                norm=maxwellian_model.parameters["norm"],
+            )
+            for ene in energy
+        ]
+    )
+
+    returned = maxwellian_model.se_energy_distribution(
+        energy, np.array([0.0])
+    )[col_normal].to_numpy()
+    assert_array_almost_equal(returned, expected, decimal=12)
+
+
 @pytest.mark.parametrize(
     "filepath,expected",
     [
@@ -84,3 +123,18 @@ def test_find_optimal_parameters(
         name: val.value for name, val in model.parameters.items()
     }
     assert found_parameters == approx(expected)
+
+
+@pytest.mark.parametrize("temperature", [2.0, 7.5, 15.0])
+def test_jacobian_matches_finite_differences(temperature: float) -> None:
+    """Check the analytic Jacobian against numerical derivatives."""
+    energy = np.linspace(0.0, 100.0, 201)
+    measured = np.zeros_like(energy)
+    x = np.array([temperature])
+
+    expected = approx_fprime(x, _residue, 1e-6 * temperature, energy, measured)
+    returned = _jacobian(x, energy, measured)
+    assert returned.shape == (energy.size, 1)
+    assert_allclose(
+        returned, expected, rtol=1e-4, atol=1e-6 * np.abs(expected).max()
+    )
@@ -10,7 +10,10 @@ from eemilib import teey_reference_ag
 from eemilib.emission_data.data_matrix import DataMatrix
 from eemilib.emission_data.emission_yield import EmissionYield
 from eemilib.loader.pandas_loader import PandasLoader
+from eemilib.model.model import Model
 from eemilib.model.sombrin import Sombrin
+from eemilib.util.constants import col_normal
+from numpy.testing import assert_array_almost_equal
 from pytest import approx
 
 
@@ -53,6 +56,29 @@ def test_teey_output_shape(sombrin_model: Sombrin) -> None:
     assert result.shape == (5, 2)  # 1 theta columns + 1 energy column
 
 
+def test_vectorized_teey_matches_scalar() -> None:
+    """Check that the array evaluation matches point-by-point calls."""
+    model = Sombrin(
+        parameters_values={"E_max": 300.0, "teey_max": 2.1, "E_c1": 30.0}
+    )
+    energy = np.linspace(0.0, 2000.0, 401)
+    expected = np.array(
+        [
+            model._func(
+                ene,
+                E_max=model.parameters["E_max"],
+                teey_max=model.parameters["teey_max"],
+                E_c1=model.parameters["E_c1"],
+                E_param=model.E,
+            )
+            for ene in energy
+        ]
+    )
+
+    returned = model.teey(energy, np.array([0.0]))[col_normal].to_numpy()
+    assert_array_almost_equal(returned, expected, decimal=12)
+
+
 @pytest.mark.parametrize(
     "emission_yield,expected",
     [
@@ -69,9 +95,9 @@ def test_teey_output_shape(sombrin_model: Sombrin) -> None:
                 ),
             ),
             {
-                "E_max": 550.5505505505506,
-                "teey_max": 1.525944944944945,
-                "E_c1": 95.0950950950951,
+                "E_max": 553.3333333333333,
+                "teey_max": 1.5263333333333333,
+                "E_c1": 95.12820512820514,
             },
             id="Cu 1 eroded",
         ),
@@ -88,9 +114,9 @@ def test_teey_output_shape(sombrin_model: Sombrin) -> None:
                 ),
             ),
             {
-                "E_max": 250.34034034034033,
-                "teey_max": 2.236948948948949,
-                "E_c1": 24.714714714714717,
+                "E_max": 256.8421052631578,
+                "teey_max": 2.2381118421052633,
+                "E_c1": 25.04950495049505,
             },
             marks=pytest.mark.smoke,
             id="Cu 2 as received",
@@ -108,9 +134,9 @@ def test_teey_output_shape(sombrin_model: Sombrin) -> None:
                 ),
             ),
             {
-                "E_max": 389.63963963963965,
-                "teey_max": 1.695873873873874,
-                "E_c1": 45.31531531531532,
+                "E_max": 386.08695652173907,
+                "teey_max": 1.6964402173913042,
+                "E_c1": 45.35714285714286,
             },
             id="Cu 2 heated",
         ),
@@ -130,6 +156,18 @@ def test_find_optimal_parameters(
     assert expected == approx(found_parameters)
 
 
+def test_closed_form_characteristics() -> None:
+    """Check closed form E_c1, E_c2, E_max against the numerical search."""
+    model = Sombrin(
+        parameters_values={"E_max": 300.0, "teey_max": 2.1, "E_c1": 30.0}
+    )
+    expected_crossovers = Model._teey_crossovers(model, e_high=5e3)
+    expected_maximum = Model._teey_maximum(model, e_high=5e3)
+
+    assert model._teey_crossovers() == approx(expected_crossovers, rel=1e-6)
+    assert model._teey_maximum() == approx(expected_maximum, rel=1e-6)
+
+
 @pytest.fixture
 def reference_ag() -> DataMatrix:
     """Instantiate technical Ag from :cite:`Fil2016a,Fil2020`."""
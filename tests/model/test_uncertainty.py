@@ -0,0 +1,186 @@
+"""Test the estimation and propagation of the parameters uncertainty."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+from eemilib import emission_energy_ag
+from eemilib.emission_data.data_matrix import DataMatrix
+from eemilib.emission_data.helper import find_crossings
+from eemilib.loader.pandas_loader import PandasLoader
+from eemilib.model.fitting import FIT_CACHE
+from eemilib.model.helper import split_crossovers
+from eemilib.model.maxwellian import Maxwellian
+from eemilib.model.parameter import Parameter
+from eemilib.model.uncertainty import (
+    Covariance,
+    covariance_from_least_squares,
+    curves_characteristics,
+)
+from eemilib.model.vaughan import Vaughan
+from numpy.typing import NDArray
+from pytest import approx
+from scipy.optimize import curve_fit, least_squares
+
+
+@pytest.fixture(autouse=True)
+def empty_cache() -> None:
+    """Start every test with an empty fit cache."""
+    FIT_CACHE.clear()
+
+
+@pytest.fixture
+def data_matrix() -> DataMatrix:
+    """Load a measured |SE| energy distribution."""
+    data_matrix = DataMatrix()
+    data_matrix.set_files(
+        [Path(emission_energy_ag / "corrected_cleanAg0_150eV_2018.05.30.csv")],
+        population="SE",
+        emission_data_type="Emission Energy",
+    )
+    data_matrix.load_data(PandasLoader())
+    return data_matrix
+
+
+def _parameter(is_locked: bool = False) -> Parameter:
+    """Create a parameter for a dummy fit."""
+    return Parameter(markdown="", unit="1", value=1.0, is_locked=is_locked)
+
+
+def _exponential(
+    x: NDArray[np.float64], a: float, b: float
+) -> NDArray[np.float64]:
+    """Give the dummy model."""
+    return a * np.exp(-b * x)
+
+
+def test_covariance_matches_curve_fit() -> None:
+    """Check the covariance estimate against SciPy."""
+    rng = np.random.default_rng(0)
+    x = np.linspace(0.0, 4.0, 50)
+    y = _exponential(x, 2.5, 1.3) + rng.normal(scale=0.05, size=x.size)
+
+    _, expected = curve_fit(_exponential, x, y, p0=(1.0, 1.0))
+    lsq = least_squares(
+        lambda p: _exponential(x, *p) - y, x0=(1.0, 1.0), method="lm"
+    )
+    covariance = covariance_from_least_squares(
+        lsq, {"a": _parameter(), "b": _parameter()}
+    )
+
+    assert covariance is not None
+    assert covariance.names == ("a", "b")
+    assert covariance.matrix == approx(expected, rel=1e-3)
+    assert covariance.mean == approx(lsq.x)
+
+
+def test_locked_parameters_are_excluded() -> None:
+    """Check that locked parameters have no covariance."""
+    x = np.linspace(0.0, 4.0, 50)
+    y = _exponential(x, 2.5, 1.3)
+    lsq = least_squares(lambda p: _exponential(x, *p) - y, x0=(2.5, 1.0))
+
+    covariance = covariance_from_least_squares(
+        lsq, {"a": _parameter(is_locked=True), "b": _parameter()}
+    )
+    assert covariance is not None
+    assert covariance.names == ("b",)
+
+    all_locked = {"a": _parameter(True), "b": _parameter(True)}
+    assert covariance_from_least_squares(lsq, all_locked) is None
+
+
+def test_draws_are_clipped() -> None:
+    """Check that draws stay within the given bounds."""
+    covariance = Covariance(["a"], np.array([[1.0]]), np.array([0.5]))
+    draws = covariance.draw(1000, seed=0, bounds={"a": (0.0, 1.0)})
+
+    assert draws.shape == (1000, 1)
+    assert draws.min() == 0.0 and draws.max() == 1.0
+
+
+def test_fit_stores_covariance(data_matrix: DataMatrix) -> None:
+    """Check that covariance is estimated, and restored from the cache."""
+    model = Maxwellian()
+    model.find_optimal_parameters(data_matrix)
+    assert model.covariance is not None
+    assert model.covariance.names == ("temperature",)
+    assert model.covariance.mean == approx(
+        model.parameters["temperature"].value
+    )
+    assert model.covariance.std[0] > 0.0
+
+    other = Maxwellian()
+    other.find_optimal_parameters(data_matrix)
+    assert other.covariance is model.covariance
+
+
+def test_propagation(data_matrix: DataMatrix) -> None:
+    """Check that the confidence band surrounds the fitted curve."""
+    model = Maxwellian()
+    model.find_optimal_parameters(data_matrix)
+    energy = np.linspace(0.0, 50.0, 101)
+    result = model.propagate_uncertainty(energy, n_draws=500, seed=0)
+
+    assert result.curves.shape == (500, 101, 1)
+    assert result.nominal[:, 0] == approx(
+        model.get_array("SE", "Emission Energy", energy, np.zeros(1))[2][:, 0]
+    )
+    lower, upper = result.band(0.95)
+    assert np.all(lower <= result.nominal + 1e-12)
+    assert np.all(result.nominal <= upper + 1e-12)
+    assert np.any(upper - lower > 0.0)
+    assert result.characteristics == {}
+
+
+def test_propagation_without_covariance() -> None:
+    """Check that an unfitted model cannot be propagated."""
+    with pytest.raises(ValueError):
+        Vaughan().propagate_uncertainty(np.linspace(0.0, 1e3, 11))
+
+
+def test_characteristics_intervals() -> None:
+    """Check the crossover energies of the draws against the model."""
+    model = Vaughan()
+    model.set_parameters_values({"E_max": 400.0, "teey_max": 2.0})
+    covariance = Covariance(
+        ["E_max"], np.array([[10.0**2]]), np.array([400.0])
+    )
+    result = model.propagate_uncertainty(
+        np.linspace(0.0, 5e3, 5001), n_draws=200, seed=0, covariance=covariance
+    )
+
+    expected = model.yield_characteristics()
+    for name in ("E_c1", "E_c2", "E_max", "ey_max"):
+        lower, upper = result.interval(name)
+        assert lower <= expected[name] * (1 + 1e-3)
+        assert expected[name] * (1 - 1e-3) <= upper
+    assert result.interval("E_max")[1] - result.interval("E_max")[0] > 10.0
+
+
+def test_curves_characteristics() -> None:
+    """Check crossovers and maximum of simple curves."""
+    energy = np.linspace(0.0, 10.0, 11)
+    curves = np.vstack(
+        (2.0 - np.abs(energy - 5.0) / 2.5, np.full(energy.size, 0.5))
+    )
+    out = curves_characteristics(energy, curves)
+
+    assert out["E_c1"] == approx([2.5, np.nan], nan_ok=True)
+    assert out["E_c2"] == approx([7.5, np.nan], nan_ok=True)
+    assert out["E_max"] == approx([5.0, 0.0])
+    assert out["ey_max"] == approx([2.0, 0.5])
+
+
+def test_curves_characteristics_several_crossings() -> None:
+    """Check that crossovers are split around the maximum, as in models."""
+    energy = np.arange(7.0)
+    curves = np.array([[0.5, 1.5, 0.5, 1.5, 2.0, 1.5, 0.5]])
+    out = curves_characteristics(energy, curves)
+
+    crossovers = find_crossings(energy, curves[0])
+    assert crossovers.size == 4
+    expected_c1, expected_c2 = split_crossovers(crossovers, 4.0)
+    assert out["E_c1"] == approx([expected_c1])
+    assert out["E_c1"] == approx([2.5])
+    assert out["E_c2"] == approx([expected_c2])
@@ -9,6 +9,7 @@ from eemilib import teey_reference_ag
 from eemilib.emission_data.data_matrix import DataMatrix
 from eemilib.emission_data.emission_yield import EmissionYield
 from eemilib.loader.pandas_loader import PandasLoader
+from eemilib.model.model import Model
 from eemilib.model.vaughan import Vaughan, VaughanImplementation
 from numpy.testing import assert_array_almost_equal
 from numpy.typing import NDArray
@@ -62,6 +63,20 @@ def test_teey_output_shape(vaughan_model: Vaughan) -> None:
     assert result.shape == (5, 4)  # 3 theta columns + 1 energy column
 
 
+def test_teey_as_array(vaughan_model: Vaughan) -> None:
+    """Check that raw array output matches the dataframe output."""
+    energy = np.linspace(0, 100, 5, dtype=np.float64)
+    theta = np.linspace(0, 90, 3, dtype=np.float64)
+    result = vaughan_model.teey(energy, theta, as_array=True)
+    assert isinstance(result, np.ndarray)
+    assert result.shape == (5, 3)
+    assert result.dtype == np.float64
+    assert result.flags.c_contiguous
+
+    expected = vaughan_model.teey(energy, theta).to_numpy()[:, :-1]
+    assert_array_almost_equal(result, expected)
+
+
 @pytest.mark.parametrize(
     "emission_yield,expected",
     [
@@ -82,13 +97,13 @@ def test_teey_output_shape(vaughan_model: Vaughan) -> None:
             ),
             {
                 "E_0": 12.5,
-                "E_max": 550.5505505505506,
+                "E_max": 553.3333333333333,
                 "delta_E_transition": 1.0,
                 "teey_low": 0.5,
-                "teey_max": 1.525944944944945,
+                "teey_max": 1.5263333333333333,
                 "k_s": 1.0,
                 "k_se": 1.0,
-                "E_c1": 95.0950950950951,
+                "E_c1": 95.12820512820514,
             },
             id="Cu 1 eroded",
         ),
@@ -109,13 +124,13 @@ def test_teey_output_shape(vaughan_model: Vaughan) -> None:
             ),
             {
                 "E_0": 12.5,
-                "E_max": 250.34034034034033,
+                "E_max": 256.8421052631578,
                 "delta_E_transition": 1.0,
                 "teey_low": 0.5,
-                "teey_max": 2.236948948948949,
+                "teey_max": 2.2381118421052633,
                 "k_s": 1.0,
                 "k_se": 1.0,
-                "E_c1": 24.714714714714717,
+                "E_c1": 25.04950495049505,
             },
             marks=pytest.mark.smoke,
             id="Cu 2 as received",
@@ -137,13 +152,13 @@ def test_teey_output_shape(vaughan_model: Vaughan) -> None:
             ),
             {
                 "E_0": 12.5,
-                "E_max": 389.63963963963965,
+                "E_max": 386.08695652173907,
                 "delta_E_transition": 1.0,
                 "teey_low": 0.5,
-                "teey_max": 1.695873873873874,
+                "teey_max": 1.6964402173913042,
                 "k_s": 1.0,
                 "k_se": 1.0,
-                "E_c1": 45.31531531531532,
+                "E_c1": 45.35714285714286,
             },
             id="Cu 2 heated",
         ),
@@ -258,6 +273,67 @@ def test_implementations(
     assert_array_almost_equal(calculated, expected, decimal=3)
 
 
+@pytest.mark.parametrize(
+    "vaughan_implementation", ["original", "CST", "SPARK3D"]
+)
+def test_vectorized_teey_matches_scalar(
+    vaughan_implementation: VaughanImplementation,
+) -> None:
+    """Check that the (energy, angle) grid matches point-by-point calls."""
+    model = Vaughan(
+        implementation=vaughan_implementation,
+        parameters_values={
+            "E_max": 300.0,
+            "teey_max": 2.1,
+            "E_c1": 30.0,
+            "k_s": 1.0,
+            "k_se": 1.0,
+        },
+    )
+    energy = np.linspace(0.0, 2000.0, 401)
+    theta = np.linspace(0.0, 80.0, 5)
+    expected = np.array(
+        [
+            [model._func(ene, the, **model.parameters) for the in theta]
+            for ene in energy
+        ]
+    )
+
+    returned = model.teey(energy, theta).to_numpy()[:, :-1]
+    assert_array_almost_equal(returned, expected, decimal=12)
+
+
+@pytest.mark.parametrize(
+    "vaughan_implementation", ["original", "CST", "SPARK3D"]
+)
+@pytest.mark.parametrize(
+    "vaughan_parameters",
+    [
+        pytest.param(
+            {"E_max": 300.0, "teey_max": 2.1, "E_c1": 30.0}, id="Generic"
+        ),
+        pytest.param(
+            {"E_max": 150.0, "teey_max": 1.3, "E_c1": 50.0, "E_0": 0.0},
+            id="Third regime E_c2",
+        ),
+    ],
+)
+def test_closed_form_characteristics(
+    vaughan_implementation: VaughanImplementation,
+    vaughan_parameters: dict[str, float],
+) -> None:
+    """Check closed form E_c1, E_c2, E_max against the numerical search."""
+    model = Vaughan(
+        implementation=vaughan_implementation,
+        parameters_values=vaughan_parameters,
+    )
+    expected_crossovers = Model._teey_crossovers(model, e_high=5e3)
+    expected_maximum = Model._teey_maximum(model, e_high=5e3)
+
+    assert model._teey_crossovers() == approx(expected_crossovers, rel=1e-6)
+    assert model._teey_maximum() == approx(expected_maximum, rel=1e-6)
+
+
 @pytest.fixture
 def reference_ag() -> DataMatrix:
     """Instantiate technical Ag from :cite:`Fil2016a,Fil2020`."""
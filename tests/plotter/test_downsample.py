@@ -0,0 +1,125 @@
+"""Test the decimation of dense curves."""
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+from eemilib.plotter.downsample import (
+    Downsampler,
+    downsample_indexes,
+    lttb_indexes,
+    minmax_indexes,
+)
+from eemilib.plotter.pandas import PandasPlotter
+from eemilib.util.constants import col_energy
+
+
+@pytest.fixture(autouse=True)
+def close_figures():
+    """Close the figures created by every test."""
+    yield
+    plt.close("all")
+
+
+@pytest.fixture
+def curve() -> tuple[np.ndarray, np.ndarray]:
+    """Create a dense and noisy curve."""
+    x = np.linspace(0.0, 1000.0, 100_001)
+    rng = np.random.default_rng(0)
+    y = np.sin(x / 100.0) + rng.normal(scale=0.1, size=x.size)
+    return x, y
+
+
+def test_minmax_keeps_extrema(curve: tuple[np.ndarray, np.ndarray]) -> None:
+    """Check that the envelope of every bucket is preserved."""
+    x, y = curve
+    indexes = minmax_indexes(x, y, 100)
+
+    assert np.all(np.diff(indexes) > 0)
+    assert indexes.size <= 2 * 100 + 2
+    assert indexes[0] == 0 and indexes[-1] == x.size - 1
+    assert y[indexes].max() == y.max()
+    assert y[indexes].min() == y.min()
+    first_bucket = x < 10.0
+    assert y[indexes][x[indexes] < 10.0].max() == y[first_bucket].max()
+
+
+def test_lttb(curve: tuple[np.ndarray, np.ndarray]) -> None:
+    """Check the number and order of points kept by LTTB."""
+    x, y = curve
+    indexes = lttb_indexes(x, y, 500)
+
+    assert indexes.size == 500
+    assert np.all(np.diff(indexes) > 0)
+    assert indexes[0] == 0 and indexes[-1] == x.size - 1
+
+
+def test_small_and_non_finite() -> None:
+    """Check that short curves are kept, without the non-finite points."""
+    x = np.linspace(0.0, 1.0, 11)
+    y = x.copy()
+    y[3] = np.nan
+
+    expected = np.delete(np.arange(11), 3)
+    np.testing.assert_array_equal(minmax_indexes(x, y, 100), expected)
+    np.testing.assert_array_equal(lttb_indexes(x, y, 100), expected)
+
+
+def test_visible_range(curve: tuple[np.ndarray, np.ndarray]) -> None:
+    """Check that points outside of the visible range are discarded."""
+    x, y = curve
+    indexes = downsample_indexes(x, (y, -y), 50, x_range=(200.0, 300.0))
+
+    assert x[indexes[0]] < 200.0 <= x[indexes[1]]
+    assert x[indexes[-2]] <= 300.0 < x[indexes[-1]]
+    visible = (x >= 200.0) & (x <= 300.0)
+    assert y[indexes].max() >= y[visible].max()
+
+
+def test_redecimate_on_zoom(curve: tuple[np.ndarray, np.ndarray]) -> None:
+    """Check that zooming shows more details of the zoomed range."""
+    x, y = curve
+    _, axes = plt.subplots()
+    (line,) = axes.plot([], [])
+    downsampler = Downsampler()
+    downsampler.set_data(line, x, y)
+    n_points = len(line.get_xdata())
+    assert n_points < x.size // 10
+
+    axes.set_xlim(100.0, 110.0)
+    zoomed = np.asarray(line.get_xdata())
+    assert zoomed.min() < 100.0 and zoomed.max() > 110.0
+    assert np.sum((zoomed >= 100.0) & (zoomed <= 110.0)) > 0.5 * n_points
+    assert downsampler.full_data(line)[0] is not None
+
+
+def test_update_keeps_zoom(curve: tuple[np.ndarray, np.ndarray]) -> None:
+    """Check that new data is decimated within the zoomed range."""
+    x, y = curve
+    _, axes = plt.subplots()
+    (line,) = axes.plot([], [])
+    downsampler = Downsampler()
+    downsampler.set_data(line, x, y)
+    axes.set_xlim(100.0, 110.0)
+    zoomed = np.asarray(line.get_xdata())
+    n_zoomed = np.sum((zoomed >= 100.0) & (zoomed <= 110.0))
+
+    downsampler.set_data(line, x, 2.0 * y)
+    updated = np.asarray(line.get_xdata())
+    assert np.sum((updated >= 100.0) & (updated <= 110.0)) == n_zoomed
+
+
+@pytest.mark.parametrize("incremental", (False, True))
+def test_plotter(
+    curve: tuple[np.ndarray, np.ndarray], incremental: bool
+) -> None:
+    """Check that the plotter gives decimated data to matplotlib."""
+    x, y = curve
+    df = pd.DataFrame({col_energy: x, "0.0": y, "60.0": 0.5 * y})
+    plotter = PandasPlotter(incremental=incremental, downsample=True)
+    axes = plotter.plot_emission_yield(df, population="all")
+
+    assert len(axes.lines) == 2
+    for line, expected in zip(axes.lines, (y, 0.5 * y)):
+        assert len(line.get_ydata()) < x.size // 10
+        assert np.max(line.get_ydata()) == expected.max()
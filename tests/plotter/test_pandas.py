@@ -0,0 +1,79 @@
+"""Test the incremental mode of :class:`.PandasPlotter`."""
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+from eemilib.plotter.pandas import PandasPlotter
+from eemilib.util.constants import col_energy
+from matplotlib.axes import Axes
+
+
+@pytest.fixture(autouse=True)
+def close_figures():
+    """Close the figures created by every test."""
+    yield
+    plt.close("all")
+
+
+def _teey(scale: float, angles: tuple[str, ...] = ("0.0", "60.0")):
+    """Create a modelled |TEEY| dataframe."""
+    energy = np.linspace(0.0, 1000.0, 51)
+    data = {col_energy: energy}
+    for i, angle in enumerate(angles):
+        data[angle] = scale * (1.0 + i) * np.sin(energy / 1000.0 * np.pi)
+    return pd.DataFrame(data)
+
+
+def test_lines_are_updated() -> None:
+    """Check that a second plot updates the lines of the first one."""
+    plotter = PandasPlotter(incremental=True)
+    axes = plotter.plot_emission_yield(_teey(1.0), population="all")
+    lines = dict(plotter.lines)
+    assert len(axes.lines) == 2
+
+    same_axes = plotter.plot_emission_yield(
+        _teey(0.5), axes=axes, population="all"
+    )
+    assert same_axes is axes
+    assert len(axes.lines) == 2
+    assert plotter.lines == lines
+    line = lines["all", "Emission Yield", "60.0"]
+    assert np.max(line.get_ydata()) == pytest.approx(1.0, rel=1e-2)
+
+
+def test_rescale_and_stale_lines() -> None:
+    """Check that limits follow data, and that old angles are removed."""
+    plotter = PandasPlotter(incremental=True)
+    axes = plotter.plot_emission_yield(_teey(1.0), population="all")
+    plotter.plot_emission_yield(
+        _teey(10.0, angles=("0.0",)), axes=axes, population="all"
+    )
+
+    assert list(plotter.lines) == [("all", "Emission Yield", "0.0")]
+    assert len(axes.lines) == 1
+    assert axes.get_ylim()[1] >= 10.0
+
+
+def test_new_axes() -> None:
+    """Check that lines are created again on new axes."""
+    plotter = PandasPlotter(incremental=True)
+    first = plotter.plot_emission_yield(_teey(1.0), population="all")
+    _, second = plt.subplots()
+    plotter.plot_emission_yield(_teey(1.0), axes=second, population="all")
+
+    assert isinstance(second, Axes)
+    assert len(first.lines) == len(second.lines) == 2
+    assert all(line in second.lines for line in plotter.lines.values())
+
+
+@pytest.mark.parametrize("extension", ["pdf", "svg"])
+def test_save_incremental_plot(tmp_path, extension: str) -> None:
+    """Check that a figure with blitted lines can be saved to vector files."""
+    plotter = PandasPlotter(incremental=True)
+    axes = plotter.plot_emission_yield(_teey(1.0), population="all")
+    plotter.plot_emission_yield(_teey(0.5), axes=axes, population="all")
+
+    path = tmp_path / f"incremental.{extension}"
+    axes.figure.savefig(path)
+    assert path.stat().st_size > 0
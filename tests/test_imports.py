@@ -0,0 +1,84 @@
+"""Check that importing EEmiLib does not import more than necessary.
+
+Every check runs in a fresh interpreter, so that modules imported by other
+tests do not interfere.
+
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+#: Maximum time to import a single model, in seconds.
+IMPORT_TIME_BUDGET = 1.0
+
+
+def _run(code: str) -> dict:
+    """Execute ``code`` in a new interpreter, return its JSON output."""
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+    return json.loads(output.splitlines()[-1])
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "eemilib",
+        "eemilib.model.vaughan",
+        "eemilib.model.sombrin",
+        "eemilib.loader.pandas_loader",
+    ],
+)
+def test_no_heavy_imports(module: str) -> None:
+    """Check that SciPy, matplotlib, Qt and sibling models are not loaded."""
+    loaded = _run(
+        f"import json, sys, {module}\n"
+        "print(json.dumps(sorted(sys.modules)))"
+    )
+    forbidden = (
+        "scipy.optimize",
+        "matplotlib",
+        "PyQt5",
+        "eemilib.plotter.pandas",
+        "eemilib.model.dionne",
+        "eemilib.model.chung_and_everhart",
+    )
+    assert not [name for name in forbidden if name in loaded]
+
+
+def test_logging_is_opt_in(tmp_path) -> None:
+    """Check that importing does not configure logging nor write a file."""
+    returned = _run(
+        f"import json, logging, os; os.chdir({str(tmp_path)!r})\n"
+        "import eemilib.model.vaughan\n"
+        "print(json.dumps({'handlers': len(logging.root.handlers), "
+        "'files': os.listdir()}))"
+    )
+    assert returned == {"handlers": 0, "files": []}
+
+
+def test_lazy_attributes() -> None:
+    """Check that public names are still reachable from packages."""
+    returned = _run(
+        "import json\n"
+        "from eemilib import teey_cu, __version__\n"
+        "from eemilib.model import Vaughan\n"
+        "from eemilib.loader import PandasLoader\n"
+        "import eemilib.model\n"
+        "print(json.dumps([Vaughan.__name__, PandasLoader.__name__, "
+        "'Dionne' in dir(eemilib.model), teey_cu.is_dir()]))"
+    )
+    assert returned == ["Vaughan", "PandasLoader", True, True]
+
+
+@pytest.mark.slow
+def test_import_time() -> None:
+    """Check that importing a model in a worker process is fast."""
+    returned = _run(
+        "import json, time\n"
+        "start = time.perf_counter()\n"
+        "import eemilib.model.vaughan\n"
+        "print(json.dumps(time.perf_counter() - start))"
+    )
+    assert returned < IMPORT_TIME_BUDGET
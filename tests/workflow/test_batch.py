@@ -0,0 +1,66 @@
+"""Test the batch fitting of several samples."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+from eemilib import teey_cu
+from eemilib.emission_data.data_matrix import DataMatrix
+from eemilib.loader.pandas_loader import PandasLoader
+from eemilib.model.sombrin import Sombrin
+from eemilib.workflow.batch import fit_batch
+from pytest import approx
+
+FILENAMES = (
+    "measured_TEEY_Cu_1_eroded.csv",
+    "measured_TEEY_Cu_2_as-received.csv",
+    "measured_TEEY_Cu_2_heated.csv",
+)
+
+
+@pytest.fixture
+def filepaths() -> list[Path]:
+    """Give the paths to some copper |TEEY| files."""
+    return [Path(str(teey_cu / filename)) for filename in FILENAMES]
+
+
+def _fit_one(filepath: Path) -> dict[str, float]:
+    """Fit a single file, the usual way."""
+    data_matrix = DataMatrix()
+    data_matrix.set_files(
+        [filepath], population="all", emission_data_type="Emission Yield"
+    )
+    data_matrix.load_data(PandasLoader())
+    model = Sombrin()
+    model.find_optimal_parameters(data_matrix)
+    return {name: param.value for name, param in model.parameters.items()}
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_fit_batch_matches_sequential(
+    filepaths: list[Path], max_workers: int
+) -> None:
+    """Check that batch results are ordered and match individual fits."""
+    results = fit_batch(filepaths, Sombrin, max_workers=max_workers)
+
+    assert list(results["sample"]) == [path.stem for path in filepaths]
+    assert (results["status"] == "ok").all()
+    for (_, row), filepath in zip(results.iterrows(), filepaths):
+        expected = _fit_one(filepath)
+        assert {name: row[name] for name in expected} == approx(expected)
+
+
+def test_fit_batch_error_capture(filepaths: list[Path], tmp_path) -> None:
+    """Check that a faulty sample does not stop the batch."""
+    samples = {
+        "good": filepaths[0],
+        "missing": tmp_path / "does_not_exist.csv",
+        "empty": DataMatrix(),
+    }
+    results = fit_batch(samples, Sombrin, max_workers=2)
+
+    assert list(results["sample"]) == list(samples)
+    assert list(results["status"]) == ["ok", "error", "error"]
+    assert results["error"].iloc[0] is None
+    assert isinstance(results["error"].iloc[1], str)
+    assert np.isnan(results["E_max"].iloc[2])
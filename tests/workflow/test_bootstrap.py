@@ -0,0 +1,123 @@
+"""Test the bootstrap refitting of measurements."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+from eemilib import emission_energy_ag, teey_cu
+from eemilib.emission_data.data_matrix import DataMatrix
+from eemilib.loader.pandas_loader import PandasLoader
+from eemilib.model.maxwellian import Maxwellian
+from eemilib.model.sombrin import Sombrin
+from eemilib.util.constants import col_energy
+from eemilib.workflow.bootstrap import (
+    MEASURED,
+    PARAMETERS,
+    bootstrap,
+    resample,
+)
+from pytest import approx
+
+
+@pytest.fixture
+def teey_data_matrix() -> DataMatrix:
+    """Load a measured copper |TEEY|."""
+    data_matrix = DataMatrix()
+    data_matrix.set_files(
+        [Path(teey_cu / "measured_TEEY_Cu_1_eroded.csv")],
+        population="all",
+        emission_data_type="Emission Yield",
+    )
+    data_matrix.load_data(PandasLoader())
+    return data_matrix
+
+
+@pytest.fixture
+def distribution_data_matrix() -> DataMatrix:
+    """Load a measured |SE| energy distribution."""
+    data_matrix = DataMatrix()
+    data_matrix.set_files(
+        [Path(emission_energy_ag / "corrected_cleanAg0_150eV_2018.05.30.csv")],
+        population="SE",
+        emission_data_type="Emission Energy",
+    )
+    data_matrix.load_data(PandasLoader())
+    return data_matrix
+
+
+def test_resample(teey_data_matrix: DataMatrix) -> None:
+    """Check that resampled points are sorted, with repeated draws."""
+    teey = teey_data_matrix.teey
+    resampled = resample(teey, np.random.default_rng(0))
+    energies = resampled.data[col_energy].to_numpy()
+
+    assert np.all(np.diff(energies) >= 0.0)
+    assert set(energies) <= set(teey.data[col_energy])
+    assert len(energies) == len(teey.data)
+    assert len(np.unique(energies)) < len(energies)
+    assert np.isfinite(resampled.e_max)
+    assert np.isfinite(resampled.e_c1)
+
+
+def test_summary(teey_data_matrix: DataMatrix) -> None:
+    """Check the intervals of measured characteristics and parameters."""
+    result = bootstrap(
+        teey_data_matrix, Sombrin, n_resamples=50, seed=0, max_workers=1
+    )
+    teey = teey_data_matrix.teey
+
+    assert len(result) == 50
+    assert result.n_failed == 0
+    assert result.nominal[MEASURED, "E_max"] == approx(teey.e_max)
+    assert result.nominal[MEASURED, "ey_max"] == approx(teey.ey_max)
+
+    summary = result.summary(confidence=0.9)
+    assert summary.loc[(MEASURED, "E_c1"), "n_valid"] == 50
+    for group, name in ((MEASURED, "E_c1"), (PARAMETERS, "E_max")):
+        lower, upper = result.interval(name, group, confidence=0.9)
+        assert lower <= result.nominal[group, name] <= upper
+        assert summary.loc[(group, name), "lower"] == approx(lower)
+        assert summary.loc[(group, name), "upper"] == approx(upper)
+    assert summary.loc[(PARAMETERS, "E_max"), "std"] > 0.0
+
+
+def test_does_not_depend_on_workers(teey_data_matrix: DataMatrix) -> None:
+    """Check that results only depend on the seed."""
+    sequential = bootstrap(
+        teey_data_matrix, Sombrin, n_resamples=12, seed=1, max_workers=1
+    )
+    parallel = bootstrap(
+        teey_data_matrix,
+        Sombrin,
+        n_resamples=12,
+        seed=1,
+        max_workers=2,
+        chunksize=5,
+    )
+
+    np.testing.assert_allclose(
+        parallel.resamples.to_numpy(), sequential.resamples.to_numpy()
+    )
+
+
+def test_fitted_model(distribution_data_matrix: DataMatrix) -> None:
+    """Check bootstrap of a model fitted with least squares."""
+    result = bootstrap(
+        distribution_data_matrix,
+        Maxwellian,
+        n_resamples=20,
+        population="SE",
+        emission_data_type="Emission Energy",
+        seed=0,
+        max_workers=1,
+    )
+
+    assert MEASURED not in result.resamples.columns.get_level_values(0)
+    lower, upper = result.interval("temperature")
+    assert lower < result.nominal[PARAMETERS, "temperature"] < upper
+
+
+def test_missing_data(teey_data_matrix: DataMatrix) -> None:
+    """Check that absent data is reported."""
+    with pytest.raises(ValueError):
+        bootstrap(teey_data_matrix, Sombrin, population="SE", max_workers=1)
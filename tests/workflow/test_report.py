@@ -0,0 +1,122 @@
+"""Test the headless rendering of reports."""
+
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+import pandas as pd
+import pytest
+from eemilib import emission_energy_ag, teey_cu
+from eemilib.emission_data.data_matrix import DataMatrix
+from eemilib.loader.pandas_loader import PandasLoader
+from eemilib.model.sombrin import Sombrin
+from eemilib.workflow import report as report_module
+from eemilib.workflow.batch import fit_batch
+from eemilib.workflow.report import (
+    EVALUATIONS_FILENAME,
+    main,
+    render_reports,
+    samples_from_directory,
+)
+from pytest import approx
+
+
+@pytest.fixture
+def samples() -> dict[str, Path]:
+    """Give some copper |TEEY| files."""
+    directory = Path(str(teey_cu / "measured_TEEY_Cu_1_eroded.csv")).parent
+    samples = samples_from_directory(directory, "measured_*.csv")
+    assert len(samples) >= 2
+    return dict(list(samples.items())[:3])
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_render_reports(
+    samples: dict[str, Path], tmp_path: Path, max_workers: int
+) -> None:
+    """Check figures, and that evaluations match the batch fit."""
+    table = render_reports(
+        samples,
+        Sombrin,
+        tmp_path,
+        formats=("png", "pdf"),
+        max_workers=max_workers,
+    )
+
+    assert list(table["sample"]) == list(samples)
+    assert (table["status"] == "ok").all()
+    for label in samples:
+        for extension in ("png", "pdf"):
+            assert (tmp_path / f"{label}.{extension}").stat().st_size > 0
+
+    expected = fit_batch(samples, Sombrin, max_workers=1)
+    numeric = expected.select_dtypes("number").columns
+    assert table[numeric].to_numpy() == approx(
+        expected[numeric].to_numpy(), nan_ok=True
+    )
+    saved = pd.read_csv(tmp_path / EVALUATIONS_FILENAME)
+    assert list(saved["sample"]) == list(samples)
+
+
+def test_one_panel_per_data(tmp_path: Path) -> None:
+    """Check that energy distributions are plotted next to the |TEEY|."""
+    data_matrix = DataMatrix()
+    data_matrix.set_files(
+        [Path(teey_cu / "measured_TEEY_Cu_1_eroded.csv")],
+        population="all",
+        emission_data_type="Emission Yield",
+    )
+    data_matrix.set_files(
+        [Path(emission_energy_ag / "corrected_cleanAg0_150eV_2018.05.30.csv")],
+        population="SE",
+        emission_data_type="Emission Energy",
+    )
+    data_matrix.load_data(PandasLoader())
+    table = render_reports(
+        {"sample": data_matrix},
+        Sombrin,
+        tmp_path,
+        figsize=(4.0, 3.0),
+        dpi=50.0,
+        max_workers=1,
+    )
+
+    assert (table["status"] == "ok").all()
+    height, width, _ = plt.imread(tmp_path / "sample.png").shape
+    assert (width, height) == (400, 150)
+
+
+def test_error_capture(samples: dict[str, Path], tmp_path: Path) -> None:
+    """Check that a faulty sample does not stop the reports."""
+    faulty = {"missing": tmp_path / "missing.csv"} | samples
+    table = render_reports(faulty, Sombrin, tmp_path, max_workers=1)
+
+    assert list(table["status"])[:2] == ["error", "ok"]
+    assert not (tmp_path / "missing.png").exists()
+
+
+def test_cli(
+    samples: dict[str, Path],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Check the command line interface."""
+    directory = tmp_path / "campaign"
+    directory.mkdir()
+    for label, filepath in samples.items():
+        (directory / f"{label}.csv").write_bytes(filepath.read_bytes())
+    monkeypatch.chdir(tmp_path)
+    logging_calls = []
+    monkeypatch.setattr(
+        report_module,
+        "set_up_logging",
+        lambda *args, **kwargs: logging_calls.append(kwargs),
+    )
+
+    main([str(directory), "--model", "Sombrin", "--workers", "1"])
+
+    report = directory / "report"
+    assert logging_calls == [{"logfile_file": report / "eemilib.log"}]
+    assert sorted(path.stem for path in report.glob("*.png")) == sorted(
+        samples
+    )
+    assert (report / EVALUATIONS_FILENAME).exists()
@@ -0,0 +1,157 @@
+"""Test the parameter sweeps."""
+
+import numpy as np
+import pytest
+from eemilib.emission_data.data_matrix import DataMatrix
+from eemilib.model.dionne import Dionne
+from eemilib.model.maxwellian import Maxwellian
+from eemilib.model.sombrin import Sombrin
+from eemilib.model.vaughan import Vaughan
+from eemilib.workflow.sweep import sweep
+from pytest import approx
+
+RANGES = {
+    "E_max": np.linspace(200.0, 600.0, 5),
+    "teey_max": np.linspace(1.5, 3.0, 4),
+}
+SOMBRIN_RANGES = {
+    "E_max": np.linspace(200.0, 600.0, 5),
+    "teey_max": np.linspace(1.5, 3.0, 4),
+}
+
+
+@pytest.fixture
+def sombrin() -> Sombrin:
+    """Give a Sombrin model with physical parameters."""
+    return Sombrin(
+        parameters_values={"teey_max": 2.0, "E_max": 300.0, "E_c1": 50.0}
+    )
+
+
+def test_grid_shape(sombrin: Sombrin) -> None:
+    """Check that grid samplings can be reshaped for heatmaps."""
+    result = sweep(sombrin, SOMBRIN_RANGES)
+
+    assert len(result) == 20
+    assert result.grid("ey_max").shape == (5, 4)
+    expected = SOMBRIN_RANGES["teey_max"]
+    assert result.grid("ey_max")[0, :] == approx(expected, rel=1e-3)
+    assert list(result.to_dataframe()["parameters"]) == list(SOMBRIN_RANGES)
+
+
+def test_lhs_within_bounds(sombrin: Sombrin) -> None:
+    """Check that Latin hypercube samples stay in the given ranges."""
+    result = sweep(sombrin, SOMBRIN_RANGES, "lhs", n_samples=16, seed=0)
+
+    assert result.samples.shape == (16, 2)
+    assert np.all(result.samples[:, 0] >= 200.0)
+    assert np.all(result.samples[:, 0] <= 600.0)
+    assert np.all(result.samples[:, 1] >= 1.5)
+    assert np.all(result.samples[:, 1] <= 3.0)
+    with pytest.raises(ValueError):
+        result.grid("E_max")
+
+
+def test_metrics_match_model() -> None:
+    """Check a sample against a model with the same parameter values."""
+    model = Vaughan()
+    ranges = {"E_max": [300.0, 400.0], "k_s": [0.5, 1.5]}
+    result = sweep(model, ranges)
+
+    model.set_parameters_values({"E_max": 400.0, "k_s": 0.5})
+    expected = model.yield_characteristics()
+    row = result.to_dataframe().iloc[2]
+    assert row["parameters", "E_max"] == 400.0
+    assert row["parameters", "k_s"] == 0.5
+    for name, value in expected.items():
+        assert result[name][2] == approx(value, nan_ok=True)
+
+
+def test_model_is_not_modified(sombrin: Sombrin) -> None:
+    """Check that the swept model keeps its parameter values."""
+    before = sombrin.kernel_parameters_vector()
+    sweep(sombrin, SOMBRIN_RANGES, energy=np.linspace(0.0, 1e3, 11))
+
+    assert sombrin.kernel_parameters_vector() == approx(before)
+
+
+def test_invalid_samples_are_nan(sombrin: Sombrin) -> None:
+    """Check that samples without crossovers do not stop the sweep."""
+    energy = np.linspace(0.0, 1e3, 11)
+    result = sweep(sombrin, {"teey_max": [0.5, 2.0]}, energy=energy)
+
+    assert np.isnan(result["E_c1"][0]) and np.isnan(result["E_c2"][0])
+    assert not np.any(np.isnan(result.metrics[1]))
+    assert result.curves is not None
+    assert np.all(np.isnan(result.curves[0]))
+    assert result.curves.shape == (2, 11, 1)
+
+
+def test_curves_match_get_array() -> None:
+    """Check that vectorized curves match a model evaluation."""
+    model = Vaughan()
+    energy = np.linspace(0.0, 1e3, 51)
+    theta = np.array([0.0, 30.0, 60.0])
+    result = sweep(model, RANGES, energy=energy, theta=theta)
+
+    assert result.curves is not None
+    assert result.curves.shape == (20, 51, 3)
+    for i in (0, 7, 19):
+        model.set_parameters_values(dict(zip(RANGES, result.samples[i])))
+        out = model.get_array("all", "Emission Yield", energy, theta)
+        assert out is not None
+        assert result.curves[i] == approx(out[2])
+
+
+def test_unknown_parameter(sombrin: Sombrin) -> None:
+    """Check that a wrong parameter name is reported."""
+    with pytest.raises(ValueError):
+        sweep(sombrin, {"not_a_parameter": [1.0, 2.0]})
+
+
+def test_other_population() -> None:
+    """Check that the characteristics of another population are computed."""
+    model = Dionne()
+    result = sweep(
+        model, {"escape_probability": [0.2, 0.8]}, population="SE", e_high=2e3
+    )
+
+    model.set_parameters_values({"escape_probability": 0.8})
+    expected = model.yield_characteristics("SE", e_high=2e3)
+    assert result["ey_max"][1] == approx(expected["ey_max"])
+    assert result["ey_max"][0] < result["ey_max"][1]
+
+
+@pytest.mark.parametrize("max_workers", [2])
+def test_process_pool_matches_sequential(
+    sombrin: Sombrin, max_workers: int
+) -> None:
+    """Check that parallel and sequential sweeps give the same metrics."""
+    sequential = sweep(sombrin, SOMBRIN_RANGES)
+    parallel = sweep(
+        sombrin, SOMBRIN_RANGES, max_workers=max_workers, chunksize=3
+    )
+
+    assert parallel.metric_names == sequential.metric_names
+    np.testing.assert_allclose(parallel.metrics, sequential.metrics)
+
+
+def test_derived_parameters_in_metrics(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Check that metrics use the norm matching the swept temperature."""
+
+    def evaluate(self: Maxwellian, *args, **kwargs) -> dict[str, float]:
+        return {"norm": self.parameters["norm"].value}
+
+    monkeypatch.setattr(Maxwellian, "evaluate", evaluate)
+    model = Maxwellian()
+    temperatures = [1.0, 5.0]
+    result = sweep(
+        model, {"temperature": temperatures}, data_matrix=DataMatrix()
+    )
+
+    for i, temperature in enumerate(temperatures):
+        values = {"temperature": temperature}
+        expected = model._derived_parameters_values(values)["norm"]
+        assert result["norm"][i] == approx(expected)